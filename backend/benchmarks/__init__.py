@@ -0,0 +1,7 @@
+"""
+🦁 ATHLYNX AI - Benchmarks Module
+Load scripts run by hand against a development database
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+"""
@@ -0,0 +1,105 @@
+"""
+🦁 ATHLYNX AI - Password Hashing Benchmark
+Login verification throughput through PasswordService
+
+Verifies ``--logins`` passwords against one bcrypt hash with
+``--concurrency`` logins in flight, once per worker count from 1 up to
+``--workers``, and reports logins/s, logins/s per worker thread and
+latency. A probe task ticks on the event loop throughout and its worst
+delay is reported, which shows whether the loop stayed responsive.
+``--inline`` also runs the verifications directly on the event loop for
+comparison.
+
+No database is needed. Run from ``backend/``:
+
+    python -m benchmarks.password_hashing --logins 200 --rounds 12
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+@version 1.0
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from services.password_service import PasswordService
+
+PASSWORD = "correct horse battery staple"
+
+async def _probe(stop: asyncio.Event, worst: list):
+    """Track the longest time the event loop took to run a 1ms tick"""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(0.001)
+        worst[0] = max(worst[0], time.perf_counter() - started - 0.001)
+
+async def run_case(service: PasswordService, password_hash: str, logins: int, concurrency: int, inline: bool) -> dict:
+    gate = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one():
+        async with gate:
+            started = time.perf_counter()
+            if inline:
+                valid = service.context.verify(PASSWORD, password_hash)
+            else:
+                valid, _ = await service.verify(PASSWORD, password_hash)
+            assert valid
+            latencies.append(time.perf_counter() - started)
+
+    stop, worst = asyncio.Event(), [0.0]
+    probe = asyncio.get_running_loop().create_task(_probe(stop, worst))
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await probe
+
+    latencies.sort()
+    pct = lambda p: latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+    return {
+        "throughput": logins / elapsed,
+        "p50": pct(0.50),
+        "p99": pct(0.99),
+        "loop_stall": worst[0] * 1000
+    }
+
+async def run(logins: int, concurrency: int, rounds: int, max_workers: int, inline: bool):
+    print(f"🦁 Password hashing benchmark (bcrypt cost {rounds}, {os.cpu_count()} CPUs)")
+    print(f"   {'mode':<12}{'logins/s':>10}{'per worker':>12}{'p50 ms':>10}{'p99 ms':>10}{'loop stall ms':>15}")
+
+    workers = 1
+    while True:
+        service = PasswordService(rounds=rounds, workers=workers, queue_max=logins)
+        password_hash = await service.hash(PASSWORD)
+        result = await run_case(service, password_hash, logins, concurrency, inline=False)
+        service.stop()
+        print(f"   {f'{workers} workers':<12}{result['throughput']:>10.1f}{result['throughput'] / workers:>12.1f}"
+              f"{result['p50']:>10.1f}{result['p99']:>10.1f}{result['loop_stall']:>15.1f}")
+        if workers >= max_workers:
+            break
+        workers = min(workers * 2, max_workers)
+
+    if inline:
+        service = PasswordService(rounds=rounds, workers=1)
+        password_hash = await service.hash(PASSWORD)
+        result = await run_case(service, password_hash, logins, concurrency, inline=True)
+        service.stop()
+        print(f"   {'inline':<12}{result['throughput']:>10.1f}{result['throughput']:>12.1f}"
+              f"{result['p50']:>10.1f}{result['p99']:>10.1f}{result['loop_stall']:>15.1f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="bcrypt login throughput benchmark")
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=64, help="logins in flight at once")
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt cost factor")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2, help="largest thread pool to try")
+    parser.add_argument("--inline", action="store_true", help="also verify directly on the event loop")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.logins, args.concurrency, args.rounds, args.workers, args.inline))
+
+if __name__ == "__main__":
+    main()
@@ -7,17 +7,45 @@ Database Models and Schema
 """
 
 from .database import (
+    db_pool,
+    DatabasePool,
     get_db_connection,
     init_database,
     check_database_connection,
     DATABASE_URL,
     SCHEMA
 )
+from .async_database import (
+    async_db_pool,
+    AsyncDatabasePool,
+    record_to_dict,
+    records_to_dicts
+)
+from .migrations import (
+    MIGRATIONS,
+    Migration,
+    SCHEMA_FINGERPRINT,
+    run_migrations,
+    ensure_schema,
+    get_schema_version
+)
 
 __all__ = [
+    'db_pool',
+    'DatabasePool',
     'get_db_connection',
     'init_database',
     'check_database_connection',
     'DATABASE_URL',
-    'SCHEMA'
+    'SCHEMA',
+    'async_db_pool',
+    'AsyncDatabasePool',
+    'record_to_dict',
+    'records_to_dicts',
+    'MIGRATIONS',
+    'Migration',
+    'SCHEMA_FINGERPRINT',
+    'run_migrations',
+    'ensure_schema',
+    'get_schema_version'
 ]
@@ -0,0 +1,173 @@
+"""
+🦁 ATHLYNX AI - Async Database Pool
+Native asyncpg access path for the API routers
+
+Handlers await queries on this pool instead of calling blocking psycopg2
+code on the event loop. Rows come back as plain dicts, ready to be
+returned from a route.
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+@version 1.0
+"""
+
+import asyncpg
+from contextlib import asynccontextmanager
+from typing import Any, List, Optional
+import asyncio
+import json
+import os
+import logging
+
+from .database import (
+    USE_NEON,
+    NEON_DATABASE_URL,
+    DATABASE_URL,
+    PLANETSCALE_HOST,
+    PLANETSCALE_PORT,
+    PLANETSCALE_USER,
+    PLANETSCALE_PASSWORD,
+    PLANETSCALE_DB
+)
+
+logger = logging.getLogger(__name__)
+
+# Async pool configuration (per worker process)
+ASYNC_DB_POOL_MIN_SIZE = int(os.getenv("ASYNC_DB_POOL_MIN_SIZE", "2"))
+ASYNC_DB_POOL_MAX_SIZE = int(os.getenv("ASYNC_DB_POOL_MAX_SIZE", "10"))
+ASYNC_DB_COMMAND_TIMEOUT = float(os.getenv("ASYNC_DB_COMMAND_TIMEOUT", "30"))
+ASYNC_DB_MAX_INACTIVE_LIFETIME = float(os.getenv("ASYNC_DB_MAX_INACTIVE_LIFETIME", "300"))
+# Neon's pooler runs PgBouncer in transaction mode, which cannot keep
+# server-side prepared statements - leave the cache off unless connecting directly.
+ASYNC_DB_STATEMENT_CACHE_SIZE = int(os.getenv("ASYNC_DB_STATEMENT_CACHE_SIZE", "0"))
+
+def _connect_kwargs() -> dict:
+    """Connection target - Priority: NEON → DATABASE_URL → PlanetScale"""
+    if USE_NEON and NEON_DATABASE_URL:
+        return {"dsn": NEON_DATABASE_URL}
+
+    if DATABASE_URL:
+        return {"dsn": DATABASE_URL}
+
+    if PLANETSCALE_HOST and PLANETSCALE_USER and PLANETSCALE_PASSWORD:
+        return {
+            "host": PLANETSCALE_HOST,
+            "port": int(PLANETSCALE_PORT),
+            "user": PLANETSCALE_USER,
+            "password": PLANETSCALE_PASSWORD,
+            "database": PLANETSCALE_DB,
+            "ssl": "require"
+        }
+
+    raise ValueError("No database credentials configured")
+
+async def _init_connection(conn):
+    """Decode json/jsonb columns to Python objects like psycopg2 does"""
+    for type_name in ("json", "jsonb"):
+        await conn.set_type_codec(
+            type_name,
+            encoder=json.dumps,
+            decoder=json.loads,
+            schema="pg_catalog"
+        )
+
+def record_to_dict(record) -> Optional[dict]:
+    """Convert an asyncpg Record to the dict shape the routers return"""
+    return dict(record) if record is not None else None
+
+def records_to_dicts(records) -> List[dict]:
+    return [dict(r) for r in records]
+
+class AsyncDatabasePool:
+    """Lazily-created asyncpg pool shared by every router in the worker"""
+
+    def __init__(
+        self,
+        min_size: int = ASYNC_DB_POOL_MIN_SIZE,
+        max_size: int = ASYNC_DB_POOL_MAX_SIZE,
+        command_timeout: float = ASYNC_DB_COMMAND_TIMEOUT,
+        max_inactive_lifetime: float = ASYNC_DB_MAX_INACTIVE_LIFETIME,
+        statement_cache_size: int = ASYNC_DB_STATEMENT_CACHE_SIZE
+    ):
+        self.min_size = min_size
+        self.max_size = max_size
+        self.command_timeout = command_timeout
+        self.max_inactive_lifetime = max_inactive_lifetime
+        self.statement_cache_size = statement_cache_size
+        self._pool = None
+        self._lock = None
+
+    async def open(self):
+        """Create the pool on first use (safe to call repeatedly)"""
+        if self._pool is not None:
+            return self._pool
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if self._pool is None:
+                self._pool = await asyncpg.create_pool(
+                    min_size=self.min_size,
+                    max_size=self.max_size,
+                    command_timeout=self.command_timeout,
+                    max_inactive_connection_lifetime=self.max_inactive_lifetime,
+                    statement_cache_size=self.statement_cache_size,
+                    init=_init_connection,
+                    **_connect_kwargs()
+                )
+                logger.info(f"✅ Async database pool ready ({self.min_size}-{self.max_size} connections)")
+
+        return self._pool
+
+    async def close(self):
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+            logger.info("✅ Async database pool closed")
+
+    @asynccontextmanager
+    async def acquire(self):
+        """Borrow a connection: ``async with async_db_pool.acquire() as conn``"""
+        pool = await self.open()
+        async with pool.acquire() as conn:
+            yield conn
+
+    @asynccontextmanager
+    async def transaction(self):
+        """Borrow a connection inside a transaction committed on exit"""
+        pool = await self.open()
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                yield conn
+
+    async def fetch(self, query: str, *args) -> List[dict]:
+        pool = await self.open()
+        return records_to_dicts(await pool.fetch(query, *args))
+
+    async def fetchrow(self, query: str, *args) -> Optional[dict]:
+        pool = await self.open()
+        return record_to_dict(await pool.fetchrow(query, *args))
+
+    async def fetchval(self, query: str, *args) -> Any:
+        pool = await self.open()
+        return await pool.fetchval(query, *args)
+
+    async def execute(self, query: str, *args) -> str:
+        pool = await self.open()
+        return await pool.execute(query, *args)
+
+    def stats(self) -> dict:
+        if self._pool is None:
+            return {"open": False, "min_size": self.min_size, "max_size": self.max_size}
+
+        return {
+            "open": True,
+            "min_size": self._pool.get_min_size(),
+            "max_size": self._pool.get_max_size(),
+            "size": self._pool.get_size(),
+            "idle": self._pool.get_idle_size()
+        }
+
+# Process-wide singleton
+async_db_pool = AsyncDatabasePool()
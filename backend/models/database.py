@@ -4,14 +4,27 @@ PlanetScale PostgreSQL → NEON PostgreSQL (Final Destination)
 
 Deployment Chain: GitHub → Manus → PlanetScale → Netlify → NEON
 
+All modules borrow connections from one process-wide pool (``db_pool``)
+instead of opening a fresh TLS connection per request:
+
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        ...
+        conn.commit()
+
 @author ATHLYNX AI Corporation
 @date January 15, 2026
-@version 2.0
+@version 2.1
 """
 
 import psycopg2
+from psycopg2 import extensions
 from psycopg2.extras import RealDictCursor
+from collections import deque
+from contextlib import contextmanager
 import os
+import time
+import threading
 import logging
 
 logger = logging.getLogger(__name__)
@@ -30,17 +43,24 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 # Check which database to use
 USE_NEON = os.getenv("USE_NEON", "false").lower() == "true"
 
-def get_db_connection():
-    """Get database connection - Priority: NEON → DATABASE_URL → PlanetScale"""
+# Connection pool configuration (per worker process)
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "2"))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+DB_POOL_MAX_LIFETIME = float(os.getenv("DB_POOL_MAX_LIFETIME", "1800"))
+DB_POOL_HEALTH_CHECK_INTERVAL = float(os.getenv("DB_POOL_HEALTH_CHECK_INTERVAL", "30"))
+
+def _connect():
+    """Open a new raw connection - Priority: NEON → DATABASE_URL → PlanetScale"""
     try:
         if USE_NEON and NEON_DATABASE_URL:
             logger.info("🔗 Connecting to NEON (Final Destination)")
             return psycopg2.connect(NEON_DATABASE_URL, cursor_factory=RealDictCursor)
-        
+
         if DATABASE_URL:
             logger.info("🔗 Connecting via DATABASE_URL")
             return psycopg2.connect(DATABASE_URL, cursor_factory=RealDictCursor)
-        
+
         if PLANETSCALE_HOST and PLANETSCALE_USER and PLANETSCALE_PASSWORD:
             logger.info("🔗 Connecting to PlanetScale")
             return psycopg2.connect(
@@ -52,32 +72,332 @@ def get_db_connection():
                 sslmode='require',
                 cursor_factory=RealDictCursor
             )
-        
+
         raise ValueError("No database credentials configured")
-        
+
     except Exception as e:
         logger.error(f"❌ Database connection error: {e}")
         raise
 
+class DatabasePool:
+    """Thread-safe psycopg2 connection pool shared by the whole process"""
+
+    def __init__(
+        self,
+        min_size: int = DB_POOL_MIN_SIZE,
+        max_size: int = DB_POOL_MAX_SIZE,
+        timeout: float = DB_POOL_TIMEOUT,
+        max_lifetime: float = DB_POOL_MAX_LIFETIME,
+        health_check_interval: float = DB_POOL_HEALTH_CHECK_INTERVAL
+    ):
+        self.min_size = min_size
+        self.max_size = max(max_size, 1)
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.health_check_interval = health_check_interval
+
+        self._cond = threading.Condition()
+        self._idle = deque()      # (conn, created_at, last_used)
+        self._in_use = {}         # id(conn) -> created_at
+        self._size = 0            # idle + in use + being opened
+        self._closed = False
+        self._stats = {
+            "checkouts": 0,
+            "waits": 0,
+            "timeouts": 0,
+            "opened": 0,
+            "recycled": 0,
+            "health_check_failures": 0,
+            "discarded": 0
+        }
+
+    def _discard(self, conn):
+        """Close a connection and free its slot (caller holds the lock)"""
+        try:
+            conn.close()
+        except Exception:
+            pass
+        self._size -= 1
+        self._cond.notify()
+
+    def _is_healthy(self, conn) -> bool:
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1")
+            cursor.close()
+            conn.rollback()
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ Pooled connection failed health check: {e}")
+            return False
+
+    def acquire(self):
+        """Check a connection out of the pool, opening one if below max_size"""
+        deadline = time.monotonic() + self.timeout
+
+        while True:
+            with self._cond:
+                if self._closed:
+                    raise RuntimeError("Database pool is closed")
+
+                entry = None
+                while entry is None:
+                    if self._idle:
+                        # LIFO keeps the hottest connections busy and lets extras age out
+                        entry = self._idle.pop()
+                    elif self._size < self.max_size:
+                        self._size += 1
+                        entry = (None, None, None)
+                    else:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self._stats["timeouts"] += 1
+                            raise TimeoutError(
+                                f"Timed out after {self.timeout}s waiting for a database connection"
+                            )
+                        self._stats["waits"] += 1
+                        self._cond.wait(remaining)
+
+            conn, created_at, last_used = entry
+            now = time.monotonic()
+
+            if conn is None:
+                try:
+                    conn = _connect()
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+                created_at = now
+                with self._cond:
+                    self._stats["opened"] += 1
+            elif conn.closed:
+                with self._cond:
+                    self._stats["discarded"] += 1
+                    self._discard(conn)
+                continue
+            elif self.max_lifetime and now - created_at > self.max_lifetime:
+                with self._cond:
+                    self._stats["recycled"] += 1
+                    self._discard(conn)
+                continue
+            elif now - last_used > self.health_check_interval and not self._is_healthy(conn):
+                with self._cond:
+                    self._stats["health_check_failures"] += 1
+                    self._discard(conn)
+                continue
+
+            with self._cond:
+                self._in_use[id(conn)] = created_at
+                self._stats["checkouts"] += 1
+            return conn
+
+    def release(self, conn):
+        """Return a connection to the pool, rolling back any open transaction"""
+        broken = bool(conn.closed)
+        if not broken and conn.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+            try:
+                conn.rollback()
+            except Exception:
+                broken = True
+
+        with self._cond:
+            created_at = self._in_use.pop(id(conn), None)
+            if created_at is None:
+                # Not ours (already released or from another pool)
+                return
+
+            now = time.monotonic()
+            if broken or self._closed:
+                self._stats["discarded"] += 1
+                self._discard(conn)
+            elif self.max_lifetime and now - created_at > self.max_lifetime:
+                self._stats["recycled"] += 1
+                self._discard(conn)
+            else:
+                self._idle.append((conn, created_at, now))
+                self._cond.notify()
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection for the duration of a ``with`` block"""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def warmup(self):
+        """Open connections until min_size are idle (called on startup)"""
+        opened = []
+        try:
+            for _ in range(max(0, self.min_size - len(self._idle))):
+                opened.append(self.acquire())
+        except Exception as e:
+            logger.error(f"❌ Pool warmup error: {e}")
+        finally:
+            for conn in opened:
+                self.release(conn)
+        return len(opened)
+
+    def close(self):
+        """Close idle connections; checked-out ones are closed on release"""
+        with self._cond:
+            self._closed = True
+            while self._idle:
+                conn, _, _ = self._idle.pop()
+                self._discard(conn)
+            self._cond.notify_all()
+
+    def stats(self) -> dict:
+        """Snapshot of pool sizing and counters"""
+        with self._cond:
+            return {
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": len(self._in_use),
+                **self._stats
+            }
+
+# Process-wide singleton
+db_pool = DatabasePool()
+
+def get_db_connection():
+    """Borrow a pooled connection: ``with get_db_connection() as conn: ...``"""
+    return db_pool.connection()
+
 SCHEMA = """
--- 🦁 ATHLYNX AI Database Schema
-CREATE TABLE IF NOT EXISTS users (id SERIAL PRIMARY KEY, email VARCHAR(255) UNIQUE NOT NULL, password_hash VARCHAR(255), full_name VARCHAR(255), phone VARCHAR(50), role VARCHAR(50) DEFAULT 'user', sport VARCHAR(100), verified_email BOOLEAN DEFAULT FALSE, verified_phone BOOLEAN DEFAULT FALSE, subscription_tier VARCHAR(50) DEFAULT 'free', created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
-CREATE TABLE IF NOT EXISTS waitlist (id SERIAL PRIMARY KEY, full_name VARCHAR(255) NOT NULL, email VARCHAR(255) UNIQUE NOT NULL, phone VARCHAR(50), role VARCHAR(50), sport VARCHAR(100), position INTEGER NOT NULL, referral_code VARCHAR(50) UNIQUE, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
-CREATE TABLE IF NOT EXISTS athletes (id SERIAL PRIMARY KEY, user_id INTEGER REFERENCES users(id), sport VARCHAR(100), school VARCHAR(255), star_rating INTEGER, nil_value DECIMAL(15,2) DEFAULT 0, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
-CREATE TABLE IF NOT EXISTS transfer_portal (id SERIAL PRIMARY KEY, athlete_id INTEGER REFERENCES athletes(id), from_school VARCHAR(255), to_school VARCHAR(255), status VARCHAR(50) DEFAULT 'entered', created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
-CREATE TABLE IF NOT EXISTS nil_deals (id SERIAL PRIMARY KEY, athlete_id INTEGER REFERENCES athletes(id), brand_name VARCHAR(255), value DECIMAL(15,2), status VARCHAR(50) DEFAULT 'pending', created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
-CREATE TABLE IF NOT EXISTS verification_codes (id SERIAL PRIMARY KEY, email VARCHAR(255), phone VARCHAR(50), code VARCHAR(20) NOT NULL, expires_at TIMESTAMP NOT NULL, used BOOLEAN DEFAULT FALSE, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
-CREATE TABLE IF NOT EXISTS vip_codes (id SERIAL PRIMARY KEY, code VARCHAR(50) UNIQUE NOT NULL, max_uses INTEGER DEFAULT 100, current_uses INTEGER DEFAULT 0, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+-- 🦁 ATHLYNX AI Database Schema (baseline - migration 1)
+CREATE TABLE IF NOT EXISTS users (
+    id SERIAL PRIMARY KEY,
+    email VARCHAR(255) UNIQUE NOT NULL,
+    phone VARCHAR(20),
+    password_hash VARCHAR(255),
+    full_name VARCHAR(255),
+    role VARCHAR(50) DEFAULT 'user',
+    sport VARCHAR(100),
+    school VARCHAR(255),
+    verified_email BOOLEAN DEFAULT FALSE,
+    verified_phone BOOLEAN DEFAULT FALSE,
+    verified_whatsapp BOOLEAN DEFAULT FALSE,
+    vip_code VARCHAR(50),
+    subscription_tier VARCHAR(50) DEFAULT 'free',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS waitlist (
+    id SERIAL PRIMARY KEY,
+    full_name VARCHAR(255) NOT NULL,
+    email VARCHAR(255) UNIQUE NOT NULL,
+    phone VARCHAR(20),
+    role VARCHAR(50),
+    sport VARCHAR(100),
+    referral_code VARCHAR(50),
+    position INTEGER,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS athletes (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER REFERENCES users(id),
+    sport VARCHAR(100),
+    position VARCHAR(100),
+    school VARCHAR(255),
+    graduation_year INTEGER,
+    height VARCHAR(20),
+    weight VARCHAR(20),
+    gpa DECIMAL(3,2),
+    nil_value DECIMAL(12,2) DEFAULT 0,
+    star_rating INTEGER DEFAULT 0,
+    profile_complete BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS nil_deals (
+    id SERIAL PRIMARY KEY,
+    athlete_id INTEGER REFERENCES athletes(id),
+    brand_name VARCHAR(255),
+    deal_type VARCHAR(100),
+    value DECIMAL(12,2),
+    status VARCHAR(50) DEFAULT 'pending',
+    start_date DATE,
+    end_date DATE,
+    description TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS feed_posts (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER REFERENCES users(id),
+    content TEXT,
+    media_url VARCHAR(500),
+    post_type VARCHAR(50) DEFAULT 'text',
+    likes_count INTEGER DEFAULT 0,
+    comments_count INTEGER DEFAULT 0,
+    shares_count INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS messages (
+    id SERIAL PRIMARY KEY,
+    sender_id INTEGER REFERENCES users(id),
+    receiver_id INTEGER REFERENCES users(id),
+    content TEXT,
+    read BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS verification_codes (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER,
+    email VARCHAR(255),
+    phone VARCHAR(20),
+    code VARCHAR(10),
+    code_type VARCHAR(20),
+    expires_at TIMESTAMP,
+    used BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS subscriptions (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER REFERENCES users(id),
+    plan VARCHAR(50),
+    status VARCHAR(50) DEFAULT 'active',
+    start_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    end_date TIMESTAMP,
+    stripe_customer_id VARCHAR(255),
+    stripe_subscription_id VARCHAR(255)
+);
+CREATE TABLE IF NOT EXISTS analytics_events (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER,
+    event_type VARCHAR(100),
+    event_data JSONB,
+    ip_address VARCHAR(50),
+    user_agent TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS transfer_portal (
+    id SERIAL PRIMARY KEY,
+    athlete_id INTEGER REFERENCES athletes(id),
+    from_school VARCHAR(255),
+    to_school VARCHAR(255),
+    status VARCHAR(50) DEFAULT 'entered',
+    entry_date DATE,
+    commitment_date DATE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS vip_codes (
+    id SERIAL PRIMARY KEY,
+    code VARCHAR(50) UNIQUE NOT NULL,
+    max_uses INTEGER DEFAULT 100,
+    current_uses INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
 """
-
 def init_database():
+    """Bring the schema up to date (see models.migrations)"""
+    from .migrations import run_migrations
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(SCHEMA)
-        conn.commit()
-        cursor.close()
-        conn.close()
+        run_migrations()
         logger.info("✅ Database initialized")
         return True
     except Exception as e:
@@ -86,12 +406,11 @@ def init_database():
 
 def check_database_connection():
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT 1 as test")
-        result = cursor.fetchone()
-        cursor.close()
-        conn.close()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1 as test")
+            result = cursor.fetchone()
+            cursor.close()
         return result['test'] == 1
     except Exception as e:
         logger.error(f"❌ Connection check failed: {e}")
@@ -101,6 +420,6 @@ if __name__ == "__main__":
     print("🦁 ATHLYNX AI - Database Check")
     if check_database_connection():
         print("✅ Connected!")
-        init_database()
+        print("Run `python -m models.migrations` from backend/ to apply the schema")
     else:
         print("❌ Connection failed")
@@ -0,0 +1,450 @@
+"""
+🦁 ATHLYNX AI - Schema Migrations
+Versioned, ordered schema changes recorded in ``schema_migrations``
+
+Each migration runs once per database. Transactional migrations apply
+their statements and the version row in a single transaction; index
+migrations use CREATE INDEX CONCURRENTLY, which Postgres refuses inside a
+transaction block, so they run in autocommit mode and are written to be
+safely re-runnable (an interrupted build leaves an INVALID index behind,
+which is dropped and rebuilt on the next run).
+
+Workers call ``ensure_schema()`` at boot. A warm start costs one catalog
+lookup: the fingerprint of MIGRATIONS is stored as the comment on
+``schema_migrations`` and DDL is skipped when it matches. Otherwise a
+single worker takes a session advisory lock and migrates while the rest
+poll until the fingerprint appears. Session locks need a direct
+connection, not PgBouncer in transaction mode.
+
+Run from ``backend/``:
+
+    python -m models.migrations
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+@version 1.0
+"""
+
+from dataclasses import dataclass
+from typing import List, Tuple
+import hashlib
+import os
+import re
+import time
+import logging
+
+from .database import get_db_connection, SCHEMA
+
+logger = logging.getLogger(__name__)
+
+# Arbitrary constant shared by every worker ("ATHLYNX" as 7 bytes)
+SCHEMA_LOCK_KEY = int(os.getenv("SCHEMA_LOCK_KEY", "18388542981492312"))
+SCHEMA_LOCK_TIMEOUT = float(os.getenv("SCHEMA_LOCK_TIMEOUT", "300"))
+SCHEMA_LOCK_POLL_INTERVAL = 0.5
+
+SCHEMA_MIGRATIONS_TABLE = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version INTEGER PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+_CONCURRENT_INDEX = re.compile(
+    r"CREATE\s+(?:UNIQUE\s+)?INDEX\s+CONCURRENTLY\s+IF\s+NOT\s+EXISTS\s+(\w+)",
+    re.IGNORECASE
+)
+
+@dataclass(frozen=True)
+class Migration:
+    """One schema version: ordered statements plus how to run them"""
+    version: int
+    name: str
+    statements: Tuple[str, ...]
+    transactional: bool = True
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "baseline_schema", (SCHEMA,)),
+    Migration(2, "hot_path_indexes", (
+        # Inbox and unread badge: messages for a receiver, newest first / unread only
+        """CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_messages_receiver_created
+           ON messages (receiver_id, created_at DESC)""",
+        """CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_messages_receiver_unread
+           ON messages (receiver_id, sender_id) WHERE read = FALSE""",
+        # Sent box
+        """CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_messages_sender_created
+           ON messages (sender_id, created_at DESC)""",
+        # Home feed and profile posts
+        """CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_feed_posts_created
+           ON feed_posts (created_at DESC)""",
+        """CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_feed_posts_user_created
+           ON feed_posts (user_id, created_at DESC)""",
+        # Code verification only ever looks at unused codes
+        """CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_verification_codes_email_code
+           ON verification_codes (email, code) WHERE used = FALSE""",
+        """CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_verification_codes_phone_code
+           ON verification_codes (phone, code) WHERE used = FALSE""",
+        # Open-entry checks and athlete history
+        """CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_transfer_portal_athlete_status
+           ON transfer_portal (athlete_id, status)""",
+        # NIL deals per athlete (vault, stats, accept/reject)
+        """CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_nil_deals_athlete
+           ON nil_deals (athlete_id, created_at DESC)""",
+    ), transactional=False),
+    Migration(3, "feed_keyset_indexes", (
+        # Keyset pagination seeks on (created_at, id); id breaks timestamp ties
+        """CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_feed_posts_created_id
+           ON feed_posts (created_at DESC, id DESC)""",
+        """CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_feed_posts_user_created_id
+           ON feed_posts (user_id, created_at DESC, id DESC)""",
+        "DROP INDEX CONCURRENTLY IF EXISTS idx_feed_posts_created",
+        "DROP INDEX CONCURRENTLY IF EXISTS idx_feed_posts_user_created",
+    ), transactional=False),
+    Migration(4, "post_likes", (
+        # One row per (post, user): a user can like a post at most once
+        """CREATE TABLE IF NOT EXISTS post_likes (
+            post_id INTEGER NOT NULL REFERENCES feed_posts(id) ON DELETE CASCADE,
+            user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (post_id, user_id)
+        )""",
+        "CREATE INDEX IF NOT EXISTS idx_post_likes_user ON post_likes (user_id, created_at DESC)",
+    )),
+    Migration(5, "conversations_read_model", (
+        # One row per participant and partner, maintained by MessageRepository
+        """CREATE TABLE IF NOT EXISTS conversations (
+            user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+            partner_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+            last_message_id INTEGER,
+            last_message TEXT,
+            last_message_time TIMESTAMP,
+            unread_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (user_id, partner_id)
+        )""",
+        """CREATE INDEX IF NOT EXISTS idx_conversations_user_recent
+           ON conversations (user_id, last_message_time DESC)""",
+        # Backfill from existing history
+        """INSERT INTO conversations
+               (user_id, partner_id, last_message_id, last_message, last_message_time, unread_count)
+           WITH sides AS (
+               SELECT sender_id AS user_id, receiver_id AS partner_id,
+                      id, content, created_at, FALSE AS unread
+               FROM messages
+               UNION ALL
+               SELECT receiver_id, sender_id, id, content, created_at, NOT COALESCE(read, FALSE)
+               FROM messages
+           ), latest AS (
+               SELECT DISTINCT ON (user_id, partner_id) user_id, partner_id, id, content, created_at
+               FROM sides
+               WHERE user_id IS NOT NULL AND partner_id IS NOT NULL
+               ORDER BY user_id, partner_id, created_at DESC NULLS LAST, id DESC
+           ), unread AS (
+               SELECT user_id, partner_id, COUNT(*) FILTER (WHERE unread) AS unread_count
+               FROM sides
+               GROUP BY user_id, partner_id
+           )
+           SELECT l.user_id, l.partner_id, l.id, LEFT(l.content, 280), l.created_at, u.unread_count
+           FROM latest l
+           JOIN unread u USING (user_id, partner_id)
+           ON CONFLICT (user_id, partner_id) DO NOTHING""",
+    )),
+    Migration(6, "messages_pair_index", (
+        # Conversation thread: both directions share the (low id, high id) pair key,
+        # so a keyset page is one index range scan in either direction
+        """CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_messages_pair_created_id
+           ON messages (LEAST(sender_id, receiver_id), GREATEST(sender_id, receiver_id),
+                        created_at DESC, id DESC)""",
+    ), transactional=False),
+    Migration(7, "waitlist_position_counter", (
+        # Single-row counter bumped inside the waitlist INSERT. Unlike a sequence
+        # it rolls back with a failed insert, so positions stay gap-free.
+        """CREATE TABLE IF NOT EXISTS waitlist_position_counter (
+            id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+            last_position INTEGER NOT NULL
+        )""",
+        "LOCK TABLE waitlist IN SHARE MODE",
+        """INSERT INTO waitlist_position_counter (id, last_position)
+           SELECT TRUE, COALESCE(MAX(position), 0) FROM waitlist
+           ON CONFLICT (id) DO NOTHING""",
+    )),
+    Migration(8, "waitlist_rank_score", (
+        # position stays the join number; the waitlist is ordered by (rank_score, id)
+        # and referral boosts lower rank_score without renumbering anyone else
+        "CREATE SEQUENCE IF NOT EXISTS waitlist_rank_version_seq",
+        "ALTER TABLE waitlist ADD COLUMN IF NOT EXISTS rank_score INTEGER",
+        # Bumped on every insert and boost so workers can pull just what changed
+        """ALTER TABLE waitlist ADD COLUMN IF NOT EXISTS rank_version BIGINT
+           DEFAULT nextval('waitlist_rank_version_seq')""",
+        "UPDATE waitlist SET rank_score = position WHERE rank_score IS NULL",
+        "CREATE INDEX IF NOT EXISTS idx_waitlist_rank ON waitlist (rank_score, id)",
+        "CREATE INDEX IF NOT EXISTS idx_waitlist_rank_version ON waitlist (rank_version)",
+    )),
+    Migration(9, "analytics_rollups", (
+        # Maintained by AnalyticsRollupService; reports read these instead of raw rows
+        """CREATE TABLE IF NOT EXISTS analytics_rollup_hourly (
+            source VARCHAR(50) NOT NULL,
+            event_type VARCHAR(100) NOT NULL,
+            dimension VARCHAR(100) NOT NULL DEFAULT '',
+            bucket TIMESTAMP NOT NULL,
+            count BIGINT NOT NULL DEFAULT 0,
+            PRIMARY KEY (source, event_type, dimension, bucket)
+        )""",
+        """CREATE TABLE IF NOT EXISTS analytics_rollup_daily (
+            source VARCHAR(50) NOT NULL,
+            event_type VARCHAR(100) NOT NULL,
+            dimension VARCHAR(100) NOT NULL DEFAULT '',
+            day DATE NOT NULL,
+            count BIGINT NOT NULL DEFAULT 0,
+            PRIMARY KEY (source, event_type, dimension, day)
+        )""",
+        "CREATE INDEX IF NOT EXISTS idx_analytics_rollup_daily_day ON analytics_rollup_daily (day)",
+        # Distinct users per hour, for active-user counts (distinct counts do not add up)
+        """CREATE TABLE IF NOT EXISTS analytics_active_users_hourly (
+            bucket TIMESTAMP NOT NULL,
+            user_id INTEGER NOT NULL,
+            PRIMARY KEY (bucket, user_id)
+        )""",
+        # Highest source id already folded into the rollups
+        """CREATE TABLE IF NOT EXISTS analytics_rollup_watermarks (
+            source VARCHAR(50) PRIMARY KEY,
+            last_id BIGINT NOT NULL DEFAULT 0,
+            rolled_up_at TIMESTAMP
+        )""",
+        # post_likes is keyed by (post, user); an id gives the rollup a watermark
+        "ALTER TABLE post_likes ADD COLUMN IF NOT EXISTS id BIGSERIAL",
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_post_likes_id ON post_likes (id)",
+    )),
+    Migration(10, "sessions", (
+        # Login sessions; only the sha256 of each bearer token is stored
+        """CREATE TABLE IF NOT EXISTS sessions (
+            token_hash CHAR(64) PRIMARY KEY,
+            user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+            ip_address VARCHAR(50),
+            user_agent TEXT,
+            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            expires_at TIMESTAMP NOT NULL,
+            revoked_at TIMESTAMP
+        )""",
+        "CREATE INDEX IF NOT EXISTS idx_sessions_user ON sessions (user_id)",
+        "CREATE INDEX IF NOT EXISTS idx_sessions_expires ON sessions (expires_at)",
+    )),
+    Migration(11, "verification_code_purge_indexes", (
+        # Batched purge of expired and consumed codes (VerificationCodeStore)
+        """CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_verification_codes_expires
+           ON verification_codes (expires_at)""",
+        """CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_verification_codes_used
+           ON verification_codes (id) WHERE used = TRUE""",
+    ), transactional=False),
+    Migration(12, "notification_jobs", (
+        # Outbound email / SMS queue drained by NotificationQueue workers
+        """CREATE TABLE IF NOT EXISTS notification_jobs (
+            id BIGSERIAL PRIMARY KEY,
+            provider VARCHAR(20) NOT NULL,
+            kind VARCHAR(50) NOT NULL,
+            payload JSONB NOT NULL,
+            status VARCHAR(20) NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            run_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            locked_until TIMESTAMP,
+            last_error TEXT,
+            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            finished_at TIMESTAMP
+        )""",
+        # Claim scan: only pending and in-flight jobs, oldest due first
+        """CREATE INDEX IF NOT EXISTS idx_notification_jobs_due
+           ON notification_jobs (provider, run_at) WHERE status IN ('pending', 'running')""",
+        """CREATE INDEX IF NOT EXISTS idx_notification_jobs_finished
+           ON notification_jobs (finished_at) WHERE status = 'sent'""",
+    )),
+    Migration(13, "verification_code_width", (
+        # Password reset tokens (43 chars) share verification_codes
+        "ALTER TABLE verification_codes ALTER COLUMN code TYPE VARCHAR(64)",
+    )),
+    Migration(14, "analytics_rollup_gaps", (
+        # Highest source id seen, and when; id gaps below it that old are settled
+        """ALTER TABLE analytics_rollup_watermarks
+           ADD COLUMN IF NOT EXISTS seen_id BIGINT,
+           ADD COLUMN IF NOT EXISTS seen_at TIMESTAMP""",
+    )),
+]
+
+LATEST_VERSION = max(m.version for m in MIGRATIONS)
+
+def _fingerprint(migrations: List[Migration]) -> str:
+    digest = hashlib.sha256()
+    for m in sorted(migrations, key=lambda m: m.version):
+        digest.update(f"{m.version}:{m.name}:{m.transactional}\n".encode())
+        for statement in m.statements:
+            digest.update(" ".join(statement.split()).encode())
+            digest.update(b"\n")
+    return digest.hexdigest()
+
+SCHEMA_FINGERPRINT = f"v{LATEST_VERSION}:{_fingerprint(MIGRATIONS)[:16]}"
+
+def _applied_versions(cursor) -> set:
+    cursor.execute("SELECT version FROM schema_migrations")
+    return {row['version'] for row in cursor.fetchall()}
+
+def _drop_invalid_index(cursor, statement: str):
+    """Drop a half-built index left behind by an interrupted CONCURRENTLY build"""
+    match = _CONCURRENT_INDEX.search(statement)
+    if not match:
+        return
+    index_name = match.group(1)
+    cursor.execute("""
+        SELECT 1 FROM pg_index i
+        JOIN pg_class c ON c.oid = i.indexrelid
+        WHERE c.relname = %s AND NOT i.indisvalid
+    """, (index_name,))
+    if cursor.fetchone():
+        logger.warning(f"⚠️ Rebuilding invalid index {index_name}")
+        cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+
+def _apply(conn, migration: Migration):
+    cursor = conn.cursor()
+    try:
+        if migration.transactional:
+            for statement in migration.statements:
+                cursor.execute(statement)
+            cursor.execute(
+                "INSERT INTO schema_migrations (version, name) VALUES (%s, %s)",
+                (migration.version, migration.name)
+            )
+            conn.commit()
+            return
+
+        conn.autocommit = True
+        try:
+            for statement in migration.statements:
+                _drop_invalid_index(cursor, statement)
+                cursor.execute(statement)
+            cursor.execute(
+                "INSERT INTO schema_migrations (version, name) VALUES (%s, %s) ON CONFLICT DO NOTHING",
+                (migration.version, migration.name)
+            )
+        finally:
+            conn.autocommit = False
+    finally:
+        cursor.close()
+
+def get_schema_version() -> int:
+    """Highest applied migration version (0 for a fresh database)"""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(SCHEMA_MIGRATIONS_TABLE)
+        conn.commit()
+        cursor.execute("SELECT COALESCE(MAX(version), 0) AS version FROM schema_migrations")
+        version = cursor.fetchone()['version']
+        cursor.close()
+    return version
+
+def _stored_fingerprint(cursor):
+    """Fingerprint stamped on schema_migrations (None if absent)"""
+    cursor.execute(
+        "SELECT obj_description(to_regclass('schema_migrations'), 'pg_class') AS fingerprint"
+    )
+    return cursor.fetchone()['fingerprint']
+
+def _stamp_fingerprint(cursor):
+    cursor.execute(f"COMMENT ON TABLE schema_migrations IS '{SCHEMA_FINGERPRINT}'")
+
+def _acquire_schema_lock(conn) -> bool:
+    """Take the migration lock; False if another worker finished the job meanwhile.
+
+    Polls pg_try_advisory_lock in autocommit instead of blocking: a worker
+    parked inside pg_advisory_lock holds a snapshot that the lock owner's
+    CREATE INDEX CONCURRENTLY would have to wait for.
+    """
+    deadline = time.monotonic() + SCHEMA_LOCK_TIMEOUT
+    cursor = conn.cursor()
+    try:
+        while True:
+            cursor.execute("SELECT pg_try_advisory_lock(%s) AS locked", (SCHEMA_LOCK_KEY,))
+            if cursor.fetchone()['locked']:
+                return True
+            if _stored_fingerprint(cursor) == SCHEMA_FINGERPRINT:
+                return False
+            if time.monotonic() > deadline:
+                raise TimeoutError(
+                    f"Timed out after {SCHEMA_LOCK_TIMEOUT}s waiting for the schema migration lock"
+                )
+            time.sleep(SCHEMA_LOCK_POLL_INTERVAL)
+    finally:
+        cursor.close()
+
+def _release_schema_lock(conn):
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT pg_advisory_unlock(%s)", (SCHEMA_LOCK_KEY,))
+    finally:
+        cursor.close()
+
+def run_migrations() -> List[int]:
+    """Apply every pending migration in order; returns the versions applied"""
+    applied_now = []
+    with get_db_connection() as conn:
+        conn.autocommit = True
+        try:
+            if not _acquire_schema_lock(conn):
+                logger.info(f"✅ Schema migrated by another worker ({SCHEMA_FINGERPRINT})")
+                return applied_now
+        finally:
+            conn.autocommit = False
+
+        try:
+            cursor = conn.cursor()
+            cursor.execute(SCHEMA_MIGRATIONS_TABLE)
+            conn.commit()
+            applied = _applied_versions(cursor)
+            conn.commit()
+            cursor.close()
+
+            for migration in sorted(MIGRATIONS, key=lambda m: m.version):
+                if migration.version in applied:
+                    continue
+                logger.info(f"🔧 Applying migration {migration.version}: {migration.name}")
+                _apply(conn, migration)
+                applied_now.append(migration.version)
+
+            cursor = conn.cursor()
+            _stamp_fingerprint(cursor)
+            conn.commit()
+            cursor.close()
+        finally:
+            conn.rollback()
+            conn.autocommit = True
+            try:
+                _release_schema_lock(conn)
+            finally:
+                conn.autocommit = False
+
+    if applied_now:
+        logger.info(f"✅ Schema migrated to version {LATEST_VERSION} (applied {applied_now})")
+    else:
+        logger.info(f"✅ Schema up to date (version {LATEST_VERSION})")
+    return applied_now
+
+def ensure_schema() -> bool:
+    """Boot-time check: migrate only if the stored fingerprint differs.
+
+    Returns True when DDL was skipped (warm start).
+    """
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        stored = _stored_fingerprint(cursor)
+        conn.rollback()
+        cursor.close()
+
+    if stored == SCHEMA_FINGERPRINT:
+        logger.info(f"✅ Schema fingerprint matches ({SCHEMA_FINGERPRINT}) - skipping DDL")
+        return True
+
+    logger.info(f"🔧 Schema fingerprint {stored or 'missing'} != {SCHEMA_FINGERPRINT}")
+    run_migrations()
+    return False
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    print("🦁 ATHLYNX AI - Schema Migrations")
+    run_migrations()
+    print(f"✅ Schema version: {get_schema_version()} ({SCHEMA_FINGERPRINT})")
@@ -0,0 +1,47 @@
+"""
+🦁 ATHLYNX AI - Repositories Module
+Async (asyncpg) Data Access for the API Routers
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+"""
+
+from .user_repository import user_repository, UserRepository
+from .waitlist_repository import waitlist_repository, WaitlistRepository
+from .transfer_portal_repository import transfer_portal_repository, TransferPortalRepository
+from .nil_repository import nil_repository, NILRepository
+from .feed_repository import feed_repository, FeedRepository
+from .message_repository import message_repository, MessageRepository
+from .stats_repository import stats_repository, StatsRepository
+from .analytics_repository import analytics_repository, AnalyticsRepository
+from .session_repository import session_repository, SessionRepository
+from .verification_repository import verification_repository, VerificationRepository
+from .notification_repository import notification_repository, NotificationRepository
+from .pagination import encode_cursor, decode_cursor
+
+__all__ = [
+    'user_repository',
+    'UserRepository',
+    'waitlist_repository',
+    'WaitlistRepository',
+    'transfer_portal_repository',
+    'TransferPortalRepository',
+    'nil_repository',
+    'NILRepository',
+    'feed_repository',
+    'FeedRepository',
+    'message_repository',
+    'MessageRepository',
+    'stats_repository',
+    'StatsRepository',
+    'analytics_repository',
+    'AnalyticsRepository',
+    'session_repository',
+    'SessionRepository',
+    'verification_repository',
+    'VerificationRepository',
+    'notification_repository',
+    'NotificationRepository',
+    'encode_cursor',
+    'decode_cursor'
+]
@@ -0,0 +1,178 @@
+"""
+🦁 ATHLYNX AI - Analytics Repository
+Async bulk writes for analytics events, and the hourly/daily rollups
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+@version 1.0
+"""
+
+from datetime import datetime
+from typing import List, Optional, Tuple
+import json
+import logging
+
+from models.async_database import async_db_pool
+
+logger = logging.getLogger(__name__)
+
+# (user_id, event_type, event_data, ip_address, user_agent, created_at)
+AnalyticsEvent = Tuple[Optional[int], Optional[str], Optional[dict], Optional[str], Optional[str], datetime]
+
+# (source table, event_type expression, dimension expression) folded into the rollups
+ROLLUP_SOURCES: Tuple[Tuple[str, str, str], ...] = (
+    ("analytics_events", "COALESCE(event_type, '')", "''"),
+    ("users", "'signup'", "COALESCE(role, '')"),
+    ("waitlist", "'waitlist_join'", "COALESCE(role, '')"),
+    ("feed_posts", "'post'", "COALESCE(post_type, '')"),
+    ("messages", "'message'", "''"),
+    ("post_likes", "'like'", "''"),
+)
+
+def _rollup_sql(source: str, event_type: str, dimension: str) -> str:
+    # Source rows with $1 < id <= $2 are counted per hour and per day and
+    # added onto whatever the rollups already hold for those buckets
+    active_users = f"""
+        , active_users AS (
+            INSERT INTO analytics_active_users_hourly (bucket, user_id)
+            SELECT DISTINCT date_trunc('hour', created_at), user_id
+            FROM {source}
+            WHERE id > $1 AND id <= $2 AND user_id IS NOT NULL AND created_at IS NOT NULL
+            ON CONFLICT DO NOTHING
+        )""" if source == "analytics_events" else ""
+    return f"""
+        WITH batch AS (
+            SELECT date_trunc('hour', created_at) AS bucket,
+                   {event_type} AS event_type,
+                   {dimension} AS dimension,
+                   COUNT(*) AS count
+            FROM {source}
+            WHERE id > $1 AND id <= $2 AND created_at IS NOT NULL
+            GROUP BY 1, 2, 3
+        ), hourly AS (
+            INSERT INTO analytics_rollup_hourly AS r (source, event_type, dimension, bucket, count)
+            SELECT '{source}', event_type, dimension, bucket, count FROM batch
+            ON CONFLICT (source, event_type, dimension, bucket)
+            DO UPDATE SET count = r.count + EXCLUDED.count
+        ){active_users}
+        INSERT INTO analytics_rollup_daily AS r (source, event_type, dimension, day, count)
+        SELECT '{source}', event_type, dimension, bucket::date, SUM(count) FROM batch
+        GROUP BY event_type, dimension, bucket::date
+        ON CONFLICT (source, event_type, dimension, day)
+        DO UPDATE SET count = r.count + EXCLUDED.count
+    """
+
+ROLLUP_SQL = {source: _rollup_sql(source, event_type, dimension) for source, event_type, dimension in ROLLUP_SOURCES}
+
+class AnalyticsRepository:
+    """Async queries behind /api/analytics"""
+
+    async def insert_events(self, events: List[AnalyticsEvent]) -> int:
+        """Insert a batch of events in one statement; returns the row count
+
+        Columns travel as parallel arrays through unnest(). event_data goes
+        as text and is cast server-side (asyncpg's binary COPY cannot use the
+        pool's text jsonb codec).
+        """
+        if not events:
+            return 0
+        user_ids, event_types, event_data, ips, user_agents, created_ats = zip(*events)
+        await async_db_pool.execute("""
+            INSERT INTO analytics_events (user_id, event_type, event_data, ip_address, user_agent, created_at)
+            SELECT user_id, event_type, event_data::jsonb, ip_address, user_agent, created_at
+            FROM unnest($1::int[], $2::text[], $3::text[], $4::text[], $5::text[], $6::timestamp[])
+                AS e(user_id, event_type, event_data, ip_address, user_agent, created_at)
+        """,
+            list(user_ids),
+            list(event_types),
+            [json.dumps(data) if data is not None else None for data in event_data],
+            list(ips),
+            list(user_agents),
+            list(created_ats)
+        )
+        return len(events)
+
+    async def roll_up(self, source: str, batch_size: int, lag_seconds: float) -> Optional[int]:
+        """Fold the next batch_size rows of source into the rollups
+
+        Runs in one transaction with the source's watermark row locked, so
+        concurrent workers never count a row twice (a worker that finds the
+        row locked skips the source). Ids are handed out before commit, so
+        the batch is the run of rows past the watermark that stops at the
+        first row younger than lag_seconds or the first id gap: a missing
+        id may be an insert that has not committed yet. A gap counts as
+        settled (a rolled-back insert) once an id above it was seen at
+        least lag_seconds ago; each run records the highest id it sees for
+        that. Returns the new watermark, or None when there was nothing to do.
+        """
+        async with async_db_pool.transaction() as conn:
+            await conn.execute("""
+                INSERT INTO analytics_rollup_watermarks (source) VALUES ($1)
+                ON CONFLICT (source) DO NOTHING
+            """, source)
+            watermark = await conn.fetchrow("""
+                SELECT last_id,
+                       CASE WHEN seen_at <= NOW() - $2 * INTERVAL '1 second' THEN seen_id END AS settled_id,
+                       seen_at IS NULL OR seen_at <= NOW() - $2 * INTERVAL '1 second' AS observe
+                FROM analytics_rollup_watermarks
+                WHERE source = $1
+                FOR UPDATE SKIP LOCKED
+            """, source, lag_seconds)
+            if watermark is None:
+                return None
+            last_id = watermark['last_id']
+
+            if watermark['observe']:
+                # Start a fresh observation once the previous one has settled
+                await conn.execute(f"""
+                    UPDATE analytics_rollup_watermarks
+                    SET seen_id = (SELECT MAX(id) FROM {source}), seen_at = NOW()
+                    WHERE source = $1
+                """, source)
+
+            # The cutoff is the id just below the first young row or unsettled
+            # gap (prev_id), or the whole batch when there is neither
+            upper = await conn.fetchval(f"""
+                WITH next_rows AS (
+                    SELECT id, created_at, LAG(id, 1, $1) OVER (ORDER BY id) AS prev_id
+                    FROM (
+                        SELECT id::bigint AS id, created_at FROM {source}
+                        WHERE id > $1
+                        ORDER BY id
+                        LIMIT $2
+                    ) batch
+                )
+                SELECT COALESCE(
+                    (SELECT prev_id FROM next_rows
+                     WHERE created_at > NOW() - $3 * INTERVAL '1 second'
+                        OR (id > prev_id + 1 AND id - 1 > COALESCE($4, 0))
+                     ORDER BY id
+                     LIMIT 1),
+                    (SELECT MAX(id) FROM next_rows)
+                )
+            """, last_id, batch_size, lag_seconds, watermark['settled_id'])
+            if upper is None or upper <= last_id:
+                return None
+
+            await conn.execute(ROLLUP_SQL[source], last_id, upper)
+            await conn.execute("""
+                UPDATE analytics_rollup_watermarks
+                SET last_id = $2, rolled_up_at = NOW()
+                WHERE source = $1
+            """, source, upper)
+            return upper
+
+    async def purge_hourly(self, keep_days: int):
+        """Drop hourly buckets older than keep_days (daily rollups are kept)"""
+        async with async_db_pool.transaction() as conn:
+            await conn.execute("""
+                DELETE FROM analytics_rollup_hourly
+                WHERE bucket < NOW() - $1 * INTERVAL '1 day'
+            """, keep_days)
+            await conn.execute("""
+                DELETE FROM analytics_active_users_hourly
+                WHERE bucket < NOW() - $1 * INTERVAL '1 day'
+            """, keep_days)
+
+# Singleton instance
+analytics_repository = AnalyticsRepository()
@@ -0,0 +1,248 @@
+"""
+🦁 ATHLYNX AI - Social Feed Repository
+Async data access for posts, likes and shares
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+@version 1.0
+"""
+
+from datetime import datetime
+from typing import List, Optional, Tuple
+import logging
+
+import asyncpg
+
+from models.async_database import async_db_pool
+from repositories.pagination import decode_cursor, page_with_cursor
+
+logger = logging.getLogger(__name__)
+
+class FeedRepository:
+    """Async queries behind /api/feed"""
+
+    async def get_feed(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        user_id: Optional[int] = None,
+        cursor: Optional[str] = None,
+        sport: Optional[str] = None,
+        role: Optional[str] = None
+    ) -> Tuple[List[dict], Optional[str]]:
+        """Newest-first page of posts; returns (posts, next_cursor).
+
+        Pass the previous page's next_cursor to keep scrolling. OFFSET is
+        only honoured without a cursor, for older clients.
+        """
+        query = """
+            SELECT fp.*, u.full_name, u.role
+            FROM feed_posts fp
+            JOIN users u ON fp.user_id = u.id
+        """
+        params = []
+        conditions = []
+
+        if user_id:
+            params.append(user_id)
+            conditions.append(f"fp.user_id = ${len(params)}")
+
+        if sport:
+            params.append(sport)
+            conditions.append(f"u.sport = ${len(params)}")
+
+        if role:
+            params.append(role)
+            conditions.append(f"u.role = ${len(params)}")
+
+        if cursor:
+            created_at, post_id = decode_cursor(cursor)
+            params.extend([created_at, post_id])
+            conditions.append(f"(fp.created_at, fp.id) < (${len(params) - 1}, ${len(params)})")
+
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+
+        # One extra row tells us whether another page exists
+        params.append(limit + 1)
+        query += f" ORDER BY fp.created_at DESC, fp.id DESC LIMIT ${len(params)}"
+
+        if offset and not cursor:
+            params.append(offset)
+            query += f" OFFSET ${len(params)}"
+
+        rows = await async_db_pool.fetch(query, *params)
+        return page_with_cursor(rows, limit)
+
+    async def create_post(self, user_id: int, content: str, media_url: Optional[str], post_type: str) -> dict:
+        """Insert a post; returns it as the feed shows it, plus author_sport for fan-out"""
+        return await async_db_pool.fetchrow("""
+            WITH p AS (
+                INSERT INTO feed_posts (user_id, content, media_url, post_type, created_at)
+                VALUES ($1, $2, $3, $4, $5)
+                RETURNING *
+            )
+            SELECT p.*, u.full_name, u.role, u.sport AS author_sport
+            FROM p
+            JOIN users u ON p.user_id = u.id
+        """, user_id, content, media_url, post_type, datetime.now())
+
+    async def get_post_keys(
+        self,
+        limit: int,
+        sport: Optional[str] = None,
+        role: Optional[str] = None,
+        newer_than: Optional[Tuple[datetime, int]] = None
+    ) -> List[dict]:
+        """Newest (created_at, id) pairs for a timeline segment"""
+        query = """
+            SELECT fp.created_at, fp.id
+            FROM feed_posts fp
+            JOIN users u ON fp.user_id = u.id
+            WHERE fp.created_at IS NOT NULL
+        """
+        params = []
+
+        if sport:
+            params.append(sport)
+            query += f" AND u.sport = ${len(params)}"
+
+        if role:
+            params.append(role)
+            query += f" AND u.role = ${len(params)}"
+
+        if newer_than:
+            params.extend(newer_than)
+            query += f" AND (fp.created_at, fp.id) > (${len(params) - 1}, ${len(params)})"
+
+        params.append(limit)
+        query += f" ORDER BY fp.created_at DESC, fp.id DESC LIMIT ${len(params)}"
+
+        return await async_db_pool.fetch(query, *params)
+
+    async def get_posts_by_ids(self, post_ids: List[int]) -> List[dict]:
+        """Hydrate posts by id (missing/deleted ids are simply absent)"""
+        return await async_db_pool.fetch("""
+            SELECT fp.*, u.full_name, u.role
+            FROM feed_posts fp
+            JOIN users u ON fp.user_id = u.id
+            WHERE fp.id = ANY($1::int[])
+        """, post_ids)
+
+    async def like_post(self, post_id: int, user_id: int) -> Optional[dict]:
+        """Record a like once per user; returns {likes_count, added, created_at, author_sport} or None if the post is missing.
+
+        likes_count is the stored counter; the increment itself is buffered
+        by counter_service, so no request takes the feed_posts row lock.
+        created_at and author_sport let trending place a post it has not seen.
+        """
+        try:
+            return await async_db_pool.fetchrow("""
+                WITH post AS (
+                    SELECT fp.id, fp.likes_count, fp.created_at, u.sport AS author_sport
+                    FROM feed_posts fp
+                    LEFT JOIN users u ON u.id = fp.user_id
+                    WHERE fp.id = $1
+                ), added AS (
+                    INSERT INTO post_likes (post_id, user_id)
+                    SELECT id, $2 FROM post
+                    ON CONFLICT DO NOTHING
+                    RETURNING post_id
+                )
+                SELECT post.likes_count, post.created_at, post.author_sport,
+                       EXISTS (SELECT 1 FROM added) AS added
+                FROM post
+            """, post_id, user_id)
+        except asyncpg.ForeignKeyViolationError:
+            raise ValueError("User not found")
+
+    async def unlike_post(self, post_id: int, user_id: int) -> Optional[dict]:
+        """Remove a user's like; returns {likes_count, removed, created_at, author_sport} or None if the post is missing"""
+        return await async_db_pool.fetchrow("""
+            WITH post AS (
+                SELECT fp.id, fp.likes_count, fp.created_at, u.sport AS author_sport
+                FROM feed_posts fp
+                LEFT JOIN users u ON u.id = fp.user_id
+                WHERE fp.id = $1
+            ), removed AS (
+                DELETE FROM post_likes
+                WHERE post_id = $1 AND user_id = $2
+                RETURNING post_id
+            )
+            SELECT post.likes_count, post.created_at, post.author_sport,
+                   EXISTS (SELECT 1 FROM removed) AS removed
+            FROM post
+        """, post_id, user_id)
+
+    async def get_shares_count(self, post_id: int) -> Optional[int]:
+        """Stored share counter, or None if the post is missing"""
+        return await async_db_pool.fetchval(
+            "SELECT shares_count FROM feed_posts WHERE id = $1", post_id
+        )
+
+    async def apply_counter_deltas(self, post_ids: List[int], likes: List[int], shares: List[int]):
+        """Apply aggregated counter deltas for many posts in one statement"""
+        await async_db_pool.execute("""
+            UPDATE feed_posts AS fp
+            SET likes_count = GREATEST(0, fp.likes_count + d.likes),
+                shares_count = GREATEST(0, fp.shares_count + d.shares)
+            FROM unnest($1::int[], $2::int[], $3::int[]) AS d(id, likes, shares)
+            WHERE fp.id = d.id
+        """, post_ids, likes, shares)
+
+    async def delete_post(self, post_id: int, user_id: int) -> bool:
+        """Delete a post owned by user_id; False if missing or not the owner"""
+        deleted = await async_db_pool.fetchval("""
+            DELETE FROM feed_posts
+            WHERE id = $1 AND user_id = $2
+            RETURNING id
+        """, post_id, user_id)
+        return deleted is not None
+
+    async def get_trending_scores(
+        self,
+        window_hours: float,
+        half_life_seconds: float,
+        like_weight: float,
+        comment_weight: float,
+        share_weight: float
+    ) -> List[dict]:
+        """Decayed engagement score, as of now, for every post in the window.
+
+        Likes recorded in post_likes decay from when they happened; older
+        likes without a membership row, comments and shares decay from the
+        post's creation time.
+        """
+        return await async_db_pool.fetch("""
+            WITH decay AS (
+                SELECT fp.id, fp.created_at, u.sport,
+                       fp.likes_count, fp.comments_count, fp.shares_count,
+                       power(0.5, EXTRACT(EPOCH FROM NOW() - fp.created_at)::float8 / $2) AS post_decay
+                FROM feed_posts fp
+                JOIN users u ON fp.user_id = u.id
+                WHERE fp.created_at > NOW() - $1 * INTERVAL '1 hour'
+            )
+            SELECT d.id, d.created_at, d.sport,
+                   COALESCE(l.decayed, 0)
+                   + GREATEST(d.likes_count - COALESCE(l.tracked, 0), 0) * $3 * d.post_decay
+                   + (d.comments_count * $4 + d.shares_count * $5) * d.post_decay AS score
+            FROM decay d
+            LEFT JOIN LATERAL (
+                SELECT COUNT(*) AS tracked,
+                       SUM($3 * power(0.5, EXTRACT(EPOCH FROM NOW() - pl.created_at)::float8 / $2)) AS decayed
+                FROM post_likes pl
+                WHERE pl.post_id = d.id
+            ) l ON TRUE
+        """, float(window_hours), float(half_life_seconds),
+            float(like_weight), float(comment_weight), float(share_weight))
+
+    async def get_user_posts(
+        self,
+        user_id: int,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[dict], Optional[str]]:
+        return await self.get_feed(limit, 0, user_id, cursor)
+
+# Singleton instance
+feed_repository = FeedRepository()
@@ -0,0 +1,289 @@
+"""
+🦁 ATHLYNX AI - Messaging Repository
+Async data access for direct messages and conversations
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+@version 1.0
+"""
+
+from datetime import datetime
+from typing import List, Optional
+import logging
+
+from models.async_database import async_db_pool
+from repositories.pagination import encode_cursor, decode_cursor
+
+logger = logging.getLogger(__name__)
+
+# Characters of the last message kept on the conversations row
+CONVERSATION_SNIPPET_LENGTH = 280
+
+class MessageRepository:
+    """Async queries behind /api/messages"""
+
+    async def get_messages(self, user_id: int, limit: int = 100) -> List[dict]:
+        """Messages sent or received by user_id, newest first"""
+        return await async_db_pool.fetch("""
+            SELECT m.*,
+                   s.full_name as sender_name,
+                   r.full_name as receiver_name
+            FROM messages m
+            JOIN users s ON m.sender_id = s.id
+            JOIN users r ON m.receiver_id = r.id
+            WHERE m.sender_id = $1 OR m.receiver_id = $1
+            ORDER BY m.created_at DESC
+            LIMIT $2
+        """, user_id, limit)
+
+    async def get_inbox(self, user_id: int, limit: int = 50) -> List[dict]:
+        return await async_db_pool.fetch("""
+            SELECT m.*,
+                   s.full_name as sender_name,
+                   r.full_name as receiver_name
+            FROM messages m
+            JOIN users s ON m.sender_id = s.id
+            JOIN users r ON m.receiver_id = r.id
+            WHERE m.receiver_id = $1
+            ORDER BY m.created_at DESC
+            LIMIT $2
+        """, user_id, limit)
+
+    async def get_sent_messages(self, user_id: int, limit: int = 50) -> List[dict]:
+        return await async_db_pool.fetch("""
+            SELECT m.*,
+                   s.full_name as sender_name,
+                   r.full_name as receiver_name
+            FROM messages m
+            JOIN users s ON m.sender_id = s.id
+            JOIN users r ON m.receiver_id = r.id
+            WHERE m.sender_id = $1
+            ORDER BY m.created_at DESC
+            LIMIT $2
+        """, user_id, limit)
+
+    async def get_conversation(
+        self,
+        user_id: int,
+        other_user_id: int,
+        limit: int = 100,
+        before: Optional[str] = None,
+        after: Optional[str] = None
+    ) -> dict:
+        """One window of a thread, oldest first; marks the window's messages to user_id as read
+
+        With no cursor the window is the newest ``limit`` messages. ``before``
+        loads older history, ``after`` loads messages newer than a cursor.
+        Returns {messages, before_cursor, after_cursor, has_older, has_newer, read_ids}.
+        """
+        if before and after:
+            raise ValueError("Pass either before or after, not both")
+
+        low, high = sorted((user_id, other_user_id))
+        position = decode_cursor(before or after) if (before or after) else None
+        newer = bool(after)
+
+        args = [low, high]
+        keyset, order = "", "DESC"
+        if position:
+            args.extend(position)
+            keyset = f"AND (m.created_at, m.id) {'>' if newer else '<'} ($3, $4)"
+            order = "ASC" if newer else "DESC"
+        args.append(limit + 1)
+
+        async with async_db_pool.transaction() as conn:
+            rows = await conn.fetch(f"""
+                SELECT m.*,
+                       s.full_name as sender_name,
+                       r.full_name as receiver_name
+                FROM messages m
+                JOIN users s ON m.sender_id = s.id
+                JOIN users r ON m.receiver_id = r.id
+                WHERE LEAST(m.sender_id, m.receiver_id) = $1
+                  AND GREATEST(m.sender_id, m.receiver_id) = $2
+                  {keyset}
+                ORDER BY m.created_at {order}, m.id {order}
+                LIMIT ${len(args)}
+            """, *args)
+
+            more = len(rows) > limit
+            messages = [dict(m) for m in rows[:limit]]
+            if not newer:
+                messages.reverse()
+
+            # Mark only what the client is about to see
+            unread_ids = [
+                m['id'] for m in messages
+                if m['receiver_id'] == user_id and m['sender_id'] == other_user_id and not m['read']
+            ]
+            read_ids = []
+            if unread_ids:
+                read_ids = [r['id'] for r in await conn.fetch("""
+                    UPDATE messages SET read = TRUE
+                    WHERE id = ANY($1::int[]) AND read = FALSE
+                    RETURNING id
+                """, unread_ids)]
+
+            if read_ids:
+                await conn.execute("""
+                    UPDATE conversations SET unread_count = GREATEST(unread_count - $3, 0)
+                    WHERE user_id = $1 AND partner_id = $2
+                """, user_id, other_user_id, len(read_ids))
+
+        first = messages[0] if messages else None
+        last = messages[-1] if messages else None
+        return {
+            "messages": messages,
+            "before_cursor": encode_cursor(first['created_at'], first['id']) if first else None,
+            "after_cursor": encode_cursor(last['created_at'], last['id']) if last else after,
+            "has_older": more if not newer else True,
+            "has_newer": more if newer else position is not None,
+            "read_ids": read_ids
+        }
+
+    async def users_exist(self, *user_ids: int) -> bool:
+        found = await async_db_pool.fetchval(
+            "SELECT COUNT(*) FROM users WHERE id = ANY($1::int[])",
+            list(set(user_ids))
+        )
+        return found == len(set(user_ids))
+
+    async def send_message(self, sender_id: int, receiver_id: int, content: str) -> dict:
+        """Insert a message and update both participants' conversation rows; returns the message"""
+        created_at = datetime.now()
+        async with async_db_pool.transaction() as conn:
+            message_id = await conn.fetchval("""
+                INSERT INTO messages (sender_id, receiver_id, content, created_at)
+                VALUES ($1, $2, $3, $4)
+                RETURNING id
+            """, sender_id, receiver_id, content, created_at)
+
+            # (user_id, partner_id, unread increment); a self-message is one row
+            sides = {(sender_id, receiver_id): 0}
+            sides[(receiver_id, sender_id)] = 1
+
+            # Lock rows in key order so A->B and B->A sends cannot deadlock
+            for (user_id, partner_id), unread in sorted(sides.items()):
+                await conn.execute("""
+                    INSERT INTO conversations
+                        (user_id, partner_id, last_message_id, last_message, last_message_time, unread_count)
+                    VALUES ($1, $2, $3, LEFT($4, $6), $5, $7)
+                    ON CONFLICT (user_id, partner_id) DO UPDATE SET
+                        last_message_id = EXCLUDED.last_message_id,
+                        last_message = EXCLUDED.last_message,
+                        last_message_time = EXCLUDED.last_message_time,
+                        unread_count = conversations.unread_count + EXCLUDED.unread_count
+                """, user_id, partner_id, message_id, content, created_at,
+                    CONVERSATION_SNIPPET_LENGTH, unread)
+
+        return {
+            "id": message_id,
+            "sender_id": sender_id,
+            "receiver_id": receiver_id,
+            "content": content,
+            "read": False,
+            "created_at": created_at
+        }
+
+    async def mark_as_read(self, message_id: int, user_id: int) -> Optional[dict]:
+        """Mark a received message read; returns {sender_id, was_unread} or None if missing/not the receiver"""
+        async with async_db_pool.transaction() as conn:
+            message = await conn.fetchrow("""
+                SELECT sender_id, read FROM messages
+                WHERE id = $1 AND receiver_id = $2
+                FOR UPDATE
+            """, message_id, user_id)
+
+            if not message:
+                return None
+
+            if not message['read']:
+                await conn.execute("UPDATE messages SET read = TRUE WHERE id = $1", message_id)
+                await conn.execute("""
+                    UPDATE conversations SET unread_count = GREATEST(unread_count - 1, 0)
+                    WHERE user_id = $1 AND partner_id = $2
+                """, user_id, message['sender_id'])
+
+        return {"sender_id": message['sender_id'], "was_unread": not message['read']}
+
+    async def delete_message(self, message_id: int, user_id: int) -> Optional[dict]:
+        """Delete a message the user sent or received; returns {sender_id, receiver_id, was_unread} or None"""
+        async with async_db_pool.transaction() as conn:
+            deleted = await conn.fetchrow("""
+                DELETE FROM messages
+                WHERE id = $1 AND (sender_id = $2 OR receiver_id = $2)
+                RETURNING sender_id, receiver_id, read
+            """, message_id, user_id)
+
+            if not deleted:
+                return None
+
+            sender_id, receiver_id = deleted['sender_id'], deleted['receiver_id']
+
+            if not deleted['read']:
+                await conn.execute("""
+                    UPDATE conversations SET unread_count = GREATEST(unread_count - 1, 0)
+                    WHERE user_id = $1 AND partner_id = $2
+                """, receiver_id, sender_id)
+
+            # If it was the newest message, fall back to the previous one (or drop the row)
+            previous = await conn.fetchrow("""
+                SELECT id, content, created_at FROM messages
+                WHERE LEAST(sender_id, receiver_id) = $1
+                  AND GREATEST(sender_id, receiver_id) = $2
+                ORDER BY created_at DESC, id DESC
+                LIMIT 1
+            """, *sorted((sender_id, receiver_id)))
+
+            for owner, partner in sorted({(sender_id, receiver_id), (receiver_id, sender_id)}):
+                if previous:
+                    await conn.execute("""
+                        UPDATE conversations SET
+                            last_message_id = $3,
+                            last_message = LEFT($4, $6),
+                            last_message_time = $5
+                        WHERE user_id = $1 AND partner_id = $2 AND last_message_id = $7
+                    """, owner, partner, previous['id'], previous['content'], previous['created_at'],
+                        CONVERSATION_SNIPPET_LENGTH, message_id)
+                else:
+                    await conn.execute(
+                        "DELETE FROM conversations WHERE user_id = $1 AND partner_id = $2",
+                        owner, partner
+                    )
+
+        return {"sender_id": sender_id, "receiver_id": receiver_id, "was_unread": not deleted['read']}
+
+    async def get_conversations_list(self, user_id: int) -> List[dict]:
+        """Conversation partners, newest first, from the conversations read model"""
+        return await async_db_pool.fetch("""
+            SELECT c.partner_id,
+                   u.full_name as partner_name,
+                   c.last_message,
+                   c.last_message_time,
+                   c.unread_count
+            FROM conversations c
+            JOIN users u ON c.partner_id = u.id
+            WHERE c.user_id = $1
+            ORDER BY c.last_message_time DESC
+        """, user_id)
+
+    async def get_unread_count(self, user_id: int) -> int:
+        return await async_db_pool.fetchval("""
+            SELECT COALESCE(SUM(unread_count), 0)::int FROM conversations
+            WHERE user_id = $1
+        """, user_id)
+
+    async def get_unread_counts(self, user_ids: List[int]) -> dict:
+        """Unread totals for many users in one query ({user_id: count}, zeros included)"""
+        rows = await async_db_pool.fetch("""
+            SELECT user_id, COALESCE(SUM(unread_count), 0)::int AS unread_count
+            FROM conversations
+            WHERE user_id = ANY($1::int[])
+            GROUP BY user_id
+        """, user_ids)
+        counts = {user_id: 0 for user_id in user_ids}
+        counts.update({r['user_id']: r['unread_count'] for r in rows})
+        return counts
+
+# Singleton instance
+message_repository = MessageRepository()
@@ -0,0 +1,219 @@
+"""
+🦁 ATHLYNX AI - NIL Vault Repository
+Async data access for Name, Image, Likeness deals
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+@version 1.0
+"""
+
+from datetime import datetime, date
+from decimal import Decimal
+from typing import List, Optional
+import logging
+
+from models.async_database import async_db_pool
+
+logger = logging.getLogger(__name__)
+
+def _to_date(value) -> Optional[date]:
+    """asyncpg needs real dates; clients send ISO strings"""
+    if value is None or isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+class NILRepository:
+    """Async queries behind /api/nil-vault"""
+
+    async def get_nil_deals(
+        self,
+        athlete_id: Optional[int] = None,
+        status: Optional[str] = None,
+        deal_type: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> List[dict]:
+        query = """
+            SELECT nd.*, a.sport, u.full_name, u.full_name as athlete_name
+            FROM nil_deals nd
+            JOIN athletes a ON nd.athlete_id = a.id
+            JOIN users u ON a.user_id = u.id
+            WHERE 1=1
+        """
+        params = []
+
+        if athlete_id:
+            params.append(athlete_id)
+            query += f" AND nd.athlete_id = ${len(params)}"
+
+        if status:
+            params.append(status)
+            query += f" AND nd.status = ${len(params)}"
+
+        if deal_type:
+            params.append(deal_type)
+            query += f" AND nd.deal_type = ${len(params)}"
+
+        params.extend([limit, offset])
+        query += f" ORDER BY nd.created_at DESC LIMIT ${len(params) - 1} OFFSET ${len(params)}"
+
+        return await async_db_pool.fetch(query, *params)
+
+    async def athlete_exists(self, athlete_id: int) -> bool:
+        found = await async_db_pool.fetchval("SELECT id FROM athletes WHERE id = $1", athlete_id)
+        return found is not None
+
+    async def create_nil_deal(
+        self,
+        athlete_id: int,
+        brand_name: str,
+        deal_type: str,
+        value,
+        description: Optional[str],
+        start_date,
+        end_date
+    ) -> int:
+        return await async_db_pool.fetchval("""
+            INSERT INTO nil_deals (athlete_id, brand_name, deal_type, value, description,
+                                   start_date, end_date, status, created_at)
+            VALUES ($1, $2, $3, $4, $5, $6, $7, 'pending', $8)
+            RETURNING id
+        """, athlete_id, brand_name, deal_type, Decimal(str(value)) if value is not None else None, description,
+            _to_date(start_date), _to_date(end_date), datetime.now())
+
+    async def accept_nil_deal(self, deal_id: int) -> Optional[dict]:
+        """Activate a pending deal and add its value to the athlete's total.
+
+        Returns the deal (with the athlete's new_nil_value) or None if the
+        deal is missing or already processed.
+        """
+        async with async_db_pool.transaction() as conn:
+            deal = await conn.fetchrow("""
+                SELECT nd.*, a.nil_value as current_nil_value
+                FROM nil_deals nd
+                JOIN athletes a ON nd.athlete_id = a.id
+                WHERE nd.id = $1 AND nd.status = 'pending'
+                FOR UPDATE OF nd
+            """, deal_id)
+
+            if not deal:
+                return None
+
+            await conn.execute("""
+                UPDATE nil_deals SET status = 'active' WHERE id = $1
+            """, deal_id)
+
+            new_nil_value = await conn.fetchval("""
+                UPDATE athletes SET nil_value = COALESCE(nil_value, 0) + $1
+                WHERE id = $2
+                RETURNING nil_value
+            """, deal['value'], deal['athlete_id'])
+
+        result = dict(deal)
+        result['new_nil_value'] = new_nil_value
+        return result
+
+    async def reject_nil_deal(self, deal_id: int) -> bool:
+        rejected = await async_db_pool.fetchval("""
+            UPDATE nil_deals SET status = 'rejected'
+            WHERE id = $1 AND status = 'pending'
+            RETURNING id
+        """, deal_id)
+        return rejected is not None
+
+    async def get_athlete(self, athlete_id: int) -> Optional[dict]:
+        return await async_db_pool.fetchrow("""
+            SELECT a.*, u.full_name
+            FROM athletes a
+            JOIN users u ON a.user_id = u.id
+            WHERE a.id = $1
+        """, athlete_id)
+
+    async def get_athlete_deal_stats(self, athlete_id: int) -> dict:
+        return await async_db_pool.fetchrow("""
+            SELECT
+                COUNT(*) FILTER (WHERE status = 'active') as active_deals,
+                COUNT(*) FILTER (WHERE status = 'pending') as pending_deals,
+                COUNT(*) FILTER (WHERE status = 'completed') as completed_deals,
+                COALESCE(SUM(value) FILTER (WHERE status = 'active'), 0) as active_value,
+                COALESCE(SUM(value) FILTER (WHERE status = 'completed'), 0) as completed_value
+            FROM nil_deals
+            WHERE athlete_id = $1
+        """, athlete_id)
+
+    async def get_recent_deals(self, athlete_id: int, limit: int = 10) -> List[dict]:
+        return await async_db_pool.fetch("""
+            SELECT * FROM nil_deals
+            WHERE athlete_id = $1
+            ORDER BY created_at DESC
+            LIMIT $2
+        """, athlete_id, limit)
+
+    async def get_marketplace(
+        self,
+        sport: Optional[str] = None,
+        min_value: Optional[float] = None,
+        max_value: Optional[float] = None
+    ) -> List[dict]:
+        # This would typically show brand opportunities looking for athletes
+        # For now, we'll show top athletes available for deals
+        query = """
+            SELECT a.*, u.full_name,
+                   (SELECT COUNT(*) FROM nil_deals WHERE athlete_id = a.id AND status = 'active') as active_deals
+            FROM athletes a
+            JOIN users u ON a.user_id = u.id
+            WHERE a.profile_complete = TRUE
+        """
+        params = []
+
+        if sport:
+            params.append(sport)
+            query += f" AND a.sport = ${len(params)}"
+
+        if min_value:
+            params.append(Decimal(str(min_value)))
+            query += f" AND a.nil_value >= ${len(params)}"
+
+        if max_value:
+            params.append(Decimal(str(max_value)))
+            query += f" AND a.nil_value <= ${len(params)}"
+
+        query += " ORDER BY a.star_rating DESC, a.nil_value DESC LIMIT 50"
+
+        return await async_db_pool.fetch(query, *params)
+
+    async def get_nil_stats(self) -> dict:
+        async with async_db_pool.acquire() as conn:
+            totals = await conn.fetchrow("""
+                SELECT COALESCE(SUM(value), 0) as total, COALESCE(AVG(value), 0) as avg
+                FROM nil_deals
+                WHERE status IN ('active', 'completed')
+            """)
+
+            by_sport = await conn.fetch("""
+                SELECT a.sport, COALESCE(SUM(nd.value), 0) as total_value, COUNT(*) as deal_count
+                FROM nil_deals nd
+                JOIN athletes a ON nd.athlete_id = a.id
+                WHERE nd.status IN ('active', 'completed')
+                GROUP BY a.sport
+                ORDER BY total_value DESC
+            """)
+
+            top_earners = await conn.fetch("""
+                SELECT u.full_name, a.sport, a.nil_value
+                FROM athletes a
+                JOIN users u ON a.user_id = u.id
+                WHERE a.nil_value > 0
+                ORDER BY a.nil_value DESC
+                LIMIT 10
+            """)
+
+        return {
+            "total_value": totals['total'],
+            "avg_value": totals['avg'],
+            "by_sport": [dict(s) for s in by_sport],
+            "top_earners": [dict(e) for e in top_earners]
+        }
+
+# Singleton instance
+nil_repository = NILRepository()
@@ -0,0 +1,116 @@
+"""
+🦁 ATHLYNX AI - Notification Repository
+Async data access for the outbound notification queue
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+@version 1.0
+"""
+
+from typing import List, Optional, Tuple
+import json
+import logging
+
+from models.async_database import async_db_pool
+
+logger = logging.getLogger(__name__)
+
+# (provider, kind, payload)
+NotificationJob = Tuple[str, str, dict]
+
+class NotificationRepository:
+    """Async queries behind NotificationQueue"""
+
+    async def enqueue(self, provider: str, kind: str, payload: dict) -> int:
+        return await async_db_pool.fetchval("""
+            INSERT INTO notification_jobs (provider, kind, payload)
+            VALUES ($1, $2, $3)
+            RETURNING id
+        """, provider, kind, payload)
+
+    async def enqueue_many(self, jobs: List[NotificationJob]) -> int:
+        """Insert a batch of jobs in one statement; returns the row count"""
+        if not jobs:
+            return 0
+        providers, kinds, payloads = zip(*jobs)
+        await async_db_pool.execute("""
+            INSERT INTO notification_jobs (provider, kind, payload)
+            SELECT provider, kind, payload::jsonb
+            FROM unnest($1::text[], $2::text[], $3::text[]) AS j(provider, kind, payload)
+        """, list(providers), list(kinds), [json.dumps(payload) for payload in payloads])
+        return len(jobs)
+
+    async def claim(self, provider: str, limit: int, lease_seconds: float) -> List[dict]:
+        """Lease up to limit due jobs for one provider
+
+        SKIP LOCKED lets every worker in every process claim concurrently
+        without handing the same job out twice. A job whose lease ran out
+        (its worker died mid-send) is due again.
+        """
+        return await async_db_pool.fetch("""
+            UPDATE notification_jobs
+            SET status = 'running',
+                attempts = attempts + 1,
+                locked_until = NOW() + $3 * INTERVAL '1 second'
+            WHERE id IN (
+                SELECT id FROM notification_jobs
+                WHERE provider = $1
+                  AND status IN ('pending', 'running')
+                  AND run_at <= NOW()
+                  AND (status = 'pending' OR locked_until < NOW())
+                ORDER BY run_at
+                LIMIT $2
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING id, kind, payload, attempts
+        """, provider, limit, lease_seconds)
+
+    async def extend_lease(self, job_id: int, attempts: int, lease_seconds: float) -> bool:
+        """Renew a claim; False if the lease already lapsed and another worker took the job"""
+        return await async_db_pool.fetchval("""
+            UPDATE notification_jobs
+            SET locked_until = NOW() + $3 * INTERVAL '1 second'
+            WHERE id = $1 AND status = 'running' AND attempts = $2
+            RETURNING TRUE
+        """, job_id, attempts, lease_seconds) is not None
+
+    async def mark_sent(self, job_id: int):
+        await async_db_pool.execute("""
+            UPDATE notification_jobs
+            SET status = 'sent', finished_at = NOW(), locked_until = NULL, last_error = NULL
+            WHERE id = $1
+        """, job_id)
+
+    async def retry(self, job_id: int, delay_seconds: float, error: Optional[str], payload: Optional[dict] = None):
+        """Put a failed job back in the queue after delay_seconds (optionally with a narrower payload)"""
+        await async_db_pool.execute("""
+            UPDATE notification_jobs
+            SET status = 'pending', run_at = NOW() + $2 * INTERVAL '1 second',
+                locked_until = NULL, last_error = $3, payload = COALESCE($4, payload)
+            WHERE id = $1
+        """, job_id, delay_seconds, error, payload)
+
+    async def mark_dead(self, job_id: int, error: Optional[str]):
+        """Park a job that ran out of attempts; it stays for inspection"""
+        await async_db_pool.execute("""
+            UPDATE notification_jobs
+            SET status = 'dead', finished_at = NOW(), locked_until = NULL, last_error = $2
+            WHERE id = $1
+        """, job_id, error)
+
+    async def purge_sent(self, keep_days: int) -> str:
+        """Delete jobs delivered more than keep_days ago"""
+        return await async_db_pool.execute("""
+            DELETE FROM notification_jobs
+            WHERE status = 'sent' AND finished_at < NOW() - $1 * INTERVAL '1 day'
+        """, keep_days)
+
+    async def counts(self) -> dict:
+        """Jobs per status"""
+        rows = await async_db_pool.fetch("""
+            SELECT status, COUNT(*) AS count FROM notification_jobs GROUP BY status
+        """)
+        return {row['status']: row['count'] for row in rows}
+
+# Singleton instance
+notification_repository = NotificationRepository()
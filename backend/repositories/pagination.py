@@ -0,0 +1,41 @@
+"""
+🦁 ATHLYNX AI - Keyset Pagination Helpers
+Opaque (created_at, id) cursors shared by the repositories
+
+Clients treat cursors as opaque strings; internally they are url-safe
+base64 of ``[created_at ISO-8601, id]`` and map onto a row comparison
+such as ``(created_at, id) < ($1, $2)`` that an index on
+``(created_at DESC, id DESC)`` can seek to directly, so page 500 costs
+the same as page 1 and concurrent inserts never shift a page.
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+@version 1.0
+"""
+
+from datetime import datetime
+from typing import List, Optional, Tuple
+import base64
+import json
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Build the opaque cursor for a row"""
+    raw = json.dumps([created_at.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Parse an opaque cursor; raises ValueError if it is malformed"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except Exception:
+        raise ValueError("Invalid pagination cursor")
+
+def page_with_cursor(rows: List[dict], limit: int) -> Tuple[List[dict], Optional[str]]:
+    """Trim a LIMIT n+1 result to n rows and derive next_cursor from the last one"""
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    last = page[-1]
+    return page, encode_cursor(last['created_at'], last['id'])
@@ -0,0 +1,70 @@
+"""
+🦁 ATHLYNX AI - Session Repository
+Async data access for login sessions
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+@version 1.0
+"""
+
+from typing import List, Optional
+import logging
+
+from models.async_database import async_db_pool
+
+logger = logging.getLogger(__name__)
+
+class SessionRepository:
+    """Async queries behind SessionService"""
+
+    async def create_session(
+        self,
+        token_hash: str,
+        user_id: int,
+        ttl_hours: float,
+        ip_address: Optional[str],
+        user_agent: Optional[str]
+    ) -> dict:
+        return await async_db_pool.fetchrow("""
+            INSERT INTO sessions (token_hash, user_id, ip_address, user_agent, expires_at)
+            VALUES ($1, $2, $3, $4, NOW() + $5 * INTERVAL '1 hour')
+            RETURNING token_hash, user_id, created_at, expires_at
+        """, token_hash, user_id, ip_address, user_agent, ttl_hours)
+
+    async def get_session_user(self, token_hash: str) -> Optional[dict]:
+        """The session's user profile and expiry, if the session is live"""
+        return await async_db_pool.fetchrow("""
+            SELECT u.id, u.email, u.full_name, u.role, u.verified_email, u.verified_phone,
+                   u.subscription_tier, s.expires_at
+            FROM sessions s
+            JOIN users u ON u.id = s.user_id
+            WHERE s.token_hash = $1 AND s.revoked_at IS NULL AND s.expires_at > NOW()
+        """, token_hash)
+
+    async def revoke_session(self, token_hash: str) -> Optional[int]:
+        """Revoke one session; returns its user id, or None if it was not live"""
+        return await async_db_pool.fetchval("""
+            UPDATE sessions SET revoked_at = NOW()
+            WHERE token_hash = $1 AND revoked_at IS NULL
+            RETURNING user_id
+        """, token_hash)
+
+    async def revoke_user_sessions(self, user_id: int) -> List[str]:
+        """Revoke every live session of a user; returns their token hashes"""
+        rows = await async_db_pool.fetch("""
+            UPDATE sessions SET revoked_at = NOW()
+            WHERE user_id = $1 AND revoked_at IS NULL AND expires_at > NOW()
+            RETURNING token_hash
+        """, user_id)
+        return [row['token_hash'] for row in rows]
+
+    async def purge_expired(self, keep_days: int):
+        """Delete sessions that expired or were revoked more than keep_days ago"""
+        await async_db_pool.execute("""
+            DELETE FROM sessions
+            WHERE expires_at < NOW() - $1 * INTERVAL '1 day'
+               OR revoked_at < NOW() - $1 * INTERVAL '1 day'
+        """, keep_days)
+
+# Singleton instance
+session_repository = SessionRepository()
@@ -0,0 +1,60 @@
+"""
+🦁 ATHLYNX AI - Platform Stats Repository
+Async data access for platform-wide totals
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+@version 1.0
+"""
+
+from typing import Tuple
+import logging
+
+from models.async_database import async_db_pool
+
+logger = logging.getLogger(__name__)
+
+# (stats key, table) pairs counted for /api/stats
+PLATFORM_COUNTS: Tuple[Tuple[str, str], ...] = (
+    ("total_users", "users"),
+    ("waitlist_count", "waitlist"),
+    ("athletes_count", "athletes"),
+    ("nil_deals_count", "nil_deals"),
+    ("posts_count", "feed_posts"),
+    ("messages_count", "messages"),
+)
+
+def _platform_totals_sql() -> str:
+    # Postgres only runs a scalar subquery in a CASE branch it reaches, so a
+    # table whose catalog estimate exceeds $1 is never scanned
+    estimates = ",\n".join(
+        f"(SELECT reltuples::bigint FROM pg_class WHERE oid = '{table}'::regclass) AS {table}"
+        for _, table in PLATFORM_COUNTS
+    )
+    counts = ",\n".join(
+        f"CASE WHEN e.{table} > $1 THEN e.{table} ELSE (SELECT COUNT(*) FROM {table}) END AS {key},\n"
+        f"e.{table} > $1 AS {key}_approximate"
+        for key, table in PLATFORM_COUNTS
+    )
+    return f"""
+        SELECT {counts},
+               (SELECT COALESCE(SUM(value), 0) FROM nil_deals WHERE status = 'active') AS total_nil_value
+        FROM (SELECT {estimates}) e
+    """
+
+PLATFORM_TOTALS_SQL = _platform_totals_sql()
+
+class StatsRepository:
+    """Async queries behind /api/stats"""
+
+    async def get_platform_totals(self, exact_limit: int) -> dict:
+        """Every platform total in one statement
+
+        Tables the planner estimates at more than exact_limit rows report
+        ``pg_class.reltuples`` instead of an exact COUNT(*) and are flagged
+        ``<key>_approximate``.
+        """
+        return await async_db_pool.fetchrow(PLATFORM_TOTALS_SQL, exact_limit)
+
+# Singleton instance
+stats_repository = StatsRepository()
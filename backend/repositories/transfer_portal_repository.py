@@ -0,0 +1,184 @@
+"""
+🦁 ATHLYNX AI - Transfer Portal Repository
+Async data access for college athlete transfers
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+@version 1.0
+"""
+
+from datetime import datetime, date
+from typing import List, Optional, Tuple
+import logging
+
+from models.async_database import async_db_pool
+
+logger = logging.getLogger(__name__)
+
+class TransferPortalRepository:
+    """Async queries behind /api/transfer-portal"""
+
+    async def get_entries(
+        self,
+        sport: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> Tuple[List[dict], int]:
+        """One page of portal entries plus the total matching count"""
+        filters = ""
+        params = []
+
+        if sport:
+            params.append(sport)
+            filters += f" AND a.sport = ${len(params)}"
+
+        if status:
+            params.append(status)
+            filters += f" AND tp.status = ${len(params)}"
+
+        page_params = params + [limit, offset]
+
+        async with async_db_pool.acquire() as conn:
+            entries = await conn.fetch(f"""
+                SELECT tp.*, a.sport, a.position, a.position as player_position, a.star_rating,
+                       u.full_name, a.graduation_year
+                FROM transfer_portal tp
+                JOIN athletes a ON tp.athlete_id = a.id
+                JOIN users u ON a.user_id = u.id
+                WHERE 1=1{filters}
+                ORDER BY tp.entry_date DESC LIMIT ${len(page_params) - 1} OFFSET ${len(page_params)}
+            """, *page_params)
+
+            total = await conn.fetchval(f"""
+                SELECT COUNT(*) as total
+                FROM transfer_portal tp
+                JOIN athletes a ON tp.athlete_id = a.id
+                WHERE 1=1{filters}
+            """, *params)
+
+        return [dict(e) for e in entries], total
+
+    async def athlete_exists(self, athlete_id: int) -> bool:
+        found = await async_db_pool.fetchval("SELECT id FROM athletes WHERE id = $1", athlete_id)
+        return found is not None
+
+    async def has_open_entry(self, athlete_id: int) -> bool:
+        found = await async_db_pool.fetchval("""
+            SELECT id FROM transfer_portal
+            WHERE athlete_id = $1 AND status IN ('entered', 'exploring')
+            LIMIT 1
+        """, athlete_id)
+        return found is not None
+
+    async def enter_portal(self, athlete_id: int, from_school: str) -> int:
+        return await async_db_pool.fetchval("""
+            INSERT INTO transfer_portal (athlete_id, from_school, status, entry_date, created_at)
+            VALUES ($1, $2, 'entered', $3, $4)
+            RETURNING id
+        """, athlete_id, from_school, date.today(), datetime.now())
+
+    async def commit_to_school(self, entry_id: int, to_school: str) -> bool:
+        """Commit an open entry and move the athlete; False if not open"""
+        async with async_db_pool.transaction() as conn:
+            result = await conn.fetchrow("""
+                UPDATE transfer_portal
+                SET to_school = $1, status = 'committed', commitment_date = $2
+                WHERE id = $3 AND status IN ('entered', 'exploring')
+                RETURNING id, athlete_id
+            """, to_school, date.today(), entry_id)
+
+            if not result:
+                return False
+
+            # Update athlete's school
+            await conn.execute("""
+                UPDATE athletes SET school = $1 WHERE id = $2
+            """, to_school, result['athlete_id'])
+
+        return True
+
+    async def withdraw(self, entry_id: int) -> bool:
+        withdrawn = await async_db_pool.fetchval("""
+            UPDATE transfer_portal
+            SET status = 'withdrawn'
+            WHERE id = $1 AND status IN ('entered', 'exploring')
+            RETURNING id
+        """, entry_id)
+        return withdrawn is not None
+
+    async def get_stats(self) -> dict:
+        async with async_db_pool.acquire() as conn:
+            in_portal = await conn.fetchval(
+                "SELECT COUNT(*) FROM transfer_portal WHERE status = 'entered'"
+            )
+
+            committed = await conn.fetchval("""
+                SELECT COUNT(*) FROM transfer_portal
+                WHERE status = 'committed' AND EXTRACT(YEAR FROM commitment_date) = EXTRACT(YEAR FROM CURRENT_DATE)
+            """)
+
+            by_sport = await conn.fetch("""
+                SELECT a.sport, COUNT(*) as count
+                FROM transfer_portal tp
+                JOIN athletes a ON tp.athlete_id = a.id
+                WHERE tp.status = 'entered'
+                GROUP BY a.sport
+                ORDER BY count DESC
+            """)
+
+            top_destinations = await conn.fetch("""
+                SELECT to_school, COUNT(*) as count
+                FROM transfer_portal
+                WHERE status = 'committed' AND to_school IS NOT NULL
+                GROUP BY to_school
+                ORDER BY count DESC
+                LIMIT 10
+            """)
+
+        return {
+            "in_portal": in_portal,
+            "committed_this_year": committed,
+            "by_sport": [dict(s) for s in by_sport],
+            "top_destinations": [dict(d) for d in top_destinations]
+        }
+
+    async def search(
+        self,
+        query: Optional[str] = None,
+        sport: Optional[str] = None,
+        position: Optional[str] = None,
+        min_stars: Optional[int] = None
+    ) -> List[dict]:
+        sql = """
+            SELECT tp.*, a.sport, a.position as player_position, a.star_rating,
+                   u.full_name, a.graduation_year, a.height, a.weight, a.gpa
+            FROM transfer_portal tp
+            JOIN athletes a ON tp.athlete_id = a.id
+            JOIN users u ON a.user_id = u.id
+            WHERE tp.status = 'entered'
+        """
+        params = []
+
+        if query:
+            params.append(f"%{query}%")
+            sql += f" AND (u.full_name ILIKE ${len(params)} OR tp.from_school ILIKE ${len(params)})"
+
+        if sport:
+            params.append(sport)
+            sql += f" AND a.sport = ${len(params)}"
+
+        if position:
+            params.append(position)
+            sql += f" AND a.position = ${len(params)}"
+
+        if min_stars:
+            params.append(min_stars)
+            sql += f" AND a.star_rating >= ${len(params)}"
+
+        sql += " ORDER BY a.star_rating DESC, tp.entry_date DESC LIMIT 50"
+
+        return await async_db_pool.fetch(sql, *params)
+
+# Singleton instance
+transfer_portal_repository = TransferPortalRepository()
@@ -0,0 +1,71 @@
+"""
+🦁 ATHLYNX AI - User Repository
+Async data access for accounts and verification codes
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+@version 1.0
+"""
+
+from datetime import datetime
+from typing import Optional
+import logging
+
+from models.async_database import async_db_pool
+
+logger = logging.getLogger(__name__)
+
+class UserRepository:
+    """Async queries behind /api/auth"""
+
+    async def email_exists(self, email: str) -> bool:
+        found = await async_db_pool.fetchval("SELECT id FROM users WHERE email = $1", email)
+        return found is not None
+
+    async def create_user(
+        self,
+        email: str,
+        password_hash: str,
+        full_name: str,
+        phone: Optional[str],
+        role: str,
+        sport: Optional[str]
+    ) -> int:
+        return await async_db_pool.fetchval("""
+            INSERT INTO users (email, password_hash, full_name, phone, role, sport, created_at)
+            VALUES ($1, $2, $3, $4, $5, $6, $7)
+            RETURNING id
+        """, email, password_hash, full_name, phone, role, sport, datetime.now())
+
+    async def get_user_for_login(self, email: str) -> Optional[dict]:
+        """Login profile plus password_hash (verified by PasswordService)"""
+        return await async_db_pool.fetchrow("""
+            SELECT id, email, full_name, role, verified_email, verified_phone, subscription_tier,
+                   password_hash
+            FROM users
+            WHERE email = $1
+        """, email)
+
+    async def update_password_hash(self, user_id: int, old_hash: str, new_hash: str) -> bool:
+        """Swap in an upgraded hash unless the password changed meanwhile"""
+        result = await async_db_pool.execute("""
+            UPDATE users SET password_hash = $3, updated_at = NOW()
+            WHERE id = $1 AND password_hash = $2
+        """, user_id, old_hash, new_hash)
+        return result == "UPDATE 1"
+
+    async def get_user_by_email(self, email: str) -> Optional[dict]:
+        return await async_db_pool.fetchrow(
+            "SELECT id, full_name FROM users WHERE email = $1", email
+        )
+
+    async def create_password_reset(self, user_id: int, email: str, reset_token: str):
+        # Store reset token (would typically be in a separate table)
+        # For now, we'll use verification_codes
+        await async_db_pool.execute("""
+            INSERT INTO verification_codes (user_id, email, code, code_type, expires_at)
+            VALUES ($1, $2, $3, 'password_reset', NOW() + INTERVAL '1 hour')
+        """, user_id, email, reset_token)
+
+# Singleton instance
+user_repository = UserRepository()
@@ -0,0 +1,89 @@
+"""
+🦁 ATHLYNX AI - Verification Repository
+Async data access for email / SMS verification codes
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+@version 1.0
+"""
+
+from datetime import datetime
+from typing import Optional
+import logging
+
+from models.async_database import async_db_pool
+
+logger = logging.getLogger(__name__)
+
+# Recipient column and users flag per verification channel
+CHANNELS = {
+    "email": ("email", "verified_email"),
+    "sms": ("phone", "verified_phone"),
+}
+
+class VerificationRepository:
+    """Async queries behind VerificationCodeStore"""
+
+    async def insert_code(
+        self,
+        channel: str,
+        recipient: str,
+        code: str,
+        user_id: Optional[int],
+        expires_at: datetime
+    ) -> int:
+        column, _ = CHANNELS[channel]
+        return await async_db_pool.fetchval(f"""
+            INSERT INTO verification_codes (user_id, {column}, code, code_type, expires_at)
+            VALUES ($1, $2, $3, $4, $5)
+            RETURNING id
+        """, user_id, recipient, code, channel, expires_at)
+
+    async def find_active_code(self, channel: str, recipient: str, code: str) -> Optional[int]:
+        """Id of the newest unused, unexpired matching code"""
+        column, _ = CHANNELS[channel]
+        return await async_db_pool.fetchval(f"""
+            SELECT id FROM verification_codes
+            WHERE {column} = $1 AND code = $2 AND code_type = $3
+            AND expires_at > NOW() AND used = FALSE
+            ORDER BY created_at DESC LIMIT 1
+        """, recipient, code, channel)
+
+    async def consume_code(self, code_id: int, channel: str, recipient: str) -> bool:
+        """Mark a code used and its user verified; False if it was already used or expired"""
+        column, flag = CHANNELS[channel]
+        async with async_db_pool.transaction() as conn:
+            verification = await conn.fetchrow("""
+                UPDATE verification_codes SET used = TRUE
+                WHERE id = $1 AND used = FALSE AND expires_at > NOW()
+                RETURNING user_id
+            """, code_id)
+
+            if not verification:
+                return False
+
+            # Update user verification status
+            if verification['user_id']:
+                await conn.execute(f"UPDATE users SET {flag} = TRUE WHERE id = $1", verification['user_id'])
+            elif channel == "email":
+                await conn.execute(f"UPDATE users SET {flag} = TRUE WHERE {column} = $1", recipient)
+
+        return True
+
+    async def purge_codes(self, batch_size: int) -> int:
+        """Delete up to batch_size used or expired codes; returns how many went"""
+        return await async_db_pool.fetchval("""
+            WITH doomed AS (
+                (SELECT id FROM verification_codes WHERE used = TRUE LIMIT $1)
+                UNION
+                (SELECT id FROM verification_codes WHERE expires_at < NOW() LIMIT $1)
+            ), deleted AS (
+                DELETE FROM verification_codes
+                WHERE id IN (SELECT id FROM doomed)
+                RETURNING 1
+            )
+            SELECT COUNT(*) FROM deleted
+        """, batch_size)
+
+# Singleton instance
+verification_repository = VerificationRepository()
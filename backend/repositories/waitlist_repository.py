@@ -0,0 +1,119 @@
+"""
+🦁 ATHLYNX AI - VIP Waitlist Repository
+Async data access for early access & founding members
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+@version 1.0
+"""
+
+from datetime import datetime
+from typing import List, Optional
+import logging
+
+import asyncpg
+
+from models.async_database import async_db_pool
+
+logger = logging.getLogger(__name__)
+
+class WaitlistRepository:
+    """Async queries behind /api/waitlist"""
+
+    async def get_by_email(self, email: str) -> Optional[dict]:
+        return await async_db_pool.fetchrow("""
+            SELECT id, full_name, position, referral_code, created_at,
+                   COALESCE(rank_score, position) AS rank_score, rank_version
+            FROM waitlist WHERE email = $1
+        """, email)
+
+    async def get_by_referral_code(self, referral_code: str) -> Optional[dict]:
+        return await async_db_pool.fetchrow(
+            "SELECT id, email FROM waitlist WHERE referral_code = $1", referral_code
+        )
+
+    async def join(
+        self,
+        full_name: str,
+        email: str,
+        phone: Optional[str],
+        role: Optional[str],
+        sport: Optional[str],
+        referral_code: Optional[str] = None
+    ) -> Optional[dict]:
+        """Insert at the next position; returns {id, position, rank_score, rank_version, created_at}, or None if the email is taken"""
+        try:
+            # The counter row lock serializes allocation for one statement only;
+            # a failed insert rolls the increment back with it
+            return await async_db_pool.fetchrow("""
+                WITH next_position AS (
+                    UPDATE waitlist_position_counter
+                    SET last_position = last_position + 1
+                    RETURNING last_position
+                )
+                INSERT INTO waitlist
+                    (full_name, email, phone, role, sport, position, rank_score, referral_code, created_at)
+                SELECT $1, $2, $3, $4, $5, last_position, last_position, $6, $7
+                FROM next_position
+                RETURNING id, position, rank_score, rank_version, created_at
+            """, full_name, email, phone, role, sport, referral_code, datetime.now())
+        except asyncpg.UniqueViolationError:
+            return None
+
+    async def apply_boost(self, waitlist_id: int, points: int) -> Optional[dict]:
+        """Lower an entry's rank_score by points; returns {id, rank_score, rank_version}"""
+        return await async_db_pool.fetchrow("""
+            UPDATE waitlist SET
+                rank_score = COALESCE(rank_score, position) - $2,
+                rank_version = nextval('waitlist_rank_version_seq')
+            WHERE id = $1
+            RETURNING id, rank_score, rank_version
+        """, waitlist_id, points)
+
+    async def get_rank_keys(self, after_version: Optional[int] = None) -> List[dict]:
+        """(id, rank_score, rank_version) for every entry, or only those changed after a version"""
+        if after_version is None:
+            return await async_db_pool.fetch("""
+                SELECT id, COALESCE(rank_score, position) AS rank_score, rank_version
+                FROM waitlist
+                ORDER BY COALESCE(rank_score, position), id
+            """)
+        return await async_db_pool.fetch("""
+            SELECT id, COALESCE(rank_score, position) AS rank_score, rank_version
+            FROM waitlist
+            WHERE rank_version > $1
+            ORDER BY rank_version
+        """, after_version)
+
+    async def get_by_ids(self, waitlist_ids: List[int]) -> List[dict]:
+        return await async_db_pool.fetch("""
+            SELECT id, full_name, position, role, sport, created_at
+            FROM waitlist WHERE id = ANY($1::int[])
+        """, waitlist_ids)
+
+    async def get_stat_counts(self) -> List[dict]:
+        """Signup counts per role, sport and day plus the total, in one scan
+
+        ``grouping`` tells the rows apart: 7 = total, 3 = role, 5 = sport,
+        6 = day. ``max_id`` is the newest entry counted in each row.
+        """
+        return await async_db_pool.fetch("""
+            SELECT role, sport, DATE(created_at) AS day,
+                   GROUPING(role, sport, DATE(created_at)) AS grouping,
+                   COUNT(*) AS count,
+                   MAX(id) AS max_id
+            FROM waitlist
+            GROUP BY GROUPING SETS ((), (role), (sport), (DATE(created_at)))
+        """)
+
+    async def get_welcome_recipients(self) -> List[dict]:
+        """Every member with their current rank, as welcome email recipients"""
+        return await async_db_pool.fetch("""
+            SELECT email AS to_email, full_name,
+                   ROW_NUMBER() OVER (ORDER BY COALESCE(rank_score, position), id) AS waitlist_position
+            FROM waitlist
+            ORDER BY waitlist_position
+        """)
+
+# Singleton instance
+waitlist_repository = WaitlistRepository()
@@ -12,6 +12,8 @@ from .transfer_portal import router as transfer_portal_router
 from .nil_vault import router as nil_vault_router
 from .feed import router as feed_router
 from .messages import router as messages_router
+from .realtime import router as realtime_router
+from .dependencies import current_user
 
 __all__ = [
     'auth_router',
@@ -19,5 +21,7 @@ __all__ = [
     'transfer_portal_router',
     'nil_vault_router',
     'feed_router',
-    'messages_router'
+    'messages_router',
+    'realtime_router',
+    'current_user'
 ]
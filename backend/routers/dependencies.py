@@ -0,0 +1,37 @@
+"""
+🦁 ATHLYNX AI - Router Dependencies
+Shared FastAPI dependencies for authenticated routes
+
+    @router.get("/something")
+    async def handler(user: dict = Depends(current_user)):
+        ...
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+@version 1.0
+"""
+
+from typing import Optional
+
+from fastapi import Request, HTTPException
+
+from services.session_service import session_service
+
+def bearer_token(request: Request) -> Optional[str]:
+    """The token from an ``Authorization: Bearer <token>`` header"""
+    auth_header = request.headers.get("Authorization")
+    if not auth_header or not auth_header.startswith("Bearer "):
+        return None
+    return auth_header[len("Bearer "):].strip() or None
+
+async def current_user(request: Request) -> dict:
+    """The signed-in user; 401 without a live session (cache hits skip the database)"""
+    token = bearer_token(request)
+    user = await session_service.validate(token) if token else None
+    if user is None:
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid or expired session",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    return user
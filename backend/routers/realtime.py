@@ -0,0 +1,108 @@
+"""
+🦁 ATHLYNX AI - Real-Time Messaging Router
+WebSocket push for the messenger
+
+Connect to ``/ws/messages?token=<session token>`` (the token from
+/api/auth/login). Clients that cannot put it in the URL send it as the
+first frame instead: ``{"type": "auth", "token": "..."}``, within
+WS_AUTH_TIMEOUT seconds. The socket only carries events for the session's
+own user. A missing, expired or revoked token closes it with code 4401.
+The server sends JSON events:
+
+    {"type": "ready", "unread_count": 3}
+    {"type": "message", "message": {...}}          new message to or from you
+    {"type": "read", "reader_id": 7, "message_ids": [...]}
+    {"type": "deleted", "message_id": 42}
+    {"type": "resync"}                             refetch over REST
+    {"type": "pong"}                               reply to {"type": "ping"}
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+@version 1.0
+"""
+
+from typing import Optional
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+import asyncio
+import json
+import os
+import logging
+
+from services.message_broker import message_broker
+from services.session_service import session_service
+from services.unread_service import unread_service
+
+logger = logging.getLogger(__name__)
+
+# Seconds a client has to send {"type": "auth"} when the URL carries no token
+WS_AUTH_TIMEOUT = float(os.getenv("WS_AUTH_TIMEOUT", "10"))
+
+# Close code for an unauthenticated socket (4000-4999 are application codes)
+WS_CLOSE_UNAUTHORIZED = 4401
+
+router = APIRouter(tags=["Real-Time Messaging"])
+
+async def _pump(websocket: WebSocket, queue: asyncio.Queue):
+    """Forward broker events to the socket (the only task that sends)"""
+    while True:
+        event = await queue.get()
+        await websocket.send_text(json.dumps(event, default=str))
+
+async def _authenticate(websocket: WebSocket, token: Optional[str]) -> Optional[dict]:
+    """The session's user, from the URL token, a Bearer header or the first frame"""
+    if not token:
+        auth_header = websocket.headers.get("Authorization", "")
+        if auth_header.startswith("Bearer "):
+            token = auth_header[len("Bearer "):].strip()
+    if not token:
+        try:
+            data = json.loads(await asyncio.wait_for(websocket.receive_text(), timeout=WS_AUTH_TIMEOUT))
+        except (asyncio.TimeoutError, ValueError):
+            return None
+        if isinstance(data, dict) and data.get("type") == "auth" and isinstance(data.get("token"), str):
+            token = data["token"]
+    return await session_service.validate(token) if token else None
+
+@router.websocket("/ws/messages")
+async def messages_socket(websocket: WebSocket, token: Optional[str] = None):
+    """Push new messages and read receipts for the signed-in user"""
+    await websocket.accept()
+    try:
+        user = await _authenticate(websocket, token)
+    except WebSocketDisconnect:
+        return
+    except Exception as e:
+        logger.error(f"WebSocket auth error: {e}")
+        user = None
+    if user is None:
+        await websocket.close(code=WS_CLOSE_UNAUTHORIZED, reason="Invalid or expired session")
+        return
+
+    user_id = user['id']
+    queue = await message_broker.subscribe(user_id)
+    sender = asyncio.create_task(_pump(websocket, queue))
+
+    try:
+        try:
+            unread_count = await unread_service.get(user_id)
+        except Exception as e:
+            logger.error(f"WebSocket unread count error: {e}")
+            unread_count = None
+        queue.put_nowait({"type": "ready", "unread_count": unread_count})
+
+        while True:
+            raw = await websocket.receive_text()
+            try:
+                data = json.loads(raw)
+            except ValueError:
+                continue
+            if isinstance(data, dict) and data.get("type") == "ping" and not queue.full():
+                queue.put_nowait({"type": "pong"})
+
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.error(f"WebSocket error for user {user_id}: {e}")
+    finally:
+        sender.cancel()
+        message_broker.unsubscribe(user_id, queue)
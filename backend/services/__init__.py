@@ -8,7 +8,21 @@ AWS SES, SNS, and Verification Services
 
 from .email_service import email_service, EmailService
 from .sms_service import sms_service, SMSService
+from .verification_code_store import verification_code_store, VerificationCodeStore
 from .verification_service import verification_service, VerificationService
+from .timeline_service import timeline_service, TimelineService
+from .counter_service import counter_service, CounterService
+from .trending_service import trending_service, TrendingService
+from .unread_service import unread_service, UnreadService
+from .message_broker import message_broker, MessageBroker
+from .waitlist_rank_service import waitlist_rank_service, WaitlistRankService
+from .waitlist_stats_service import waitlist_stats_service, WaitlistStatsService
+from .platform_stats_service import platform_stats_service, PlatformStatsService
+from .analytics_service import analytics_service, AnalyticsService
+from .analytics_rollup_service import analytics_rollup_service, AnalyticsRollupService
+from .password_service import password_service, PasswordService, PasswordHasherBusy
+from .session_service import session_service, SessionService
+from .notification_queue import notification_queue, NotificationQueue
 
 __all__ = [
     'email_service',
@@ -16,5 +30,34 @@ __all__ = [
     'sms_service',
     'SMSService',
     'verification_service',
-    'VerificationService'
+    'VerificationService',
+    'verification_code_store',
+    'VerificationCodeStore',
+    'timeline_service',
+    'TimelineService',
+    'counter_service',
+    'CounterService',
+    'trending_service',
+    'TrendingService',
+    'unread_service',
+    'UnreadService',
+    'message_broker',
+    'MessageBroker',
+    'waitlist_rank_service',
+    'WaitlistRankService',
+    'waitlist_stats_service',
+    'WaitlistStatsService',
+    'platform_stats_service',
+    'PlatformStatsService',
+    'analytics_service',
+    'AnalyticsService',
+    'analytics_rollup_service',
+    'AnalyticsRollupService',
+    'password_service',
+    'PasswordService',
+    'PasswordHasherBusy',
+    'session_service',
+    'SessionService',
+    'notification_queue',
+    'NotificationQueue'
 ]
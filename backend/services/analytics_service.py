@@ -0,0 +1,402 @@
+"""
+🦁 ATHLYNX AI - Analytics Ingestion Service
+Buffered bulk writes for /api/analytics/track
+
+Tracking is the highest-volume write path, so events are appended to an
+in-memory buffer and acknowledged without touching the database. The
+buffer is written every ANALYTICS_FLUSH_INTERVAL seconds, or as soon as
+ANALYTICS_FLUSH_SIZE events are waiting, as one multi-row INSERT.
+
+Events are validated before they are queued (``track`` and ``track_batch``
+raise ValueError; the endpoints answer 400), so one malformed event cannot
+fail the shared INSERT for everyone else.
+
+Backpressure: once ANALYTICS_BUFFER_MAX events are waiting, ``track``
+waits up to ANALYTICS_BACKPRESSURE_TIMEOUT seconds for a flush to make
+room and then rejects the event (the endpoint answers 503).
+
+``track_batch`` (POST /api/analytics/track/batch) takes up to
+ANALYTICS_BATCH_MAX events at once, given as a JSON array or NDJSON. The
+batch is validated up front and queued as a unit, so it lands in the
+same multi-row INSERT instead of costing a request per event.
+
+If the database is unreachable a batch is appended to a per-process
+NDJSON spool file in ANALYTICS_SPOOL_DIR instead of being dropped. Spool
+files are replayed after the next successful write, including files left
+behind by worker processes that are no longer running; a worker claims
+such a file by renaming it to carry its own pid, so two workers can never
+replay the same file. Rows the database
+rejects outright (bad data rather than a lost connection) are bisected out
+of their batch and set aside in ``analytics-rejected.ndjson`` so they
+cannot hold up the rest. stop() flushes what is left on shutdown.
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+@version 1.0
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+import asyncio
+import asyncpg
+import json
+import os
+import re
+import logging
+
+from repositories.analytics_repository import analytics_repository, AnalyticsEvent
+
+logger = logging.getLogger(__name__)
+
+# Analytics buffer configuration (per worker process)
+ANALYTICS_FLUSH_INTERVAL = float(os.getenv("ANALYTICS_FLUSH_INTERVAL", "1.0"))
+ANALYTICS_FLUSH_SIZE = int(os.getenv("ANALYTICS_FLUSH_SIZE", "1000"))
+ANALYTICS_BUFFER_MAX = int(os.getenv("ANALYTICS_BUFFER_MAX", "50000"))
+ANALYTICS_BACKPRESSURE_TIMEOUT = float(os.getenv("ANALYTICS_BACKPRESSURE_TIMEOUT", "0.5"))
+ANALYTICS_SPOOL_DIR = os.getenv("ANALYTICS_SPOOL_DIR", "./spool")
+ANALYTICS_BATCH_MAX = int(os.getenv("ANALYTICS_BATCH_MAX", "1000"))
+
+# analytics-<owner pid>.ndjson, or analytics-<owner pid>-<earlier name>.ndjson once claimed
+_SPOOL_FILE = re.compile(r"^analytics-(\d+)(-[\d-]+)?\.ndjson$")
+_REJECTED_FILE = "analytics-rejected.ndjson"
+
+# Errors caused by the rows themselves; retrying the same batch cannot succeed
+_ROW_ERRORS = (asyncpg.DataError, asyncpg.IntegrityConstraintViolationError)
+
+def parse_batch(body: bytes) -> List[Any]:
+    """Decode a batch body: a JSON array, or NDJSON (one event per line)"""
+    text = body.decode("utf-8").strip()
+    if text.startswith("["):
+        events = json.loads(text)
+    else:
+        events = []
+        for number, line in enumerate(text.splitlines(), 1):
+            if line.strip():
+                try:
+                    events.append(json.loads(line))
+                except ValueError as e:
+                    raise ValueError(f"line {number}: {e}")
+    if not isinstance(events, list):
+        raise ValueError("expected a JSON array or NDJSON")
+    return events
+
+def _validate(event: Any) -> Optional[str]:
+    """Why an event would fail to insert, or None if it is fine"""
+    if not isinstance(event, dict):
+        return "event must be an object"
+    event_type = event.get("event_type")
+    if not isinstance(event_type, str) or not event_type or len(event_type) > 100:
+        return "event_type must be a string of 1-100 characters"
+    user_id = event.get("user_id")
+    if user_id is not None and (isinstance(user_id, bool) or not isinstance(user_id, int)):
+        return "user_id must be an integer"
+    if not isinstance(event.get("event_data", {}), (dict, type(None))):
+        return "event_data must be an object"
+    return None
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+def _to_line(event: AnalyticsEvent) -> str:
+    user_id, event_type, event_data, ip_address, user_agent, created_at = event
+    return json.dumps({
+        "user_id": user_id,
+        "event_type": event_type,
+        "event_data": event_data,
+        "ip_address": ip_address,
+        "user_agent": user_agent,
+        "created_at": created_at.isoformat()
+    }, default=str) + "\n"
+
+def _from_line(line: str) -> AnalyticsEvent:
+    data = json.loads(line)
+    return (
+        data["user_id"],
+        data["event_type"],
+        data["event_data"],
+        data["ip_address"],
+        data["user_agent"],
+        datetime.fromisoformat(data["created_at"])
+    )
+
+class AnalyticsService:
+    """Buffered, batched analytics_events ingestion"""
+
+    def __init__(
+        self,
+        flush_interval: float = ANALYTICS_FLUSH_INTERVAL,
+        flush_size: int = ANALYTICS_FLUSH_SIZE,
+        buffer_max: int = ANALYTICS_BUFFER_MAX,
+        backpressure_timeout: float = ANALYTICS_BACKPRESSURE_TIMEOUT,
+        spool_dir: str = ANALYTICS_SPOOL_DIR,
+        batch_max: int = ANALYTICS_BATCH_MAX
+    ):
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self.buffer_max = buffer_max
+        self.backpressure_timeout = backpressure_timeout
+        self.spool_dir = Path(spool_dir)
+        self.batch_max = batch_max
+
+        self._buffer: List[AnalyticsEvent] = []
+        self._task = None
+        self._wakeup = None
+        self._space = None
+        self._flush_lock = None
+        self._stopping = False
+        self._spool_pending = True     # check for leftovers from earlier processes once
+        self._stats = {
+            "accepted": 0,
+            "rejected": 0,
+            "batches": 0,
+            "flushes": 0,
+            "rows_flushed": 0,
+            "flush_errors": 0,
+            "rows_spooled": 0,
+            "rows_replayed": 0,
+            "rows_rejected": 0
+        }
+
+    def _ensure_started(self):
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._space = asyncio.Event()
+            self._flush_lock = asyncio.Lock()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _wait_for_space(self, count: int):
+        while self._buffer and len(self._buffer) + count > self.buffer_max:
+            self._space.clear()
+            await self._space.wait()
+
+    async def _make_room(self, count: int) -> bool:
+        """Wait (bounded) until count more events fit; False if they never did"""
+        if not self._buffer or len(self._buffer) + count <= self.buffer_max:
+            return True
+        self._wakeup.set()
+        try:
+            await asyncio.wait_for(self._wait_for_space(count), timeout=self.backpressure_timeout)
+        except asyncio.TimeoutError:
+            self._stats["rejected"] += count
+            return False
+        return True
+
+    async def track(
+        self,
+        user_id: Optional[int],
+        event_type: Optional[str],
+        event_data: Optional[dict] = None,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None
+    ) -> bool:
+        """Queue one event; False if the buffer stayed full (caller should retry later)
+
+        Raises ValueError if the event would not insert.
+        """
+        error = _validate({"user_id": user_id, "event_type": event_type, "event_data": event_data})
+        if error:
+            raise ValueError(error)
+
+        self._ensure_started()
+        if not await self._make_room(1):
+            return False
+
+        self._buffer.append((user_id, event_type, event_data, ip_address, user_agent, datetime.now()))
+        self._stats["accepted"] += 1
+        if len(self._buffer) >= self.flush_size:
+            self._wakeup.set()
+        return True
+
+    async def track_batch(
+        self,
+        events: List[Any],
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None
+    ) -> bool:
+        """Validate and queue a whole batch; all or nothing
+
+        Raises ValueError naming the first bad event. False means the
+        buffer had no room for the batch (caller should retry later).
+        """
+        if len(events) > self.batch_max:
+            raise ValueError(f"at most {self.batch_max} events per batch")
+        for index, event in enumerate(events):
+            error = _validate(event)
+            if error:
+                raise ValueError(f"event {index}: {error}")
+
+        self._ensure_started()
+        if not await self._make_room(len(events)):
+            return False
+
+        now = datetime.now()
+        self._buffer.extend(
+            (event.get("user_id"), event["event_type"], event.get("event_data", {}), ip_address, user_agent, now)
+            for event in events
+        )
+        self._stats["accepted"] += len(events)
+        self._stats["batches"] += 1
+        if len(self._buffer) >= self.flush_size:
+            self._wakeup.set()
+        return True
+
+    # ------------------------------------------------------------------
+    # Flushing
+    # ------------------------------------------------------------------
+
+    async def flush(self):
+        """Write everything buffered; spool it to disk if the database is down"""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            batch, self._buffer = self._buffer, []
+            if self._space is not None:
+                self._space.set()
+
+            if batch:
+                rejected, unwritten = await self._insert(batch)
+                if unwritten:
+                    self._stats["flush_errors"] += 1
+                    logger.error(f"Analytics flush error - spooling {len(unwritten)} events")
+                    await asyncio.to_thread(self._spool, unwritten)
+                    return
+                self._stats["flushes"] += 1
+                self._stats["rows_flushed"] += len(batch) - rejected
+
+            if self._spool_pending:
+                await self._replay_spool()
+
+    async def _insert(self, events: List[AnalyticsEvent]) -> Tuple[int, List[AnalyticsEvent]]:
+        """Insert events, bisecting around rows the database rejects
+
+        Returns (rows rejected, rows left unwritten). The second list is
+        empty unless some other error (a lost connection, say) stopped the
+        insert partway; those rows were not written and should be kept.
+        """
+        rejected = 0
+        pending = [events]
+        while pending:
+            part = pending.pop()
+            try:
+                await analytics_repository.insert_events(part)
+            except _ROW_ERRORS as e:
+                if len(part) > 1:
+                    middle = len(part) // 2
+                    pending += [part[middle:], part[:middle]]
+                    continue
+                logger.error(f"Analytics event rejected: {e}")
+                await asyncio.to_thread(self._reject, part)
+                rejected += 1
+            except Exception as e:
+                unwritten = [event for piece in [part] + pending[::-1] for event in piece]
+                logger.error(f"Analytics insert error: {e} - {len(unwritten)} events not written")
+                return rejected, unwritten
+        return rejected, []
+
+    def _reject(self, events: List[AnalyticsEvent]):
+        self._stats["rows_rejected"] += len(events)
+        try:
+            self.spool_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.spool_dir / _REJECTED_FILE, "a", encoding="utf-8") as rejected:
+                rejected.writelines(_to_line(event) for event in events)
+        except Exception as e:
+            logger.error(f"Analytics spool error: {e} - {len(events)} rejected events lost")
+
+    def _spool_path(self) -> Path:
+        return self.spool_dir / f"analytics-{os.getpid()}.ndjson"
+
+    def _spool(self, batch: List[AnalyticsEvent]):
+        try:
+            self.spool_dir.mkdir(parents=True, exist_ok=True)
+            with open(self._spool_path(), "a", encoding="utf-8") as spool:
+                spool.writelines(_to_line(event) for event in batch)
+            self._spool_pending = True
+            self._stats["rows_spooled"] += len(batch)
+        except Exception as e:
+            logger.error(f"Analytics spool error: {e} - {len(batch)} events lost")
+
+    def _spool_files(self) -> List[Path]:
+        """Our own spools plus any left by processes that have exited, claimed for us"""
+        if not self.spool_dir.is_dir():
+            return []
+        pid = os.getpid()
+        files = []
+        for path in sorted(self.spool_dir.iterdir()):
+            match = _SPOOL_FILE.match(path.name)
+            if not match:
+                continue
+            owner = int(match.group(1))
+            if owner == pid:
+                files.append(path)
+            elif not _pid_alive(owner):
+                # The rename is atomic: if another worker got there first it fails
+                claimed = path.with_name(f"analytics-{pid}-{path.name[len('analytics-'):]}")
+                try:
+                    os.rename(path, claimed)
+                except OSError:
+                    continue
+                files.append(claimed)
+        return files
+
+    async def _replay_spool(self):
+        """Re-insert spooled events; a failure keeps the rest for next time"""
+        for path in await asyncio.to_thread(self._spool_files):
+            lines = (await asyncio.to_thread(path.read_text, encoding="utf-8")).splitlines(keepends=True)
+            for start in range(0, len(lines), self.flush_size):
+                chunk = lines[start:start + self.flush_size]
+                events = []
+                for line in chunk:
+                    try:
+                        events.append(_from_line(line))
+                    except (ValueError, KeyError) as e:
+                        logger.error(f"Skipping unreadable spooled analytics event: {e}")
+                rejected, unwritten = await self._insert(events)
+                if unwritten:
+                    # Keep what this chunk did not write plus every later chunk
+                    logger.error(f"Analytics spool replay stopped - keeping the rest of {path.name}")
+                    rest = "".join(_to_line(event) for event in unwritten) + "".join(lines[start + len(chunk):])
+                    remaining = path.with_suffix(".tmp")
+                    await asyncio.to_thread(remaining.write_text, rest, encoding="utf-8")
+                    await asyncio.to_thread(os.replace, remaining, path)
+                    return
+                self._stats["rows_replayed"] += len(events) - rejected
+            await asyncio.to_thread(path.unlink)
+            logger.info(f"✅ Replayed {len(lines)} spooled analytics events from {path.name}")
+        self._spool_pending = False
+
+    async def _run(self):
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Analytics flusher error: {e}")
+
+    async def stop(self):
+        """Stop the flusher and write out whatever is still buffered"""
+        if self._task is not None:
+            # Let the flusher finish its current batch and exit on its own
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+            self._stopping = False
+        await self.flush()
+        logger.info("✅ Analytics events flushed")
+
+    def stats(self) -> dict:
+        return {"buffered": len(self._buffer), **self._stats}
+
+# Singleton instance
+analytics_service = AnalyticsService()
@@ -0,0 +1,157 @@
+"""
+🦁 ATHLYNX AI - Engagement Counter Service
+Write-coalescing buffer for feed like/share counters
+
+Likes and shares no longer ``UPDATE feed_posts`` per request - on a viral
+post every request would queue on that one row lock. Increments are
+summed in memory per post and flushed every COUNTER_FLUSH_INTERVAL
+seconds (or once COUNTER_FLUSH_MAX_POSTS posts are pending) as a single
+``UPDATE ... FROM unnest(...)``. Reads add the unflushed deltas to the
+stored counters, so a user sees their own like immediately.
+
+A failed flush puts its deltas back for the next attempt; stop() flushes
+what is left on shutdown.
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+@version 1.0
+"""
+
+from typing import Callable, Dict, List
+import asyncio
+import os
+import logging
+
+from repositories.feed_repository import feed_repository
+
+logger = logging.getLogger(__name__)
+
+# Counter buffer configuration (per worker process)
+COUNTER_FLUSH_INTERVAL = float(os.getenv("COUNTER_FLUSH_INTERVAL", "1.0"))
+COUNTER_FLUSH_MAX_POSTS = int(os.getenv("COUNTER_FLUSH_MAX_POSTS", "500"))
+
+COUNTER_FIELDS = ("likes_count", "shares_count")
+
+class CounterService:
+    """Buffered likes_count / shares_count increments"""
+
+    def __init__(
+        self,
+        flush_interval: float = COUNTER_FLUSH_INTERVAL,
+        flush_max_posts: int = COUNTER_FLUSH_MAX_POSTS
+    ):
+        self.flush_interval = flush_interval
+        self.flush_max_posts = flush_max_posts
+
+        self._pending: Dict[int, Dict[str, int]] = {}
+        self._flush_listeners: List[Callable[[Dict[int, Dict[str, int]]], None]] = []
+        self._task = None
+        self._wakeup = None
+        self._flush_lock = None
+        self._stats = {
+            "increments": 0,
+            "flushes": 0,
+            "rows_flushed": 0,
+            "flush_errors": 0
+        }
+
+    def add_flush_listener(self, listener: Callable[[Dict[int, Dict[str, int]]], None]):
+        """Called with {post_id: deltas} after each successful flush"""
+        self._flush_listeners.append(listener)
+
+    def _ensure_started(self):
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._flush_lock = asyncio.Lock()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def increment(self, post_id: int, field: str, delta: int = 1):
+        """Buffer a counter change; must be called from the event loop"""
+        self._ensure_started()
+        deltas = self._pending.setdefault(post_id, {name: 0 for name in COUNTER_FIELDS})
+        deltas[field] += delta
+        self._stats["increments"] += 1
+        if len(self._pending) >= self.flush_max_posts:
+            self._wakeup.set()
+
+    def pending(self, post_id: int, field: str) -> int:
+        deltas = self._pending.get(post_id)
+        return deltas[field] if deltas else 0
+
+    def apply_pending(self, posts: List[dict]) -> List[dict]:
+        """Copies of posts with unflushed deltas added to their counters"""
+        if not self._pending:
+            return posts
+        merged = []
+        for post in posts:
+            deltas = self._pending.get(post.get('id'))
+            if deltas:
+                post = dict(post)
+                for field, delta in deltas.items():
+                    post[field] = max(0, (post.get(field) or 0) + delta)
+            merged.append(post)
+        return merged
+
+    async def flush(self):
+        """Write all buffered deltas in one statement"""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, {}
+
+            # Sorted ids keep concurrent flushes from different workers lock-ordered
+            post_ids = sorted(batch)
+            try:
+                await feed_repository.apply_counter_deltas(
+                    post_ids,
+                    [batch[post_id]["likes_count"] for post_id in post_ids],
+                    [batch[post_id]["shares_count"] for post_id in post_ids]
+                )
+            except Exception as e:
+                self._stats["flush_errors"] += 1
+                logger.error(f"Counter flush error: {e}")
+                for post_id, deltas in batch.items():
+                    current = self._pending.setdefault(post_id, {name: 0 for name in COUNTER_FIELDS})
+                    for field, delta in deltas.items():
+                        current[field] += delta
+                return
+
+            self._stats["flushes"] += 1
+            self._stats["rows_flushed"] += len(batch)
+
+        for listener in self._flush_listeners:
+            try:
+                listener(batch)
+            except Exception as e:
+                logger.error(f"Counter flush listener error: {e}")
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def stop(self):
+        """Cancel the flusher and write out whatever is still buffered"""
+        if self._task is not None:
+            # Cancel between flushes so an in-flight batch is never dropped
+            async with self._flush_lock:
+                self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+        logger.info("✅ Engagement counters flushed")
+
+    def stats(self) -> dict:
+        return {"pending_posts": len(self._pending), **self._stats}
+
+# Singleton instance
+counter_service = CounterService()
@@ -2,6 +2,17 @@
 🦁 ATHLYNX AI - AWS SES Email Service
 Triple-Channel Verification System
 
+Email bodies live in ``templates/email/<name>.html`` and ``.txt``. They
+are compiled once, when the service is created, and each send only
+renders the cached templates.
+
+``send_bulk_email`` sends one template to many recipients. The template
+is rendered once with SES placeholders in place of the per-recipient
+fields and stored in SES (under a name versioned by its content). The
+recipients then go out in ``SendBulkTemplatedEmail`` calls of up to
+SES_BULK_MAX_DESTINATIONS (at most 50) each, one API request per 50
+emails instead of one per email.
+
 @author ATHLYNX AI Corporation
 @date January 12, 2026
 @version 1.0
@@ -9,9 +20,13 @@ Triple-Channel Verification System
 
 import boto3
 from botocore.exceptions import ClientError
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+from pathlib import Path
+import hashlib
+import json
 import os
 import logging
-from typing import Optional, List
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -22,10 +37,37 @@ AWS_ACCESS_KEY = os.getenv("AWS_ACCESS_KEY_ID")
 AWS_SECRET_KEY = os.getenv("AWS_SECRET_ACCESS_KEY")
 SENDER_EMAIL = os.getenv("SENDER_EMAIL", "noreply@athlynx.ai")
 
+# Email template configuration
+EMAIL_TEMPLATE_DIR = os.getenv("EMAIL_TEMPLATE_DIR", str(Path(__file__).resolve().parent.parent / "templates" / "email"))
+SES_TEMPLATE_PREFIX = os.getenv("SES_TEMPLATE_PREFIX", "athlynx")
+SES_BULK_MAX_DESTINATIONS = min(50, int(os.getenv("SES_BULK_MAX_DESTINATIONS", "50")))
+
+# Template name -> (subject, per-recipient fields)
+EMAIL_TEMPLATES = {
+    "verification": ("🦁 ATHLYNX - Verify Your Email", ("full_name", "code")),
+    "welcome": ("🦁 Welcome to ATHLYNX VIP Waitlist!", ("full_name", "waitlist_position")),
+    "nil_deal": ("🎉 New NIL Deal: {{ brand_name }}", ("full_name", "brand_name", "deal_value")),
+}
+
+VIP_BENEFITS = [
+    "7 Days FREE VIP Access",
+    "Early Access to All 10 Apps",
+    "Exclusive NIL Opportunities",
+    "Founding Member Badge",
+    "Priority Support",
+]
+
+def _display(fields: dict) -> dict:
+    """Field values as they appear in an email"""
+    values = dict(fields)
+    if isinstance(values.get("deal_value"), (int, float)):
+        values["deal_value"] = f"{values['deal_value']:,.2f}"
+    return values
+
 class EmailService:
     """AWS SES Email Service for ATHLYNX"""
     
-    def __init__(self):
+    def __init__(self, template_dir: str = EMAIL_TEMPLATE_DIR):
         self.client = boto3.client(
             'ses',
             region_name=AWS_REGION,
@@ -33,205 +75,102 @@ class EmailService:
             aws_secret_access_key=AWS_SECRET_KEY
         )
         self.sender = SENDER_EMAIL
+        
+        # Compile every template up front; renders never touch the disk
+        self.env = Environment(
+            loader=FileSystemLoader(template_dir),
+            autoescape=select_autoescape(["html"], default_for_string=False),
+            auto_reload=False,
+            trim_blocks=True,
+            lstrip_blocks=True
+        )
+        self.env.globals["benefits"] = VIP_BENEFITS
+        self.templates = {
+            name: (
+                self.env.from_string(subject),
+                self.env.get_template(f"{name}.html"),
+                self.env.get_template(f"{name}.txt")
+            )
+            for name, (subject, _) in EMAIL_TEMPLATES.items()
+        }
+        self._ses_templates: Dict[str, str] = {}
+    
+    def render(self, name: str, **fields) -> Tuple[str, str, str]:
+        """(subject, html body, text body) for one recipient"""
+        subject, html, text = self.templates[name]
+        values = _display(fields)
+        return subject.render(values), html.render(values), text.render(values)
     
     def send_verification_email(self, to_email: str, code: str, full_name: str) -> bool:
         """Send verification code email"""
-        subject = "🦁 ATHLYNX - Verify Your Email"
-        
-        html_body = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                body {{ font-family: 'Arial', sans-serif; background-color: #0a1628; color: white; }}
-                .container {{ max-width: 600px; margin: 0 auto; padding: 40px; }}
-                .logo {{ text-align: center; margin-bottom: 30px; }}
-                .code-box {{ 
-                    background: linear-gradient(135deg, #00d4ff, #0066ff);
-                    padding: 20px;
-                    border-radius: 10px;
-                    text-align: center;
-                    font-size: 32px;
-                    letter-spacing: 8px;
-                    font-weight: bold;
-                    margin: 30px 0;
-                }}
-                .footer {{ text-align: center; margin-top: 40px; color: #888; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="logo">
-                    <h1>🦁 ATHLYNX AI</h1>
-                    <p>The Athlete's Playbook</p>
-                </div>
-                
-                <h2>Welcome, {full_name}!</h2>
-                <p>Your verification code is:</p>
-                
-                <div class="code-box">{code}</div>
-                
-                <p>This code expires in 10 minutes.</p>
-                <p>If you didn't request this, please ignore this email.</p>
-                
-                <div class="footer">
-                    <p>Dreams Do Come True 2026! 🚀</p>
-                    <p>© 2026 ATHLYNX AI Corporation</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-        
-        text_body = f"""
-        ATHLYNX AI - Email Verification
-        
-        Welcome, {full_name}!
-        
-        Your verification code is: {code}
-        
-        This code expires in 10 minutes.
-        
-        Dreams Do Come True 2026!
-        © 2026 ATHLYNX AI Corporation
-        """
-        
-        return self._send_email(to_email, subject, html_body, text_body)
+        return self._send_email(to_email, *self.render("verification", full_name=full_name, code=code))
     
     def send_welcome_email(self, to_email: str, full_name: str, waitlist_position: int) -> bool:
         """Send welcome email to new waitlist member"""
-        subject = "🦁 Welcome to ATHLYNX VIP Waitlist!"
-        
-        html_body = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                body {{ font-family: 'Arial', sans-serif; background-color: #0a1628; color: white; }}
-                .container {{ max-width: 600px; margin: 0 auto; padding: 40px; }}
-                .position-box {{ 
-                    background: linear-gradient(135deg, #ffd700, #ff8c00);
-                    padding: 30px;
-                    border-radius: 15px;
-                    text-align: center;
-                    margin: 30px 0;
-                }}
-                .position-number {{ font-size: 48px; font-weight: bold; }}
-                .benefits {{ background: rgba(255,255,255,0.1); padding: 20px; border-radius: 10px; }}
-                .benefit-item {{ padding: 10px 0; border-bottom: 1px solid rgba(255,255,255,0.1); }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>🦁 Welcome to ATHLYNX AI!</h1>
-                
-                <p>Hey {full_name},</p>
-                <p>You're officially on the VIP Waitlist!</p>
-                
-                <div class="position-box">
-                    <p>Your Position</p>
-                    <div class="position-number">#{waitlist_position}</div>
-                    <p>of 10,000 Founding Members</p>
-                </div>
-                
-                <div class="benefits">
-                    <h3>🎁 Your VIP Benefits:</h3>
-                    <div class="benefit-item">✅ 7 Days FREE VIP Access</div>
-                    <div class="benefit-item">✅ Early Access to All 10 Apps</div>
-                    <div class="benefit-item">✅ Exclusive NIL Opportunities</div>
-                    <div class="benefit-item">✅ Founding Member Badge</div>
-                    <div class="benefit-item">✅ Priority Support</div>
-                </div>
-                
-                <p style="margin-top: 30px;">
-                    <strong>Launch Date: February 1, 2026</strong>
-                </p>
-                
-                <p>Dreams Do Come True 2026! 🚀</p>
-                <p>- Chad Dozier & The ATHLYNX Team</p>
-            </div>
-        </body>
-        </html>
-        """
-        
-        text_body = f"""
-        Welcome to ATHLYNX AI!
-        
-        Hey {full_name},
-        
-        You're officially on the VIP Waitlist!
-        Your Position: #{waitlist_position} of 10,000 Founding Members
-        
-        Your VIP Benefits:
-        - 7 Days FREE VIP Access
-        - Early Access to All 10 Apps
-        - Exclusive NIL Opportunities
-        - Founding Member Badge
-        - Priority Support
-        
-        Launch Date: February 1, 2026
-        
-        Dreams Do Come True 2026!
-        - Chad Dozier & The ATHLYNX Team
-        """
-        
-        return self._send_email(to_email, subject, html_body, text_body)
+        return self._send_email(to_email, *self.render("welcome", full_name=full_name, waitlist_position=waitlist_position))
     
     def send_nil_deal_notification(self, to_email: str, full_name: str, brand_name: str, deal_value: float) -> bool:
         """Send NIL deal notification"""
-        subject = f"🎉 New NIL Deal: {brand_name}"
-        
-        html_body = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                body {{ font-family: 'Arial', sans-serif; background-color: #0a1628; color: white; }}
-                .container {{ max-width: 600px; margin: 0 auto; padding: 40px; }}
-                .deal-box {{ 
-                    background: linear-gradient(135deg, #00ff88, #00d4ff);
-                    padding: 30px;
-                    border-radius: 15px;
-                    text-align: center;
-                    margin: 30px 0;
-                    color: #000;
-                }}
-                .deal-value {{ font-size: 48px; font-weight: bold; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>🎉 Congratulations, {full_name}!</h1>
-                
-                <p>You have a new NIL deal opportunity!</p>
-                
-                <div class="deal-box">
-                    <h2>{brand_name}</h2>
-                    <div class="deal-value">${deal_value:,.2f}</div>
-                </div>
-                
-                <p>Log in to your ATHLYNX dashboard to review and accept this deal.</p>
-                
-                <p>Dreams Do Come True 2026! 🚀</p>
-            </div>
-        </body>
-        </html>
-        """
-        
-        text_body = f"""
-        Congratulations, {full_name}!
-        
-        You have a new NIL deal opportunity!
-        
-        Brand: {brand_name}
-        Value: ${deal_value:,.2f}
-        
-        Log in to your ATHLYNX dashboard to review and accept this deal.
+        return self._send_email(to_email, *self.render(
+            "nil_deal", full_name=full_name, brand_name=brand_name, deal_value=deal_value
+        ))
+    
+    def _ses_template(self, name: str) -> str:
+        """Name of the SES copy of a template, created on first use"""
+        if name in self._ses_templates:
+            return self._ses_templates[name]
+        
+        # Per-recipient fields become SES placeholders, filled in per destination
+        placeholders = {field: f"{{{{{field}}}}}" for field in EMAIL_TEMPLATES[name][1]}
+        subject, html, text = self.templates[name]
+        content = {
+            "SubjectPart": subject.render(placeholders),
+            "HtmlPart": html.render(placeholders),
+            "TextPart": text.render(placeholders)
+        }
+        digest = hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()[:12]
+        ses_name = f"{SES_TEMPLATE_PREFIX}-{name}-{digest}"
+        try:
+            self.client.create_template(Template={"TemplateName": ses_name, **content})
+            logger.info(f"✅ SES template created: {ses_name}")
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'AlreadyExists':
+                raise
+        self._ses_templates[name] = ses_name
+        return ses_name
+    
+    def send_bulk_email(self, name: str, recipients: List[dict]) -> List[dict]:
+        """Send a template to many recipients; returns the recipients SES did not accept
         
-        Dreams Do Come True 2026!
+        Each recipient is a dict with ``to_email`` and the template's fields.
+        Errors that fail a whole call (throttling, credentials) propagate.
         """
+        template = self._ses_template(name)
+        failed = []
+        for start in range(0, len(recipients), SES_BULK_MAX_DESTINATIONS):
+            chunk = recipients[start:start + SES_BULK_MAX_DESTINATIONS]
+            response = self.client.send_bulk_templated_email(
+                Source=self.sender,
+                Template=template,
+                DefaultTemplateData="{}",
+                Destinations=[
+                    {
+                        "Destination": {"ToAddresses": [recipient["to_email"]]},
+                        "ReplacementTemplateData": json.dumps(
+                            _display({field: recipient.get(field) for field in EMAIL_TEMPLATES[name][1]}),
+                            default=str
+                        )
+                    }
+                    for recipient in chunk
+                ]
+            )
+            for recipient, status in zip(chunk, response['Status']):
+                if status['Status'] != 'Success':
+                    logger.error(f"❌ Bulk email to {recipient['to_email']} failed: {status.get('Error', status['Status'])}")
+                    failed.append(recipient)
         
-        return self._send_email(to_email, subject, html_body, text_body)
+        logger.info(f"✅ Bulk {name} email sent to {len(recipients) - len(failed)}/{len(recipients)} recipients")
+        return failed
     
     def _send_email(self, to_email: str, subject: str, html_body: str, text_body: str) -> bool:
         """Internal method to send email via AWS SES"""
@@ -0,0 +1,211 @@
+"""
+🦁 ATHLYNX AI - Real-Time Message Broker
+Pub/sub fan-out of new messages and read receipts to /ws/messages
+
+Each WebSocket session subscribes a bounded queue for its user. Events
+are published with their recipient user ids onto a channel; every worker
+listening on that channel hands them to its own local subscribers.
+
+Channels:
+    LocalChannel  - in-process loopback; the stand-in used when no
+                    shared transport is configured (single worker, dev)
+    RedisChannel  - Redis pub/sub, used when REDIS_URL is set and the
+                    optional ``redis`` package is installed, so sessions
+                    on any gunicorn worker receive the event
+
+A session that falls BROKER_QUEUE_SIZE events behind has its backlog
+replaced by one ``{"type": "resync"}`` event telling the client to
+refetch over REST, instead of buffering without bound.
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+@version 1.0
+"""
+
+from typing import Callable, Dict, Iterable, Optional, Set
+import asyncio
+import json
+import os
+import logging
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+# Broker configuration
+BROKER_QUEUE_SIZE = int(os.getenv("BROKER_QUEUE_SIZE", "100"))
+BROKER_CHANNEL = os.getenv("BROKER_CHANNEL", "athlynx:messages")
+REDIS_URL = os.getenv("REDIS_URL")
+
+class LocalChannel:
+    """In-process stand-in for the cross-worker channel"""
+
+    name = "local"
+
+    async def start(self, deliver: Callable[[str], None]):
+        self._deliver = deliver
+
+    async def publish(self, payload: str):
+        self._deliver(payload)
+
+    async def stop(self):
+        pass
+
+class RedisChannel:
+    """Redis pub/sub channel shared by every worker"""
+
+    name = "redis"
+
+    def __init__(self, url: str, channel: str = BROKER_CHANNEL):
+        self._redis = aioredis.from_url(url, decode_responses=True)
+        self._channel = channel
+        self._pubsub = None
+        self._task = None
+
+    async def start(self, deliver: Callable[[str], None]):
+        self._pubsub = self._redis.pubsub()
+        await self._pubsub.subscribe(self._channel)
+        self._task = asyncio.get_running_loop().create_task(self._listen(deliver))
+
+    async def _listen(self, deliver: Callable[[str], None]):
+        while True:
+            try:
+                async for message in self._pubsub.listen():
+                    if message.get("type") == "message":
+                        deliver(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Broker channel error: {e}")
+                await asyncio.sleep(1)
+
+    async def publish(self, payload: str):
+        await self._redis.publish(self._channel, payload)
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+        if self._pubsub is not None:
+            await self._pubsub.close()
+        await self._redis.close()
+
+class MessageBroker:
+    """Per-user subscriptions and fan-out for real-time messaging events"""
+
+    def __init__(self, queue_size: int = BROKER_QUEUE_SIZE, redis_url: Optional[str] = REDIS_URL):
+        self.queue_size = queue_size
+        self._subscribers: Dict[int, Set[asyncio.Queue]] = {}
+        self._local = LocalChannel()
+        self._channel = self._local
+        self._started = False
+        self._start_lock = None
+        self._stats = {"published": 0, "delivered": 0, "resyncs": 0, "channel_errors": 0}
+
+        if redis_url and aioredis is None:
+            logger.warning("⚠️ REDIS_URL set but the redis package is not installed - broker is per worker")
+        elif redis_url:
+            self._channel = RedisChannel(redis_url)
+
+    async def start(self):
+        if self._started:
+            return
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self._started:
+                return
+            await self._local.start(self._deliver)
+            if self._channel is not self._local:
+                try:
+                    await self._channel.start(self._deliver)
+                except Exception as e:
+                    logger.error(f"Broker channel error: {e} - using local delivery")
+                    self._channel = self._local
+            self._started = True
+            logger.info(f"✅ Message broker ready ({self._channel.name} channel)")
+
+    async def stop(self):
+        if self._started:
+            await self._channel.stop()
+            self._started = False
+
+    async def subscribe(self, user_id: int) -> asyncio.Queue:
+        await self.start()
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.setdefault(user_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, user_id: int, queue: asyncio.Queue):
+        queues = self._subscribers.get(user_id)
+        if queues is not None:
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[user_id]
+
+    def is_online(self, user_id: int) -> bool:
+        """True if the user has a session on this worker"""
+        return user_id in self._subscribers
+
+    def _offer(self, queue: asyncio.Queue, event: dict):
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Slow consumer: drop the backlog and ask the client to refetch
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait({"type": "resync"})
+            self._stats["resyncs"] += 1
+
+    def _deliver(self, payload: str):
+        envelope = json.loads(payload)
+        event = envelope["event"]
+        for user_id in envelope["to"]:
+            for queue in list(self._subscribers.get(user_id, ())):
+                self._offer(queue, event)
+                self._stats["delivered"] += 1
+
+    async def publish(self, user_ids: Iterable[int], event: dict):
+        """Send an event to every session of the given users, on any worker"""
+        recipients = sorted({user_id for user_id in user_ids if user_id is not None})
+        if not recipients:
+            return
+        await self.start()
+        payload = json.dumps({"to": recipients, "event": event}, default=str)
+        self._stats["published"] += 1
+        try:
+            await self._channel.publish(payload)
+        except Exception as e:
+            # Shared channel down: still reach sessions on this worker
+            self._stats["channel_errors"] += 1
+            logger.error(f"Broker publish error: {e}")
+            await self._local.publish(payload)
+
+    async def publish_message(self, message: dict):
+        """New direct message -> receiver and the sender's other sessions"""
+        await self.publish(
+            [message.get("receiver_id"), message.get("sender_id")],
+            {"type": "message", "message": message}
+        )
+
+    async def publish_read(self, sender_id: int, reader_id: int, message_ids: Iterable[int]):
+        """Read receipt -> original sender and the reader's other sessions"""
+        message_ids = list(message_ids)
+        if message_ids:
+            await self.publish(
+                [sender_id, reader_id],
+                {"type": "read", "reader_id": reader_id, "message_ids": message_ids}
+            )
+
+    def stats(self) -> dict:
+        return {
+            "channel": self._channel.name,
+            "online_users": len(self._subscribers),
+            "sessions": sum(len(queues) for queues in self._subscribers.values()),
+            **self._stats
+        }
+
+# Singleton instance
+message_broker = MessageBroker()
@@ -0,0 +1,482 @@
+"""
+🦁 ATHLYNX AI - Notification Queue
+Durable outbound email / SMS, sent by background workers
+
+Request handlers call ``enqueue`` and return as soon as the job is
+written to ``notification_jobs``. SES and SNS are never called on the
+request path. NOTIFICATION_WORKERS workers per provider (in every worker
+process) claim due jobs with ``FOR UPDATE SKIP LOCKED`` and run the
+blocking boto3 call on a thread pool. Each provider is paced to
+NOTIFICATION_EMAIL_RATE / NOTIFICATION_SMS_RATE sends per second per
+process (0 = unlimited), to stay under the SES / SNS account limits.
+
+``enqueue_bulk`` queues one template for many recipients as
+``bulk_email`` jobs of up to SES_BULK_MAX_DESTINATIONS recipients. Each
+job is a single SES bulk-templated call, paced by recipient count. If SES
+rejects some destinations, only those are retried. To send the welcome
+email to the whole waitlist, from ``backend/``:
+
+    python -m services.notification_queue --welcome-blast
+
+A failed send is retried with exponential backoff (NOTIFICATION_BACKOFF_BASE
+doubling up to NOTIFICATION_BACKOFF_MAX seconds, with jitter). After
+NOTIFICATION_MAX_ATTEMPTS it is parked with status ``dead`` and its last
+error, for inspection or a manual requeue. A claimed job is leased for
+NOTIFICATION_LEASE_SECONDS, so if its worker dies mid-send the job is
+picked up again. Delivery is at least once.
+
+If the database is unreachable, ``enqueue`` appends the job to a
+per-process NDJSON spool in NOTIFICATION_SPOOL_DIR; any other error (a
+payload that will not serialize, say) is raised to the caller. The spool
+is moved into the table once the database is back, including spools left
+by processes that are no longer running; a worker claims such a file by
+renaming it to carry its own pid, so no two workers queue it twice. Jobs
+the database rejects on replay are bisected out of their chunk and set
+aside in ``notifications-rejected.ndjson`` so they cannot block the rest.
+Delivered jobs are deleted after NOTIFICATION_RETENTION_DAYS.
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+@version 1.0
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import asyncpg
+import json
+import os
+import random
+import re
+import time
+import logging
+
+from repositories.notification_repository import notification_repository, NotificationJob
+from .email_service import email_service, SES_BULK_MAX_DESTINATIONS
+from .sms_service import sms_service
+
+logger = logging.getLogger(__name__)
+
+# Notification queue configuration (per worker process)
+NOTIFICATION_WORKERS = int(os.getenv("NOTIFICATION_WORKERS", "4"))
+NOTIFICATION_EMAIL_RATE = float(os.getenv("NOTIFICATION_EMAIL_RATE", "14"))
+NOTIFICATION_SMS_RATE = float(os.getenv("NOTIFICATION_SMS_RATE", "20"))
+NOTIFICATION_CLAIM_BATCH = int(os.getenv("NOTIFICATION_CLAIM_BATCH", "10"))
+NOTIFICATION_LEASE_SECONDS = float(os.getenv("NOTIFICATION_LEASE_SECONDS", "60"))
+NOTIFICATION_MAX_ATTEMPTS = int(os.getenv("NOTIFICATION_MAX_ATTEMPTS", "8"))
+NOTIFICATION_BACKOFF_BASE = float(os.getenv("NOTIFICATION_BACKOFF_BASE", "5"))
+NOTIFICATION_BACKOFF_MAX = float(os.getenv("NOTIFICATION_BACKOFF_MAX", "3600"))
+NOTIFICATION_POLL_INTERVAL = float(os.getenv("NOTIFICATION_POLL_INTERVAL", "1"))
+NOTIFICATION_SPOOL_DIR = os.getenv("NOTIFICATION_SPOOL_DIR", "./spool")
+NOTIFICATION_RETENTION_DAYS = int(os.getenv("NOTIFICATION_RETENTION_DAYS", "7"))
+
+PROVIDERS = {"email": email_service, "sms": sms_service}
+
+# Job kind -> (provider, provider method); the payload is the method's keyword arguments
+NOTIFICATION_KINDS = {
+    "verification_email": ("email", "send_verification_email"),
+    "welcome_email": ("email", "send_welcome_email"),
+    "nil_deal_email": ("email", "send_nil_deal_notification"),
+    "bulk_email": ("email", "send_bulk_email"),
+    "verification_sms": ("sms", "send_verification_sms"),
+    "welcome_sms": ("sms", "send_welcome_sms"),
+    "nil_deal_sms": ("sms", "send_nil_deal_sms"),
+    "login_alert_sms": ("sms", "send_login_alert_sms"),
+    "transfer_portal_sms": ("sms", "send_transfer_portal_sms"),
+}
+
+# How often delivered jobs are purged
+_PURGE_INTERVAL = 3600
+
+# Spooled jobs moved into the table per statement
+_REPLAY_CHUNK = 500
+
+_REJECTED_FILE = "notifications-rejected.ndjson"
+
+# notifications-<owner pid>.ndjson, or notifications-<owner pid>-<earlier name>.ndjson once claimed
+_SPOOL_FILE = re.compile(r"^notifications-(\d+)(-[\d-]+)?\.ndjson$")
+
+# Errors that mean the database cannot be reached right now
+_UNREACHABLE = (
+    OSError,
+    asyncio.TimeoutError,
+    asyncpg.InterfaceError,
+    asyncpg.PostgresConnectionError,
+    asyncpg.CannotConnectNowError,
+    asyncpg.AdminShutdownError,
+    asyncpg.TooManyConnectionsError,
+)
+
+def _unreachable(error: Exception) -> bool:
+    """Whether a failed write is worth spooling (the database is down, not the job bad)"""
+    # asyncpg reports unencodable arguments as an InterfaceError that is also a ValueError
+    return isinstance(error, _UNREACHABLE) and not isinstance(error, ValueError)
+
+def _to_line(job: NotificationJob) -> str:
+    provider, kind, payload = job
+    return json.dumps({"provider": provider, "kind": kind, "payload": payload}, default=str) + "\n"
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+class _RateLimiter:
+    """Spaces sends evenly at rate per second (0 = unlimited)"""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next = 0.0
+
+    async def acquire(self, count: int = 1):
+        if not self.interval:
+            return
+        now = time.monotonic()
+        at = max(now, self._next)
+        self._next = at + self.interval * count
+        if at > now:
+            await asyncio.sleep(at - now)
+
+    async def ready(self):
+        """Wait until sends already reserved have gone out"""
+        delay = self._next - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+class NotificationQueue:
+    """Postgres-backed outbound notification queue with a worker pool"""
+
+    def __init__(
+        self,
+        workers: int = NOTIFICATION_WORKERS,
+        rates: Optional[Dict[str, float]] = None,
+        claim_batch: int = NOTIFICATION_CLAIM_BATCH,
+        lease_seconds: float = NOTIFICATION_LEASE_SECONDS,
+        max_attempts: int = NOTIFICATION_MAX_ATTEMPTS,
+        backoff_base: float = NOTIFICATION_BACKOFF_BASE,
+        backoff_max: float = NOTIFICATION_BACKOFF_MAX,
+        poll_interval: float = NOTIFICATION_POLL_INTERVAL,
+        spool_dir: str = NOTIFICATION_SPOOL_DIR,
+        retention_days: int = NOTIFICATION_RETENTION_DAYS
+    ):
+        self.workers = workers
+        self.rates = rates or {"email": NOTIFICATION_EMAIL_RATE, "sms": NOTIFICATION_SMS_RATE}
+        self.claim_batch = claim_batch
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.poll_interval = poll_interval
+        self.spool_dir = Path(spool_dir)
+        self.retention_days = retention_days
+
+        self._limiters = {provider: _RateLimiter(rate) for provider, rate in self.rates.items()}
+        self._wakeups: Dict[str, asyncio.Event] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._spool_lock = None
+        self._spool_pending = True     # check for leftovers from earlier processes once
+        self._stopping = False
+        self._stats = {
+            "enqueued": 0,
+            "spooled": 0,
+            "replayed": 0,
+            "rejected": 0,
+            "sent": 0,
+            "retried": 0,
+            "dead": 0,
+            "errors": 0
+        }
+
+    def start(self):
+        """Start the workers; call from the event loop"""
+        if self._tasks:
+            return
+        loop = asyncio.get_running_loop()
+        self._stopping = False
+        self._spool_lock = asyncio.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers * len(PROVIDERS),
+            thread_name_prefix="notification"
+        )
+        for provider in PROVIDERS:
+            self._wakeups[provider] = asyncio.Event()
+            self._tasks.extend(loop.create_task(self._work(provider)) for _ in range(self.workers))
+        self._tasks.append(loop.create_task(self._maintain()))
+
+    async def stop(self):
+        """Let the workers finish the jobs they hold, then exit"""
+        if not self._tasks:
+            return
+        self._stopping = True
+        for wakeup in self._wakeups.values():
+            wakeup.set()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._executor.shutdown(wait=False)
+        self._executor = None
+        logger.info("✅ Notification workers stopped")
+
+    # ------------------------------------------------------------------
+    # Enqueueing
+    # ------------------------------------------------------------------
+
+    async def enqueue(self, kind: str, **payload):
+        """Queue a notification; returns once it is stored (table or spool)"""
+        if kind not in NOTIFICATION_KINDS:
+            raise ValueError(f"Unknown notification kind: {kind}")
+        provider = NOTIFICATION_KINDS[kind][0]
+        try:
+            await notification_repository.enqueue(provider, kind, payload)
+        except Exception as e:
+            if not _unreachable(e):
+                raise
+            logger.error(f"Notification enqueue error: {e} - spooling {kind}")
+            await self._spool([(provider, kind, payload)])
+            return
+        self._stats["enqueued"] += 1
+        if provider in self._wakeups:
+            self._wakeups[provider].set()
+
+    async def enqueue_bulk(self, template: str, recipients: List[dict]) -> int:
+        """Queue one template for many recipients as bulk_email jobs; returns the job count
+
+        Each recipient is a dict with ``to_email`` and the template's fields.
+        """
+        jobs = [
+            ("email", "bulk_email", {"name": template, "recipients": recipients[start:start + SES_BULK_MAX_DESTINATIONS]})
+            for start in range(0, len(recipients), SES_BULK_MAX_DESTINATIONS)
+        ]
+        for start in range(0, len(jobs), _REPLAY_CHUNK):
+            chunk = jobs[start:start + _REPLAY_CHUNK]
+            try:
+                await notification_repository.enqueue_many(chunk)
+            except Exception as e:
+                if not _unreachable(e):
+                    raise
+                logger.error(f"Notification enqueue error: {e} - spooling {len(chunk)} bulk jobs")
+                await self._spool(chunk)
+                continue
+            self._stats["enqueued"] += len(chunk)
+        if "email" in self._wakeups:
+            self._wakeups["email"].set()
+        return len(jobs)
+
+    def _spool_path(self) -> Path:
+        return self.spool_dir / f"notifications-{os.getpid()}.ndjson"
+
+    def _append_spool(self, jobs: List[NotificationJob], path: Optional[Path] = None):
+        self.spool_dir.mkdir(parents=True, exist_ok=True)
+        with open(path or self._spool_path(), "a", encoding="utf-8") as spool:
+            spool.writelines(_to_line(job) for job in jobs)
+
+    async def _spool(self, jobs: List[NotificationJob]):
+        if self._spool_lock is None:
+            self._spool_lock = asyncio.Lock()
+        async with self._spool_lock:
+            try:
+                await asyncio.to_thread(self._append_spool, jobs)
+            except Exception as e:
+                logger.error(f"Notification spool error: {e} - {len(jobs)} notifications lost")
+                return
+            self._spool_pending = True
+            self._stats["spooled"] += len(jobs)
+
+    def _spool_files(self) -> List[Path]:
+        """Our own spools plus any left by processes that have exited, claimed for us"""
+        if not self.spool_dir.is_dir():
+            return []
+        pid = os.getpid()
+        files = []
+        for path in sorted(self.spool_dir.iterdir()):
+            match = _SPOOL_FILE.match(path.name)
+            if not match:
+                continue
+            owner = int(match.group(1))
+            if owner == pid:
+                files.append(path)
+            elif not _pid_alive(owner):
+                # The rename is atomic: if another worker got there first it fails
+                claimed = path.with_name(f"notifications-{pid}-{path.name[len('notifications-'):]}")
+                try:
+                    os.rename(path, claimed)
+                except OSError:
+                    continue
+                files.append(claimed)
+        return files
+
+    async def _enqueue_replayed(self, jobs: List[NotificationJob]) -> Tuple[int, List[NotificationJob]]:
+        """Insert spooled jobs, bisecting around jobs the database rejects
+
+        Returns (jobs rejected, jobs left unwritten). The second list is
+        empty unless the database became unreachable partway; those jobs
+        were not written and should be kept.
+        """
+        rejected = 0
+        pending = [jobs]
+        while pending:
+            part = pending.pop()
+            try:
+                await notification_repository.enqueue_many(part)
+            except Exception as e:
+                if _unreachable(e):
+                    unwritten = [job for piece in [part] + pending[::-1] for job in piece]
+                    logger.error(f"Notification spool replay error: {e} - {len(unwritten)} jobs not written")
+                    return rejected, unwritten
+                if len(part) > 1:
+                    middle = len(part) // 2
+                    pending += [part[middle:], part[:middle]]
+                    continue
+                logger.error(f"Spooled notification rejected: {e}")
+                try:
+                    await asyncio.to_thread(self._append_spool, part, self.spool_dir / _REJECTED_FILE)
+                except Exception as e:
+                    logger.error(f"Notification spool error: {e} - rejected {part[0][1]} lost")
+                rejected += 1
+        return rejected, []
+
+    async def _replay_spool(self):
+        """Move spooled jobs into the table; a failure keeps the rest for next time"""
+        async with self._spool_lock:
+            for path in await asyncio.to_thread(self._spool_files):
+                lines = (await asyncio.to_thread(path.read_text, encoding="utf-8")).splitlines(keepends=True)
+                for start in range(0, len(lines), _REPLAY_CHUNK):
+                    jobs = []
+                    for line in lines[start:start + _REPLAY_CHUNK]:
+                        try:
+                            data = json.loads(line)
+                            jobs.append((data["provider"], data["kind"], data["payload"]))
+                        except (ValueError, KeyError) as e:
+                            logger.error(f"Skipping unreadable spooled notification: {e}")
+                    rejected, unwritten = await self._enqueue_replayed(jobs)
+                    self._stats["rejected"] += rejected
+                    if unwritten:
+                        # Keep what this chunk did not write plus every later chunk
+                        rest = "".join(_to_line(job) for job in unwritten) + "".join(lines[start + _REPLAY_CHUNK:])
+                        remaining = path.with_suffix(".tmp")
+                        await asyncio.to_thread(remaining.write_text, rest, encoding="utf-8")
+                        await asyncio.to_thread(os.replace, remaining, path)
+                        return
+                    self._stats["replayed"] += len(jobs) - rejected
+                await asyncio.to_thread(path.unlink)
+                logger.info(f"✅ Queued {len(lines)} spooled notifications from {path.name}")
+            self._spool_pending = False
+        for wakeup in self._wakeups.values():
+            wakeup.set()
+
+    # ------------------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------------------
+
+    def _backoff(self, attempts: int) -> float:
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (attempts - 1))
+        return delay * random.uniform(0.5, 1.0)
+
+    async def _deliver(self, provider: str, job: dict, claimed_at: float):
+        kind, payload = job['kind'], job['payload']
+        error, remaining = None, None
+        if kind not in NOTIFICATION_KINDS:
+            sent, error = False, f"unknown notification kind {kind}"
+        else:
+            method = getattr(PROVIDERS[provider], NOTIFICATION_KINDS[kind][1])
+            await self._limiters[provider].acquire(len(payload['recipients']) if kind == "bulk_email" else 1)
+            # A long wait for the rate limit can outlast the lease: renew it, or let go of the job
+            if time.monotonic() - claimed_at > self.lease_seconds / 2:
+                if not await notification_repository.extend_lease(job['id'], job['attempts'], self.lease_seconds):
+                    return
+            try:
+                result = await asyncio.get_running_loop().run_in_executor(
+                    self._executor, partial(method, **payload)
+                )
+                if kind == "bulk_email":
+                    # Bulk sends return the recipients SES refused; only those are retried
+                    sent = not result
+                    if result:
+                        remaining = {**payload, "recipients": result}
+                        error = f"{len(result)} of {len(payload['recipients'])} destinations failed"
+                else:
+                    sent = result
+                    if not sent:
+                        error = f"{provider} provider did not accept the send"
+            except Exception as e:
+                sent, error = False, str(e)
+
+        if sent:
+            await notification_repository.mark_sent(job['id'])
+            self._stats["sent"] += 1
+        elif job['attempts'] >= self.max_attempts or kind not in NOTIFICATION_KINDS:
+            await notification_repository.mark_dead(job['id'], error)
+            self._stats["dead"] += 1
+            logger.error(f"❌ Notification {job['id']} ({kind}) dead after {job['attempts']} attempts: {error}")
+        else:
+            await notification_repository.retry(job['id'], self._backoff(job['attempts']), error, remaining)
+            self._stats["retried"] += 1
+
+    async def _work(self, provider: str):
+        wakeup = self._wakeups[provider]
+        while not self._stopping:
+            try:
+                await self._limiters[provider].ready()
+                claimed_at = time.monotonic()
+                jobs = await notification_repository.claim(provider, self.claim_batch, self.lease_seconds)
+                for job in jobs:
+                    if self._stopping:
+                        break       # the rest come back when their lease runs out
+                    await self._deliver(provider, job, claimed_at)
+            except Exception as e:
+                # The lease brings back whatever this batch did not finish
+                self._stats["errors"] += 1
+                logger.error(f"Notification worker error: {e}")
+                jobs = []
+            if not jobs:
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                wakeup.clear()
+
+    async def _maintain(self):
+        purged_at = None
+        while not self._stopping:
+            try:
+                if self._spool_pending:
+                    await self._replay_spool()
+                if purged_at is None or time.monotonic() - purged_at >= _PURGE_INTERVAL:
+                    await notification_repository.purge_sent(self.retention_days)
+                    purged_at = time.monotonic()
+            except Exception as e:
+                logger.error(f"Notification queue maintenance error: {e}")
+            await asyncio.sleep(self.poll_interval)
+
+    def stats(self) -> dict:
+        return {"workers": self.workers, "rates": dict(self.rates), **self._stats}
+
+# Singleton instance
+notification_queue = NotificationQueue()
+
+if __name__ == "__main__":
+    import argparse
+    from models.async_database import async_db_pool
+    from repositories.waitlist_repository import waitlist_repository
+
+    async def _main(args):
+        await async_db_pool.open()
+        try:
+            if args.welcome_blast:
+                recipients = await waitlist_repository.get_welcome_recipients()
+                jobs = await notification_queue.enqueue_bulk("welcome", recipients)
+                logger.info(f"✅ Queued the welcome email for {len(recipients)} waitlist members in {jobs} bulk jobs")
+            logger.info(f"✅ Notification jobs: {await notification_repository.counts()}")
+        finally:
+            await async_db_pool.close()
+
+    parser = argparse.ArgumentParser(description="ATHLYNX notification queue")
+    parser.add_argument("--welcome-blast", action="store_true", help="queue the welcome email for the whole waitlist")
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_main(parser.parse_args()))
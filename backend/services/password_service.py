@@ -0,0 +1,111 @@
+"""
+🦁 ATHLYNX AI - Password Hashing Service
+bcrypt on a bounded thread pool, with transparent upgrades of old hashes
+
+A bcrypt hash at the default cost takes on the order of 100-250ms of CPU,
+which would stall every other request if run on the event loop. Hashes
+and verifications run on a dedicated pool of PASSWORD_HASH_WORKERS
+threads (bcrypt releases the GIL, so one thread per core scales), and
+calls beyond that wait in the pool's queue. When more than
+PASSWORD_HASH_QUEUE_MAX calls are already waiting, new ones are refused
+with PasswordHasherBusy so the API answers 503 instead of piling up
+latency.
+
+Legacy unsalted sha256 hex digests still verify. ``verify`` returns a
+replacement bcrypt hash for them, and for bcrypt hashes below the
+configured PASSWORD_BCRYPT_ROUNDS, which the login route stores.
+
+    python -m benchmarks.password_hashing    # logins/s per core
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+@version 1.0
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+import asyncio
+import os
+import logging
+
+from passlib.context import CryptContext
+
+logger = logging.getLogger(__name__)
+
+# Password hashing configuration (per worker process)
+PASSWORD_BCRYPT_ROUNDS = int(os.getenv("PASSWORD_BCRYPT_ROUNDS", "12"))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 2)))
+PASSWORD_HASH_QUEUE_MAX = int(os.getenv("PASSWORD_HASH_QUEUE_MAX", "256"))
+
+class PasswordHasherBusy(Exception):
+    """Too many hashes already queued; retry later"""
+
+class PasswordService:
+    """bcrypt hashing off the event loop"""
+
+    def __init__(
+        self,
+        rounds: int = PASSWORD_BCRYPT_ROUNDS,
+        workers: int = PASSWORD_HASH_WORKERS,
+        queue_max: int = PASSWORD_HASH_QUEUE_MAX
+    ):
+        self.workers = workers
+        self.queue_max = queue_max
+        self.context = CryptContext(
+            schemes=["bcrypt", "hex_sha256"],
+            deprecated=["hex_sha256"],
+            bcrypt__rounds=rounds,
+            bcrypt__min_rounds=rounds
+        )
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight = 0
+        self._stats = {"hashes": 0, "verifies": 0, "upgrades": 0, "rejected": 0}
+
+    async def _run(self, fn, *args):
+        if self._in_flight >= self.workers + self.queue_max:
+            self._stats["rejected"] += 1
+            raise PasswordHasherBusy(f"{self._in_flight} password hashes in flight")
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bcrypt")
+
+        self._in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            self._in_flight -= 1
+
+    async def hash(self, password: str) -> str:
+        """bcrypt hash for a new password"""
+        self._stats["hashes"] += 1
+        return await self._run(self.context.hash, password)
+
+    def _verify(self, password: str, password_hash: Optional[str]) -> Tuple[bool, Optional[str]]:
+        if not password_hash:
+            # Unknown user: spend the same time as a real check
+            self.context.dummy_verify()
+            return False, None
+        try:
+            return self.context.verify_and_update(password, password_hash)
+        except ValueError:
+            # Not a hash format we recognise
+            return False, None
+
+    async def verify(self, password: str, password_hash: Optional[str]) -> Tuple[bool, Optional[str]]:
+        """(valid, replacement hash or None); pass None for an unknown user"""
+        self._stats["verifies"] += 1
+        valid, new_hash = await self._run(self._verify, password, password_hash)
+        if valid and new_hash:
+            self._stats["upgrades"] += 1
+        return valid, new_hash
+
+    def stop(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def stats(self) -> dict:
+        return {"in_flight": self._in_flight, "workers": self.workers, **self._stats}
+
+# Singleton instance
+password_service = PasswordService()
@@ -0,0 +1,102 @@
+"""
+🦁 ATHLYNX AI - Platform Stats Service
+Cached snapshot of the /api/stats totals
+
+The platform totals come from one combined statement
+(StatsRepository.get_platform_totals) instead of a query per counter, and
+the result is cached. Once a snapshot is older than
+PLATFORM_STATS_REFRESH_INTERVAL seconds the next request starts a
+background refresh and is still answered from the current snapshot, so
+/api/stats never waits on a scan after the first load. Responses carry
+the snapshot's ``timestamp`` and ``age_seconds``.
+
+Tables the catalog estimates above PLATFORM_STATS_EXACT_LIMIT rows are
+counted from ``pg_class.reltuples`` (kept current by autovacuum/ANALYZE)
+and listed under ``approximate``.
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+@version 1.0
+"""
+
+from datetime import datetime
+from typing import Optional
+import asyncio
+import os
+import time
+import logging
+
+from repositories.stats_repository import stats_repository, PLATFORM_COUNTS
+
+logger = logging.getLogger(__name__)
+
+# Platform stats configuration (per worker process)
+PLATFORM_STATS_REFRESH_INTERVAL = float(os.getenv("PLATFORM_STATS_REFRESH_INTERVAL", "60"))
+PLATFORM_STATS_EXACT_LIMIT = int(os.getenv("PLATFORM_STATS_EXACT_LIMIT", "1000000"))
+
+class PlatformStatsService:
+    """Background-refreshed platform totals for /api/stats"""
+
+    def __init__(
+        self,
+        refresh_interval: float = PLATFORM_STATS_REFRESH_INTERVAL,
+        exact_limit: int = PLATFORM_STATS_EXACT_LIMIT
+    ):
+        self.refresh_interval = refresh_interval
+        self.exact_limit = exact_limit
+
+        self._snapshot: Optional[dict] = None
+        self._refreshed_at = 0.0
+        self._refresh_task = None
+        self._stats = {"refreshes": 0, "refresh_errors": 0}
+
+    async def refresh(self):
+        """Recompute the snapshot from the database"""
+        try:
+            row = await stats_repository.get_platform_totals(self.exact_limit)
+
+            snapshot = {key: row[key] for key, _ in PLATFORM_COUNTS}
+            snapshot["total_nil_value"] = float(row['total_nil_value'])
+            snapshot["timestamp"] = datetime.now().isoformat()
+            snapshot["approximate"] = [key for key, _ in PLATFORM_COUNTS if row[f"{key}_approximate"]]
+
+            self._snapshot = snapshot
+            self._refreshed_at = time.monotonic()
+            self._stats["refreshes"] += 1
+        except Exception as e:
+            self._stats["refresh_errors"] += 1
+            logger.error(f"Platform stats refresh error: {e}")
+            raise
+
+    async def _ensure_fresh(self):
+        if self._refresh_task is not None and not self._refresh_task.done():
+            if self._snapshot is None:
+                await asyncio.shield(self._refresh_task)
+            return
+
+        if self._snapshot is not None and time.monotonic() - self._refreshed_at < self.refresh_interval:
+            return
+
+        self._refresh_task = asyncio.get_running_loop().create_task(self.refresh())
+        if self._snapshot is None:
+            # Nothing to serve yet: wait for the first load
+            await asyncio.shield(self._refresh_task)
+        else:
+            self._refresh_task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+    async def get_stats(self) -> dict:
+        """Latest snapshot plus its age in seconds"""
+        await self._ensure_fresh()
+        return {
+            **self._snapshot,
+            "age_seconds": round(time.monotonic() - self._refreshed_at, 3)
+        }
+
+    def stats(self) -> dict:
+        return {
+            "loaded": self._snapshot is not None,
+            **self._stats
+        }
+
+# Singleton instance
+platform_stats_service = PlatformStatsService()
@@ -0,0 +1,211 @@
+"""
+🦁 ATHLYNX AI - Session Service
+Server-side login sessions with a cached token validator
+
+Login issues a random bearer token. Only its sha256 is stored, in the
+``sessions`` table, with an expiry SESSION_TTL_HOURS out. Validated
+sessions are kept in a per-worker LRU of SESSION_CACHE_SIZE entries for
+up to SESSION_CACHE_TTL seconds, so resolving the current user on an
+authenticated route is a dict lookup with no database query on a hit.
+
+Revocations (logout, logout everywhere) are written to the database and
+broadcast on the SESSION_CHANNEL pub/sub channel. Every worker drops the
+revoked tokens from its cache at once. Without REDIS_URL the broadcast
+only reaches this worker, and other workers notice within
+SESSION_CACHE_TTL seconds. Expired and revoked rows are purged after
+SESSION_RETENTION_DAYS.
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+@version 1.0
+"""
+
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional, Tuple
+import asyncio
+import hashlib
+import json
+import os
+import secrets
+import time
+import logging
+
+from repositories.session_repository import session_repository
+from services.message_broker import LocalChannel, RedisChannel, aioredis, REDIS_URL
+
+logger = logging.getLogger(__name__)
+
+# Session configuration (per worker process)
+SESSION_TTL_HOURS = float(os.getenv("SESSION_TTL_HOURS", "168"))
+SESSION_CACHE_SIZE = int(os.getenv("SESSION_CACHE_SIZE", "10000"))
+SESSION_CACHE_TTL = float(os.getenv("SESSION_CACHE_TTL", "60"))
+SESSION_RETENTION_DAYS = int(os.getenv("SESSION_RETENTION_DAYS", "7"))
+SESSION_CHANNEL = os.getenv("SESSION_CHANNEL", "athlynx:sessions")
+
+# How often expired sessions are purged
+_PURGE_INTERVAL = 3600
+
+class SessionService:
+    """Issues, validates and revokes bearer-token sessions"""
+
+    def __init__(
+        self,
+        ttl_hours: float = SESSION_TTL_HOURS,
+        cache_size: int = SESSION_CACHE_SIZE,
+        cache_ttl: float = SESSION_CACHE_TTL,
+        retention_days: int = SESSION_RETENTION_DAYS,
+        redis_url: Optional[str] = REDIS_URL
+    ):
+        self.ttl_hours = ttl_hours
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self.retention_days = retention_days
+
+        self._cache: "OrderedDict[str, Tuple[dict, float]]" = OrderedDict()
+        self._revocations = 0       # bumped on every revocation seen
+        self._local = LocalChannel()
+        self._channel = self._local
+        self._started = False
+        self._start_lock = None
+        self._task = None
+        self._stats = {"hits": 0, "misses": 0, "created": 0, "revoked": 0}
+
+        if redis_url and aioredis is not None:
+            self._channel = RedisChannel(redis_url, SESSION_CHANNEL)
+
+    @staticmethod
+    def hash_token(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    async def start(self):
+        if self._started:
+            return
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self._started:
+                return
+            await self._local.start(self._deliver)
+            if self._channel is not self._local:
+                try:
+                    await self._channel.start(self._deliver)
+                except Exception as e:
+                    logger.error(f"Session channel error: {e} - revocations are per worker")
+                    self._channel = self._local
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            self._started = True
+
+    async def stop(self):
+        if self._started:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            await self._channel.stop()
+            self._started = False
+
+    # ------------------------------------------------------------------
+    # Cache
+    # ------------------------------------------------------------------
+
+    def _remember(self, token_hash: str, user: dict, expires_at: datetime):
+        ttl = min(self.cache_ttl, (expires_at - datetime.now()).total_seconds())
+        if ttl <= 0:
+            return
+        self._cache[token_hash] = (user, time.monotonic() + ttl)
+        self._cache.move_to_end(token_hash)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _deliver(self, payload: str):
+        for token_hash in json.loads(payload)["revoked"]:
+            self._cache.pop(token_hash, None)
+        self._revocations += 1
+
+    async def _broadcast_revoked(self, token_hashes):
+        payload = json.dumps({"revoked": list(token_hashes)})
+        try:
+            await self._channel.publish(payload)
+        except Exception as e:
+            logger.error(f"Session revocation publish error: {e}")
+            await self._local.publish(payload)
+
+    # ------------------------------------------------------------------
+    # Sessions
+    # ------------------------------------------------------------------
+
+    async def create(self, user: dict, ip_address: Optional[str] = None, user_agent: Optional[str] = None) -> dict:
+        """Open a session for a signed-in user; returns the token and its expiry"""
+        await self.start()
+        token = secrets.token_urlsafe(32)
+        token_hash = self.hash_token(token)
+        session = await session_repository.create_session(
+            token_hash, user['id'], self.ttl_hours, ip_address, user_agent
+        )
+        self._remember(token_hash, dict(user), session['expires_at'])
+        self._stats["created"] += 1
+        return {"token": token, "expires_at": session['expires_at']}
+
+    async def validate(self, token: str) -> Optional[dict]:
+        """The token's user, or None if the session is unknown, expired or revoked"""
+        await self.start()
+        token_hash = self.hash_token(token)
+        cached = self._cache.get(token_hash)
+        if cached is not None and cached[1] > time.monotonic():
+            self._cache.move_to_end(token_hash)
+            self._stats["hits"] += 1
+            return dict(cached[0])
+
+        self._stats["misses"] += 1
+        revocations = self._revocations
+        row = await session_repository.get_session_user(token_hash)
+        if row is None:
+            self._cache.pop(token_hash, None)
+            return None
+
+        expires_at = row.pop('expires_at')
+        # A revocation seen mid-query may be for this token: answer, but don't cache
+        if revocations == self._revocations:
+            self._remember(token_hash, row, expires_at)
+        return dict(row)
+
+    async def revoke(self, token: str) -> bool:
+        """Log one session out on every worker"""
+        await self.start()
+        token_hash = self.hash_token(token)
+        user_id = await session_repository.revoke_session(token_hash)
+        self._cache.pop(token_hash, None)
+        if user_id is None:
+            return False
+        self._stats["revoked"] += 1
+        await self._broadcast_revoked([token_hash])
+        return True
+
+    async def revoke_user(self, user_id: int) -> int:
+        """Log a user out everywhere; returns the number of sessions revoked"""
+        await self.start()
+        token_hashes = await session_repository.revoke_user_sessions(user_id)
+        if token_hashes:
+            self._stats["revoked"] += len(token_hashes)
+            await self._broadcast_revoked(token_hashes)
+        return len(token_hashes)
+
+    async def _run(self):
+        while True:
+            try:
+                await session_repository.purge_expired(self.retention_days)
+            except Exception as e:
+                logger.error(f"Session purge error: {e}")
+            await asyncio.sleep(_PURGE_INTERVAL)
+
+    def stats(self) -> dict:
+        return {
+            "channel": self._channel.name,
+            "cached": len(self._cache),
+            **self._stats
+        }
+
+# Singleton instance
+session_service = SessionService()
@@ -0,0 +1,285 @@
+"""
+🦁 ATHLYNX AI - Home Timeline Service
+Precomputed feed timelines with fan-out on write
+
+Keeps the newest post keys ``(created_at, id)`` for each audience segment
+(global, per sport, per role, per sport + role) in process memory, plus a small post cache
+used to hydrate pages. ``create_post`` fans the new key out to every
+loaded segment it belongs to, deletes remove it everywhere, so a feed
+page is a bisect into an in-memory list plus one ``id = ANY(...)`` lookup
+for cache misses - independent of how big ``feed_posts`` gets.
+
+Each worker process has its own copy. Posts written by other workers are
+pulled in by a cheap "newer than my head" index seek at most every
+TIMELINE_REFRESH_INTERVAL seconds. ``created_at`` comes from each
+worker's clock and posts can commit out of order, so the seek starts
+TIMELINE_REFRESH_OVERLAP seconds below the head and merges what it finds
+without duplicates. Cached posts expire after
+TIMELINE_POST_TTL so counters and remote deletes converge. Reads past the
+cached window fall back to the keyset query in FeedRepository.
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+@version 1.0
+"""
+
+from bisect import bisect_left
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import os
+import time
+import logging
+
+from repositories.feed_repository import feed_repository
+from repositories.pagination import encode_cursor, decode_cursor
+from services.counter_service import counter_service
+
+logger = logging.getLogger(__name__)
+
+# Timeline configuration (per worker process)
+TIMELINE_MAX_SIZE = int(os.getenv("TIMELINE_MAX_SIZE", "1000"))
+TIMELINE_MAX_SEGMENTS = int(os.getenv("TIMELINE_MAX_SEGMENTS", "200"))
+TIMELINE_POST_CACHE_SIZE = int(os.getenv("TIMELINE_POST_CACHE_SIZE", "5000"))
+TIMELINE_POST_TTL = float(os.getenv("TIMELINE_POST_TTL", "30"))
+TIMELINE_REFRESH_INTERVAL = float(os.getenv("TIMELINE_REFRESH_INTERVAL", "2"))
+TIMELINE_REFRESH_OVERLAP = float(os.getenv("TIMELINE_REFRESH_OVERLAP", "30"))
+
+# Segments are keyed (sport, role); None means "any"
+GLOBAL_SEGMENT = (None, None)
+
+class _Segment:
+    """Ascending list of (created_at, id) keys for one audience"""
+
+    def __init__(self):
+        self.keys: List[Tuple] = []
+        self.complete = False     # True when keys hold every post in the segment
+        self.loaded = False
+        self.refreshed_at = 0.0
+        self.lock = asyncio.Lock()
+
+    def add(self, key: Tuple, max_size: int):
+        index = bisect_left(self.keys, key)
+        if index < len(self.keys) and self.keys[index] == key:
+            return
+        self.keys.insert(index, key)
+        if len(self.keys) > max_size:
+            del self.keys[:len(self.keys) - max_size]
+            self.complete = False
+
+    def remove(self, key: Tuple) -> bool:
+        index = bisect_left(self.keys, key)
+        if index < len(self.keys) and self.keys[index] == key:
+            del self.keys[index]
+            return True
+        return False
+
+class TimelineService:
+    """Per-segment feed timelines and post cache for /api/feed"""
+
+    def __init__(
+        self,
+        max_size: int = TIMELINE_MAX_SIZE,
+        max_segments: int = TIMELINE_MAX_SEGMENTS,
+        post_cache_size: int = TIMELINE_POST_CACHE_SIZE,
+        post_ttl: float = TIMELINE_POST_TTL,
+        refresh_interval: float = TIMELINE_REFRESH_INTERVAL,
+        refresh_overlap: float = TIMELINE_REFRESH_OVERLAP
+    ):
+        self.max_size = max_size
+        self.max_segments = max_segments
+        self.post_cache_size = post_cache_size
+        self.post_ttl = post_ttl
+        self.refresh_interval = refresh_interval
+        self.refresh_overlap = timedelta(seconds=refresh_overlap)
+
+        self._segments: "OrderedDict[Tuple, _Segment]" = OrderedDict()
+        self._posts: "OrderedDict[int, Tuple[dict, float]]" = OrderedDict()
+        self._stats = {
+            "pages_served": 0,
+            "fallbacks": 0,
+            "post_hits": 0,
+            "post_misses": 0,
+            "fanouts": 0
+        }
+
+    @staticmethod
+    def _segments_for(sport: Optional[str], role: Optional[str]) -> List[Tuple]:
+        """Every segment a post by this audience appears in"""
+        segments = [GLOBAL_SEGMENT]
+        if sport:
+            segments.append((sport, None))
+        if role:
+            segments.append((None, role))
+        if sport and role:
+            segments.append((sport, role))
+        return segments
+
+    @staticmethod
+    def _segment_key(sport: Optional[str], role: Optional[str]) -> Tuple:
+        # A feed page applies both filters, exactly like FeedRepository.get_feed
+        return (sport or None, role or None)
+
+    # ------------------------------------------------------------------
+    # Post cache
+    # ------------------------------------------------------------------
+
+    def _cache_post(self, post: dict):
+        self._posts[post['id']] = (post, time.monotonic() + self.post_ttl)
+        self._posts.move_to_end(post['id'])
+        while len(self._posts) > self.post_cache_size:
+            self._posts.popitem(last=False)
+
+    async def _hydrate(self, post_ids: List[int]) -> Tuple[Dict[int, dict], List[int]]:
+        """Posts by id from cache, one query for misses; also returns ids gone from the DB"""
+        now = time.monotonic()
+        found, missing = {}, []
+        for post_id in post_ids:
+            cached = self._posts.get(post_id)
+            if cached and cached[1] > now:
+                found[post_id] = cached[0]
+                self._stats["post_hits"] += 1
+            else:
+                missing.append(post_id)
+                self._stats["post_misses"] += 1
+
+        if missing:
+            for post in await feed_repository.get_posts_by_ids(missing):
+                self._cache_post(post)
+                found[post['id']] = post
+
+        return found, [post_id for post_id in missing if post_id not in found]
+
+    # ------------------------------------------------------------------
+    # Segments
+    # ------------------------------------------------------------------
+
+    async def _get_segment(self, segment_key: Tuple) -> _Segment:
+        segment = self._segments.get(segment_key)
+        if segment is None:
+            segment = self._segments[segment_key] = _Segment()
+            while len(self._segments) > self.max_segments:
+                self._segments.popitem(last=False)
+        self._segments.move_to_end(segment_key)
+
+        if segment.loaded and time.monotonic() - segment.refreshed_at < self.refresh_interval:
+            return segment
+
+        async with segment.lock:
+            if segment.loaded and time.monotonic() - segment.refreshed_at < self.refresh_interval:
+                return segment
+
+            sport, role = segment_key
+            newer_than = None
+            if segment.loaded and segment.keys:
+                # Re-read a window below the head for late commits and skewed clocks
+                newer_than = (segment.keys[-1][0] - self.refresh_overlap, 0)
+
+            rows = await feed_repository.get_post_keys(self.max_size, sport, role, newer_than)
+            keys = [(r['created_at'], r['id']) for r in rows]
+
+            if not segment.loaded or len(keys) >= self.max_size:
+                # Cold load, or too many new posts to splice in: rebuild from the newest
+                segment.keys = sorted(keys)
+                segment.complete = len(keys) < self.max_size
+                segment.loaded = True
+            else:
+                for key in keys:
+                    segment.add(key, self.max_size)
+
+            segment.refreshed_at = time.monotonic()
+        return segment
+
+    def add_post(self, post: dict):
+        """Fan a freshly created post out to its loaded segments"""
+        post = dict(post)
+        sport = post.pop('author_sport', None)
+        self._cache_post(post)
+
+        if not post.get('created_at'):
+            return
+        key = (post['created_at'], post['id'])
+        for segment_key in self._segments_for(sport, post.get('role')):
+            segment = self._segments.get(segment_key)
+            if segment is not None and segment.loaded:
+                segment.add(key, self.max_size)
+                self._stats["fanouts"] += 1
+
+    def remove_post(self, post_id: int):
+        """Drop a deleted post from the post cache and every segment"""
+        cached = self._posts.pop(post_id, None)
+        for segment in self._segments.values():
+            if cached and cached[0].get('created_at'):
+                segment.remove((cached[0]['created_at'], post_id))
+            else:
+                segment.keys = [key for key in segment.keys if key[1] != post_id]
+
+    def update_post(self, post_id: int, **fields):
+        """Patch fields on a cached post"""
+        cached = self._posts.get(post_id)
+        if cached:
+            cached[0].update(fields)
+
+    def apply_counter_deltas(self, batch: dict):
+        """Fold flushed counter deltas into cached posts (counter_service listener)"""
+        for post_id, deltas in batch.items():
+            cached = self._posts.get(post_id)
+            if cached:
+                for field, delta in deltas.items():
+                    cached[0][field] = max(0, (cached[0].get(field) or 0) + delta)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    async def get_posts(self, post_ids: List[int]) -> Dict[int, dict]:
+        """Hydrate posts by id through the post cache"""
+        found, _ = await self._hydrate(post_ids)
+        return found
+
+    async def get_feed(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        sport: Optional[str] = None,
+        role: Optional[str] = None
+    ) -> Tuple[List[dict], Optional[str]]:
+        """Newest-first page for an audience; returns (posts, next_cursor)"""
+        position = decode_cursor(cursor) if cursor else None
+        segment = await self._get_segment(self._segment_key(sport, role))
+
+        for _ in range(2):
+            end = bisect_left(segment.keys, position) if position else len(segment.keys)
+            start = end - (limit + 1)
+
+            if start < 0 and not segment.complete:
+                # Page reaches past the cached window
+                self._stats["fallbacks"] += 1
+                return await feed_repository.get_feed(limit, 0, None, cursor, sport, role)
+
+            window = segment.keys[max(0, start):end][::-1]
+            page_keys = window[:limit]
+            posts, gone = await self._hydrate([key[1] for key in page_keys])
+
+            if gone:
+                # Deleted by another worker: forget them and rebuild the page once
+                for post_id in gone:
+                    self.remove_post(post_id)
+                continue
+            break
+
+        self._stats["pages_served"] += 1
+        next_cursor = encode_cursor(*page_keys[-1]) if len(window) > limit else None
+        return [posts[key[1]] for key in page_keys if key[1] in posts], next_cursor
+
+    def stats(self) -> dict:
+        return {
+            "segments": len(self._segments),
+            "cached_posts": len(self._posts),
+            **self._stats
+        }
+
+# Singleton instance
+timeline_service = TimelineService()
+counter_service.add_flush_listener(timeline_service.apply_counter_deltas)
@@ -0,0 +1,219 @@
+"""
+🦁 ATHLYNX AI - Trending Service
+Time-decayed engagement scores with bounded top-K per sport
+
+Every like, share and comment adds ``weight * 2^(-age / half_life)`` to a
+post's score. Scores are stored relative to a fixed epoch
+(``raw = score at epoch``) so an event only touches its own post - no
+periodic decay pass - and ranking by ``raw`` equals ranking by the
+decayed score at any moment. For each segment (global and each sport)
+only the TRENDING_TOP_K best posts are kept, so /api/feed/trending is a
+sort of at most K numbers plus a cached hydration and can be polled every
+few seconds.
+
+Each worker sees its own events immediately. Every
+TRENDING_REBUILD_INTERVAL seconds the state is rebuilt from the database
+(likes timestamped in post_likes, comments/shares at post time), which
+folds in other workers' activity, corrects unlike drift inside the top-K
+and resets the epoch.
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+@version 1.0
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import os
+import time
+import logging
+
+from repositories.feed_repository import feed_repository
+
+logger = logging.getLogger(__name__)
+
+# Trending configuration (per worker process)
+TRENDING_HALF_LIFE_HOURS = float(os.getenv("TRENDING_HALF_LIFE_HOURS", "6"))
+TRENDING_WINDOW_HOURS = float(os.getenv("TRENDING_WINDOW_HOURS", "24"))
+TRENDING_TOP_K = int(os.getenv("TRENDING_TOP_K", "200"))
+TRENDING_REBUILD_INTERVAL = float(os.getenv("TRENDING_REBUILD_INTERVAL", "60"))
+
+# Same weights the original engagement_score used
+ENGAGEMENT_WEIGHTS = {
+    "like": 1.0,
+    "comment": 2.0,
+    "share": 3.0
+}
+
+GLOBAL_SEGMENT = None
+
+class TrendingService:
+    """Incrementally maintained trending rankings for /api/feed/trending"""
+
+    def __init__(
+        self,
+        half_life_hours: float = TRENDING_HALF_LIFE_HOURS,
+        window_hours: float = TRENDING_WINDOW_HOURS,
+        top_k: int = TRENDING_TOP_K,
+        rebuild_interval: float = TRENDING_REBUILD_INTERVAL
+    ):
+        self.half_life = half_life_hours * 3600
+        self.window_hours = window_hours
+        self.top_k = top_k
+        self.rebuild_interval = rebuild_interval
+
+        self._epoch = time.time()
+        self._posts: Dict[int, dict] = {}            # post_id -> {raw, sport, created_at}
+        self._top: Dict[Optional[str], Dict[int, float]] = {GLOBAL_SEGMENT: {}}
+        self._built_at = 0.0
+        self._rebuild_task = None
+        self._replay: Optional[List[Tuple]] = None   # events seen while a rebuild is running
+        self._stats = {"events": 0, "rebuilds": 0, "rebuild_errors": 0}
+
+    def _factor(self, at: float) -> float:
+        return 2 ** ((at - self._epoch) / self.half_life)
+
+    def _offer(self, segment: Optional[str], post_id: int, raw: float):
+        """Keep post_id in the segment's top-K if its score earns a place"""
+        top = self._top.setdefault(segment, {})
+        if post_id in top or len(top) < self.top_k:
+            top[post_id] = raw
+            return
+        weakest = min(top, key=top.get)
+        if raw > top[weakest]:
+            del top[weakest]
+            top[post_id] = raw
+
+    def _apply(self, post_id: int, weight: float, at: float, sport: Optional[str] = None,
+               created_at: Optional[datetime] = None):
+        state = self._posts.get(post_id)
+        if state is None:
+            if created_at is None or created_at < datetime.now() - timedelta(hours=self.window_hours):
+                # Unknown post outside the window, or with no details: next rebuild places it
+                return
+            state = self._posts[post_id] = {
+                "raw": 0.0,
+                "sport": sport,
+                "created_at": created_at
+            }
+        state["raw"] = max(0.0, state["raw"] + weight * self._factor(at))
+
+        self._offer(GLOBAL_SEGMENT, post_id, state["raw"])
+        if state["sport"]:
+            self._offer(state["sport"], post_id, state["raw"])
+
+    def add_post(self, post: dict):
+        """Register a new post so it can trend in its sport from the first like"""
+        if self._replay is not None:
+            self._replay.append(("add", dict(post)))
+        self._apply(post['id'], 0.0, time.time(), post.get('author_sport'), post.get('created_at') or datetime.now())
+
+    def record(self, post_id: int, event: str, count: int = 1, post: Optional[dict] = None):
+        """Apply an engagement event ("like", "comment", "share"); count may be negative
+
+        ``post`` (with created_at and author_sport) lets a post this worker
+        has not seen start trending; without it such events wait for the
+        next rebuild.
+        """
+        weight = ENGAGEMENT_WEIGHTS[event] * count
+        at = time.time()
+        sport, created_at = (post.get('author_sport'), post.get('created_at')) if post else (None, None)
+        if self._replay is not None:
+            self._replay.append(("event", post_id, weight, at, sport, created_at))
+        self._apply(post_id, weight, at, sport, created_at)
+        self._stats["events"] += 1
+
+    def remove_post(self, post_id: int):
+        self._posts.pop(post_id, None)
+        for top in self._top.values():
+            top.pop(post_id, None)
+
+    async def rebuild(self):
+        """Recompute every score in the window from the database"""
+        self._replay = []
+        try:
+            started = time.time()
+            rows = await feed_repository.get_trending_scores(
+                self.window_hours,
+                self.half_life,
+                ENGAGEMENT_WEIGHTS["like"],
+                ENGAGEMENT_WEIGHTS["comment"],
+                ENGAGEMENT_WEIGHTS["share"]
+            )
+
+            self._epoch = started
+            self._posts = {}
+            self._top = {GLOBAL_SEGMENT: {}}
+            for row in rows:
+                self._posts[row['id']] = {
+                    "raw": float(row['score'] or 0),
+                    "sport": row['sport'],
+                    "created_at": row['created_at']
+                }
+            for post_id, state in self._posts.items():
+                self._offer(GLOBAL_SEGMENT, post_id, state["raw"])
+                if state["sport"]:
+                    self._offer(state["sport"], post_id, state["raw"])
+
+            # Events that landed while the query ran are not in its result
+            for item in self._replay:
+                if item[0] == "add":
+                    post = item[1]
+                    self._apply(post['id'], 0.0, started, post.get('author_sport'), post.get('created_at'))
+                else:
+                    _, post_id, weight, at, sport, created_at = item
+                    self._apply(post_id, weight, at, sport, created_at)
+
+            self._built_at = time.monotonic()
+            self._stats["rebuilds"] += 1
+        except Exception as e:
+            self._stats["rebuild_errors"] += 1
+            logger.error(f"Trending rebuild error: {e}")
+            raise
+        finally:
+            self._replay = None
+
+    async def _ensure_fresh(self):
+        if self._rebuild_task is not None and not self._rebuild_task.done():
+            if not self._built_at:
+                await asyncio.shield(self._rebuild_task)
+            return
+
+        if time.monotonic() - self._built_at < self.rebuild_interval and self._built_at:
+            return
+
+        self._rebuild_task = asyncio.get_running_loop().create_task(self.rebuild())
+        if not self._built_at:
+            # Nothing to serve yet: wait for the first build
+            await asyncio.shield(self._rebuild_task)
+        else:
+            self._rebuild_task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+    async def get_trending(self, limit: int = 20, sport: Optional[str] = None) -> List[Tuple[int, float]]:
+        """Top (post_id, decayed score) pairs for a sport, or globally"""
+        await self._ensure_fresh()
+
+        cutoff = datetime.now() - timedelta(hours=self.window_hours)
+        decay = 1 / self._factor(time.time())
+        ranked = sorted(self._top.get(sport or GLOBAL_SEGMENT, {}).items(), key=lambda item: item[1], reverse=True)
+
+        result = []
+        for post_id, raw in ranked:
+            state = self._posts.get(post_id)
+            if state and state["created_at"] and state["created_at"] < cutoff:
+                continue
+            result.append((post_id, raw * decay))
+            if len(result) >= limit:
+                break
+        return result
+
+    def stats(self) -> dict:
+        return {
+            "tracked_posts": len(self._posts),
+            "segments": len(self._top),
+            **self._stats
+        }
+
+# Singleton instance
+trending_service = TrendingService()
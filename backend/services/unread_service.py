@@ -0,0 +1,246 @@
+"""
+🦁 ATHLYNX AI - Unread Count Service
+Cached per-user unread message badges
+
+Clients poll the unread badge every few seconds, so the count is served
+from memory: write-through on send (+1), read (-1 per message, also when
+opening a conversation marks a batch read) and delete (-1). Cached users
+are reconciled against the ``conversations`` read model every
+UNREAD_RECONCILE_INTERVAL seconds in one batched query, which also folds
+in writes made by other workers; users not polled for UNREAD_IDLE_TTL
+seconds are dropped.
+
+With REDIS_URL set (and the optional ``redis`` package installed) counts
+are also kept in a shared tier so every worker sees a change at once;
+the in-process copy then only lives for UNREAD_SHARED_LOCAL_TTL seconds.
+Shared counts are only ever created with SET NX or corrected with a
+compare-and-set, so a reload or reconcile never overwrites an increment
+another worker made while the database was being read.
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+@version 1.0
+"""
+
+from collections import OrderedDict
+from typing import Dict, List, Optional
+import asyncio
+import os
+import time
+import logging
+
+from repositories.message_repository import message_repository
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+# Unread cache configuration
+UNREAD_RECONCILE_INTERVAL = float(os.getenv("UNREAD_RECONCILE_INTERVAL", "30"))
+UNREAD_IDLE_TTL = float(os.getenv("UNREAD_IDLE_TTL", "600"))
+UNREAD_CACHE_SIZE = int(os.getenv("UNREAD_CACHE_SIZE", "100000"))
+UNREAD_SHARED_LOCAL_TTL = float(os.getenv("UNREAD_SHARED_LOCAL_TTL", "2"))
+UNREAD_SHARED_TTL = int(os.getenv("UNREAD_SHARED_TTL", "3600"))
+REDIS_URL = os.getenv("REDIS_URL")
+
+RECONCILE_BATCH_SIZE = 1000
+
+# Only adjust a shared counter that exists; a missing key is loaded from the DB
+_INCR_IF_EXISTS = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('INCRBY', KEYS[1], ARGV[1])
+end
+return nil
+"""
+
+# Correct a shared counter only if it still holds the value read before the
+# database query ('' = missing); a send in between changes it and wins
+_SET_IF_UNCHANGED = """
+local current = redis.call('GET', KEYS[1])
+if (current or '') == ARGV[1] then
+    redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+    return 1
+end
+return 0
+"""
+
+class UnreadService:
+    """In-process (optionally shared) unread counters for /api/messages"""
+
+    def __init__(
+        self,
+        reconcile_interval: float = UNREAD_RECONCILE_INTERVAL,
+        idle_ttl: float = UNREAD_IDLE_TTL,
+        max_size: int = UNREAD_CACHE_SIZE,
+        redis_url: Optional[str] = REDIS_URL
+    ):
+        self.reconcile_interval = reconcile_interval
+        self.idle_ttl = idle_ttl
+        self.max_size = max_size
+
+        self._counts: Dict[int, int] = {}
+        self._last_read: "OrderedDict[int, float]" = OrderedDict()     # least recently read first
+        self._fetched_at: Dict[int, float] = {}
+        self._changed_at: Dict[int, float] = {}
+        self._task = None
+        self._stats = {"hits": 0, "misses": 0, "reconciles": 0, "corrections": 0}
+
+        self._redis = None
+        if redis_url and aioredis is None:
+            logger.warning("⚠️ REDIS_URL set but the redis package is not installed - unread cache is per worker")
+        elif redis_url:
+            self._redis = aioredis.from_url(redis_url, decode_responses=True)
+
+    @staticmethod
+    def _key(user_id: int) -> str:
+        return f"athlynx:unread:{user_id}"
+
+    def _ensure_started(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def _remember(self, user_id: int, count: int):
+        if user_id not in self._counts:
+            while len(self._counts) >= self.max_size and self._last_read:
+                self.forget(next(iter(self._last_read)))
+        self._counts[user_id] = max(0, count)
+        self._fetched_at[user_id] = time.monotonic()
+
+    def forget(self, user_id: int):
+        self._counts.pop(user_id, None)
+        self._last_read.pop(user_id, None)
+        self._fetched_at.pop(user_id, None)
+        self._changed_at.pop(user_id, None)
+
+    async def get(self, user_id: int) -> int:
+        """Unread badge count; no database query when cached"""
+        self._ensure_started()
+        now = time.monotonic()
+        self._last_read[user_id] = now
+        self._last_read.move_to_end(user_id)
+
+        local_fresh = user_id in self._counts and (
+            self._redis is None or now - self._fetched_at[user_id] < UNREAD_SHARED_LOCAL_TTL
+        )
+        if local_fresh:
+            self._stats["hits"] += 1
+            return self._counts[user_id]
+
+        self._stats["misses"] += 1
+        if self._redis is not None:
+            try:
+                shared = await self._redis.get(self._key(user_id))
+                if shared is not None:
+                    self._remember(user_id, int(shared))
+                    return self._counts[user_id]
+            except Exception as e:
+                logger.warning(f"⚠️ Shared unread cache unavailable: {e}")
+
+        count = await message_repository.get_unread_count(user_id)
+        self._remember(user_id, count)
+        await self._share(user_id, count)
+        return self._counts[user_id]
+
+    async def _share(self, user_id: int, count: int):
+        """Create the shared counter; NX keeps one another worker created meanwhile"""
+        if self._redis is None:
+            return
+        try:
+            await self._redis.set(self._key(user_id), count, ex=UNREAD_SHARED_TTL, nx=True)
+        except Exception as e:
+            logger.warning(f"⚠️ Shared unread cache unavailable: {e}")
+
+    async def _shared_counts(self, user_ids: List[int]) -> Optional[List[Optional[str]]]:
+        """Current shared values (None = missing), or None without a shared tier"""
+        if self._redis is None:
+            return None
+        try:
+            return await self._redis.mget([self._key(user_id) for user_id in user_ids])
+        except Exception as e:
+            logger.warning(f"⚠️ Shared unread cache unavailable: {e}")
+            return None
+
+    async def _correct_shared(self, corrections: List[tuple]):
+        """Compare-and-set (user_id, value read before the query, count) into the shared tier"""
+        if self._redis is None or not corrections:
+            return
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for user_id, expected, count in corrections:
+                    pipe.eval(_SET_IF_UNCHANGED, 1, self._key(user_id), expected or "", count, UNREAD_SHARED_TTL)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"⚠️ Shared unread cache unavailable: {e}")
+
+    async def adjust(self, user_id: int, delta: int):
+        """Write-through +/- after a committed change"""
+        if user_id in self._counts:
+            self._changed_at[user_id] = time.monotonic()
+            self._counts[user_id] = max(0, self._counts[user_id] + delta)
+        if self._redis is not None:
+            try:
+                await self._redis.eval(_INCR_IF_EXISTS, 1, self._key(user_id), delta)
+            except Exception as e:
+                logger.warning(f"⚠️ Shared unread cache unavailable: {e}")
+
+    async def reconcile(self):
+        """Re-read every cached user's count from the database in batches"""
+        now = time.monotonic()
+        while self._last_read:
+            user_id, seen = next(iter(self._last_read.items()))
+            if now - seen <= self.idle_ttl:
+                break
+            self.forget(user_id)
+
+        user_ids: List[int] = list(self._counts)
+        for start in range(0, len(user_ids), RECONCILE_BATCH_SIZE):
+            batch = user_ids[start:start + RECONCILE_BATCH_SIZE]
+            # Read the shared values first: a send after this point changes them
+            shared = await self._shared_counts(batch)
+            queried_at = time.monotonic()
+            counts = await message_repository.get_unread_counts(batch)
+            corrections = []
+            for index, user_id in enumerate(batch):
+                count = counts.get(user_id)
+                if shared is not None and count is not None and shared[index] != str(count):
+                    corrections.append((user_id, shared[index], count))
+                # Skip users changed while the query ran; its snapshot may predate the change
+                if count is None or user_id not in self._counts or self._changed_at.get(user_id, 0) >= queried_at:
+                    continue
+                if self._counts[user_id] != count:
+                    self._stats["corrections"] += 1
+                self._remember(user_id, count)
+            await self._correct_shared(corrections)
+        self._stats["reconciles"] += 1
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.reconcile_interval)
+            try:
+                await self.reconcile()
+            except Exception as e:
+                logger.error(f"Unread reconcile error: {e}")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._redis is not None:
+            await self._redis.close()
+
+    def stats(self) -> dict:
+        return {
+            "cached_users": len(self._counts),
+            "shared_tier": self._redis is not None,
+            **self._stats
+        }
+
+# Singleton instance
+unread_service = UnreadService()
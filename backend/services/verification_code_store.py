@@ -0,0 +1,194 @@
+"""
+🦁 ATHLYNX AI - Verification Code Store
+Active email / SMS codes in memory, written through to verification_codes
+
+Issued codes are inserted into ``verification_codes`` (so they survive a
+restart and work on any worker) and kept in process memory keyed by
+channel and recipient. Verifying a code this worker issued is a dict
+lookup plus the single UPDATE that consumes it. Codes issued elsewhere
+fall back to the indexed table lookup.
+
+Expiry is tracked on a timing wheel of VERIFICATION_WHEEL_SLOTS slots,
+each VERIFICATION_WHEEL_SLOT_SECONDS wide. Every tick sweeps only the
+slots that have come due instead of scanning all codes. Every
+VERIFICATION_PURGE_INTERVAL seconds, used and expired rows are deleted
+from the table in batches of VERIFICATION_PURGE_BATCH, so it stays the
+size of the live code set.
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+@version 1.0
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, Hashable, List, Optional, Tuple
+import asyncio
+import os
+import time
+import logging
+
+from repositories.verification_repository import verification_repository
+
+logger = logging.getLogger(__name__)
+
+# Verification code store configuration (per worker process)
+VERIFICATION_CODE_TTL_MINUTES = float(os.getenv("VERIFICATION_CODE_TTL_MINUTES", "10"))
+VERIFICATION_WHEEL_SLOTS = int(os.getenv("VERIFICATION_WHEEL_SLOTS", "128"))
+VERIFICATION_WHEEL_SLOT_SECONDS = float(os.getenv("VERIFICATION_WHEEL_SLOT_SECONDS", "5"))
+VERIFICATION_PURGE_INTERVAL = float(os.getenv("VERIFICATION_PURGE_INTERVAL", "300"))
+VERIFICATION_PURGE_BATCH = int(os.getenv("VERIFICATION_PURGE_BATCH", "5000"))
+
+class _ExpiryWheel:
+    """Timing wheel: keys hashed into ring slots by expiry, swept slot by slot"""
+
+    def __init__(self, slots: int, slot_seconds: float):
+        self.slot_seconds = slot_seconds
+        self._ring: List[set] = [set() for _ in range(slots)]
+        self._cursor = self._slot(time.time()) - 1     # last slot swept (fully elapsed)
+
+    def _slot(self, at: float) -> int:
+        return int(at // self.slot_seconds)
+
+    def add(self, key: Hashable, expires_at: float):
+        self._ring[self._slot(expires_at) % len(self._ring)].add(key)
+
+    def sweep(self, now: float) -> List[Hashable]:
+        """Keys in every slot that has fully elapsed since the last sweep
+
+        A key due more than one lap out shares its slot with nearer ones
+        and is returned early; callers re-add keys that are not expired.
+        """
+        last_done = self._slot(now) - 1
+        due = []
+        for slot in range(max(self._cursor + 1, last_done - len(self._ring) + 1), last_done + 1):
+            bucket = self._ring[slot % len(self._ring)]
+            due.extend(bucket)
+            bucket.clear()
+        self._cursor = max(self._cursor, last_done)
+        return due
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self._ring)
+
+class VerificationCodeStore:
+    """Write-through store of active verification codes"""
+
+    def __init__(
+        self,
+        ttl_minutes: float = VERIFICATION_CODE_TTL_MINUTES,
+        wheel_slots: int = VERIFICATION_WHEEL_SLOTS,
+        slot_seconds: float = VERIFICATION_WHEEL_SLOT_SECONDS,
+        purge_interval: float = VERIFICATION_PURGE_INTERVAL,
+        purge_batch: int = VERIFICATION_PURGE_BATCH
+    ):
+        self.ttl_minutes = ttl_minutes
+        self.purge_interval = purge_interval
+        self.purge_batch = purge_batch
+
+        # (channel, recipient) -> code -> (code id, expires_at epoch seconds)
+        self._codes: Dict[Tuple[str, str], Dict[str, Tuple[int, float]]] = {}
+        self._wheel = _ExpiryWheel(wheel_slots, slot_seconds)
+        self._task = None
+        self._stats = {"issued": 0, "hits": 0, "misses": 0, "verified": 0, "expired": 0, "purged": 0}
+
+    def _ensure_started(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def _remember(self, channel: str, recipient: str, code: str, code_id: int, expires_at: float):
+        self._codes.setdefault((channel, recipient), {})[code] = (code_id, expires_at)
+        self._wheel.add((channel, recipient, code), expires_at)
+
+    def _forget(self, channel: str, recipient: str, code: str):
+        codes = self._codes.get((channel, recipient))
+        if codes is not None:
+            codes.pop(code, None)
+            if not codes:
+                del self._codes[(channel, recipient)]
+
+    async def issue(self, channel: str, recipient: str, code: str, user_id: Optional[int] = None) -> datetime:
+        """Store a new code (database first); returns when it expires"""
+        self._ensure_started()
+        expires_at = datetime.now() + timedelta(minutes=self.ttl_minutes)
+        code_id = await verification_repository.insert_code(channel, recipient, code, user_id, expires_at)
+        self._remember(channel, recipient, code, code_id, expires_at.timestamp())
+        self._stats["issued"] += 1
+        return expires_at
+
+    async def verify(self, channel: str, recipient: str, code: str) -> bool:
+        """Consume a matching active code and mark the user verified"""
+        self._ensure_started()
+        cached = self._codes.get((channel, recipient), {}).get(code)
+        if cached is not None and cached[1] > time.time():
+            code_id = cached[0]
+            self._stats["hits"] += 1
+        else:
+            # Issued by another worker or before a restart
+            self._stats["misses"] += 1
+            code_id = await verification_repository.find_active_code(channel, recipient, code)
+            if code_id is None:
+                return False
+
+        verified = await verification_repository.consume_code(code_id, channel, recipient)
+        self._forget(channel, recipient, code)
+        if verified:
+            self._stats["verified"] += 1
+        return verified
+
+    def sweep(self):
+        """Drop codes whose expiry slot has passed"""
+        now = time.time()
+        for channel, recipient, code in self._wheel.sweep(now):
+            cached = self._codes.get((channel, recipient), {}).get(code)
+            if cached is None:
+                continue
+            if cached[1] <= now:
+                self._forget(channel, recipient, code)
+                self._stats["expired"] += 1
+            else:
+                self._wheel.add((channel, recipient, code), cached[1])
+
+    async def purge(self) -> int:
+        """Batch-delete used and expired rows from verification_codes"""
+        total = 0
+        while True:
+            deleted = await verification_repository.purge_codes(self.purge_batch)
+            total += deleted
+            if deleted < self.purge_batch:
+                break
+            await asyncio.sleep(0)
+        self._stats["purged"] += total
+        if total:
+            logger.info(f"✅ Purged {total} used/expired verification codes")
+        return total
+
+    async def _run(self):
+        purged_at = 0.0
+        while True:
+            await asyncio.sleep(self._wheel.slot_seconds)
+            self.sweep()
+            if time.monotonic() - purged_at >= self.purge_interval:
+                purged_at = time.monotonic()
+                try:
+                    await self.purge()
+                except Exception as e:
+                    logger.error(f"Verification code purge error: {e}")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> dict:
+        return {
+            "active": sum(len(codes) for codes in self._codes.values()),
+            "wheel": len(self._wheel),
+            **self._stats
+        }
+
+# Singleton instance
+verification_code_store = VerificationCodeStore()
@@ -0,0 +1,257 @@
+"""
+🦁 ATHLYNX AI - Waitlist Ranking Service
+Order-statistic index over waitlist entries
+
+Each entry has a sortable ``rank_score`` (its join position, lowered by
+WAITLIST_REFERRAL_BOOST per referral); ties break on id, so the key
+``(rank_score, id)`` is unique and an entry's place in line is
+``1 + (entries with a smaller key)``. Keys live in a treap whose nodes
+carry subtree sizes, so "what is my rank" and a referral boost cost
+O(log n), "top N" costs O(log n + N), and nobody else is ever renumbered.
+
+The database stays the source of truth. Every insert and boost bumps
+``rank_version``; each worker pulls rows past its watermark at most every
+WAITLIST_RANK_REFRESH_INTERVAL seconds and rebuilds from scratch every
+WAITLIST_RANK_REBUILD_INTERVAL seconds. Versions are drawn from a sequence
+before commit, so a slow transaction can land below a version we have
+already seen; each refresh re-reads the last WAITLIST_RANK_REFRESH_OVERLAP
+versions to pick those up, and ``_apply`` ignores rows it already holds.
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+@version 1.0
+"""
+
+from typing import Dict, Iterator, List, Optional, Tuple
+import asyncio
+import os
+import random
+import time
+import logging
+
+from repositories.waitlist_repository import waitlist_repository
+
+logger = logging.getLogger(__name__)
+
+# Ranking configuration (per worker process)
+WAITLIST_REFERRAL_BOOST = int(os.getenv("WAITLIST_REFERRAL_BOOST", "10"))
+WAITLIST_RANK_REFRESH_INTERVAL = float(os.getenv("WAITLIST_RANK_REFRESH_INTERVAL", "2"))
+WAITLIST_RANK_REBUILD_INTERVAL = float(os.getenv("WAITLIST_RANK_REBUILD_INTERVAL", "300"))
+WAITLIST_RANK_REFRESH_OVERLAP = int(os.getenv("WAITLIST_RANK_REFRESH_OVERLAP", "1000"))
+
+class _Node:
+    __slots__ = ("key", "priority", "left", "right", "size")
+
+    def __init__(self, key: Tuple[int, int], priority: float):
+        self.key = key
+        self.priority = priority
+        self.left = None
+        self.right = None
+        self.size = 1
+
+def _size(node: Optional[_Node]) -> int:
+    return node.size if node else 0
+
+def _update(node: _Node) -> _Node:
+    node.size = 1 + _size(node.left) + _size(node.right)
+    return node
+
+class _RankTree:
+    """Treap of unique (rank_score, id) keys with subtree sizes"""
+
+    def __init__(self):
+        self.root: Optional[_Node] = None
+
+    def __len__(self) -> int:
+        return _size(self.root)
+
+    @classmethod
+    def build(cls, keys: List[Tuple[int, int]]) -> "_RankTree":
+        """Balanced tree from sorted keys in O(n)"""
+        tree = cls()
+        if not keys:
+            return tree
+
+        # Hand out random priorities largest-first in breadth-first order so
+        # every parent outranks its children (a valid treap)
+        priorities = sorted((random.random() for _ in keys), reverse=True)
+        nodes = [None] * len(keys)
+        queue = [(0, len(keys), None, False)]
+        for index, (lo, hi, parent, is_right) in enumerate(queue):
+            mid = (lo + hi) // 2
+            node = nodes[mid] = _Node(keys[mid], priorities[index])
+            if parent is None:
+                tree.root = node
+            elif is_right:
+                parent.right = node
+            else:
+                parent.left = node
+            if lo < mid:
+                queue.append((lo, mid, node, False))
+            if mid + 1 < hi:
+                queue.append((mid + 1, hi, node, True))
+
+        for lo, hi, _, _ in reversed(queue):
+            _update(nodes[(lo + hi) // 2])
+        return tree
+
+    def _split(self, node: Optional[_Node], key: Tuple[int, int]):
+        """(keys < key, keys >= key)"""
+        if node is None:
+            return None, None
+        if node.key < key:
+            node.right, right = self._split(node.right, key)
+            return _update(node), right
+        left, node.left = self._split(node.left, key)
+        return left, _update(node)
+
+    def _merge(self, left: Optional[_Node], right: Optional[_Node]) -> Optional[_Node]:
+        if left is None or right is None:
+            return left or right
+        if left.priority > right.priority:
+            left.right = self._merge(left.right, right)
+            return _update(left)
+        right.left = self._merge(left, right.left)
+        return _update(right)
+
+    def insert(self, key: Tuple[int, int]):
+        left, right = self._split(self.root, key)
+        self.root = self._merge(self._merge(left, _Node(key, random.random())), right)
+
+    def remove(self, key: Tuple[int, int]):
+        self.root = self._remove(self.root, key)
+
+    def _remove(self, node: Optional[_Node], key: Tuple[int, int]) -> Optional[_Node]:
+        if node is None:
+            return None
+        if key == node.key:
+            return self._merge(node.left, node.right)
+        if key < node.key:
+            node.left = self._remove(node.left, key)
+        else:
+            node.right = self._remove(node.right, key)
+        return _update(node)
+
+    def count_less(self, key: Tuple[int, int]) -> int:
+        count, node = 0, self.root
+        while node is not None:
+            if node.key < key:
+                count += _size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return count
+
+    def first(self, n: int) -> Iterator[Tuple[int, int]]:
+        """The n smallest keys in order"""
+        stack, node = [], self.root
+        while n > 0 and (stack or node is not None):
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key
+            n -= 1
+            node = node.right
+
+class WaitlistRankService:
+    """Current waitlist ranks for /api/waitlist"""
+
+    def __init__(
+        self,
+        refresh_interval: float = WAITLIST_RANK_REFRESH_INTERVAL,
+        rebuild_interval: float = WAITLIST_RANK_REBUILD_INTERVAL,
+        refresh_overlap: int = WAITLIST_RANK_REFRESH_OVERLAP
+    ):
+        self.refresh_interval = refresh_interval
+        self.rebuild_interval = rebuild_interval
+        self.refresh_overlap = refresh_overlap
+
+        self._tree = _RankTree()
+        self._keys: Dict[int, Tuple[int, int]] = {}     # id -> (rank_score, id)
+        self._versions: Dict[int, int] = {}
+        self._watermark = 0
+        self._built_at = 0.0
+        self._refreshed_at = 0.0
+        self._lock = None
+        self._stats = {"rebuilds": 0, "refreshes": 0, "boosts": 0}
+
+    def _apply(self, waitlist_id: int, rank_score: int, rank_version: Optional[int]):
+        """Upsert an entry's key unless we already hold a newer version"""
+        version = rank_version or 0
+        if version < self._versions.get(waitlist_id, -1):
+            return
+        key = (rank_score, waitlist_id)
+        old = self._keys.get(waitlist_id)
+        if old != key:
+            if old is not None:
+                self._tree.remove(old)
+            self._tree.insert(key)
+            self._keys[waitlist_id] = key
+        self._versions[waitlist_id] = version
+        self._watermark = max(self._watermark, version)
+
+    async def rebuild(self):
+        """Reload every key from the database"""
+        rows = await waitlist_repository.get_rank_keys()
+        keys = [(r['rank_score'], r['id']) for r in rows]
+        self._tree = _RankTree.build(keys)
+        self._keys = {key[1]: key for key in keys}
+        self._versions = {r['id']: r['rank_version'] or 0 for r in rows}
+        self._watermark = max(self._versions.values(), default=0)
+        self._built_at = self._refreshed_at = time.monotonic()
+        self._stats["rebuilds"] += 1
+        logger.info(f"✅ Waitlist ranks loaded ({len(keys)} entries)")
+
+    async def _ensure_fresh(self):
+        now = time.monotonic()
+        if self._built_at and now - self._refreshed_at < self.refresh_interval:
+            return
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            now = time.monotonic()
+            if not self._built_at or now - self._built_at >= self.rebuild_interval:
+                await self.rebuild()
+            elif now - self._refreshed_at >= self.refresh_interval:
+                # Other workers' joins and boosts since our watermark, plus
+                # late commits that drew their version just below it
+                after = max(self._watermark - self.refresh_overlap, 0)
+                for row in await waitlist_repository.get_rank_keys(after):
+                    self._apply(row['id'], row['rank_score'], row['rank_version'])
+                self._refreshed_at = time.monotonic()
+                self._stats["refreshes"] += 1
+
+    def add(self, entry: dict):
+        """Index a row returned by WaitlistRepository (join, boost or lookup)"""
+        self._apply(entry['id'], entry['rank_score'], entry.get('rank_version'))
+
+    async def get_rank(self, entry: dict) -> int:
+        """1-based place in line for a waitlist row"""
+        await self._ensure_fresh()
+        self.add(entry)
+        return self._tree.count_less(self._keys[entry['id']]) + 1
+
+    async def get_top(self, limit: int = 100) -> List[int]:
+        """Waitlist ids of the first `limit` places, in order"""
+        await self._ensure_fresh()
+        return [key[1] for key in self._tree.first(limit)]
+
+    async def boost(self, waitlist_id: int, points: int = WAITLIST_REFERRAL_BOOST) -> Optional[dict]:
+        """Persist a referral boost and re-index the entry; returns the updated row"""
+        entry = await waitlist_repository.apply_boost(waitlist_id, points)
+        if entry:
+            self.add(entry)
+            self._stats["boosts"] += 1
+        return entry
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._tree),
+            "watermark": self._watermark,
+            **self._stats
+        }
+
+# Singleton instance
+waitlist_rank_service = WaitlistRankService()
@@ -0,0 +1,166 @@
+"""
+🦁 ATHLYNX AI - Waitlist Stats Service
+In-memory signup counters for /api/waitlist/count and /api/waitlist/stats
+
+The landing page polls the counter, so total, per-role, per-sport and
+per-day signup counts are kept in process memory and bumped by
+``record_join`` after every successful join; both endpoints are then a
+dict lookup with no database query. Counters are reconciled against the
+``waitlist`` table every WAITLIST_STATS_RECONCILE_INTERVAL seconds in one
+GROUPING SETS scan, which also folds in joins handled by other workers.
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+@version 1.0
+"""
+
+from collections import Counter
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Tuple
+import asyncio
+import os
+import logging
+
+from repositories.waitlist_repository import waitlist_repository
+
+logger = logging.getLogger(__name__)
+
+# Waitlist stats configuration (per worker process)
+WAITLIST_STATS_RECONCILE_INTERVAL = float(os.getenv("WAITLIST_STATS_RECONCILE_INTERVAL", "30"))
+WAITLIST_STATS_DAYS = int(os.getenv("WAITLIST_STATS_DAYS", "30"))
+
+# GROUPING(role, sport, day) values returned by get_stat_counts
+_TOTAL, _BY_ROLE, _BY_SPORT, _BY_DAY = 7, 3, 5, 6
+
+class WaitlistStatsService:
+    """Write-through signup counters for the waitlist endpoints"""
+
+    def __init__(
+        self,
+        reconcile_interval: float = WAITLIST_STATS_RECONCILE_INTERVAL,
+        days: int = WAITLIST_STATS_DAYS
+    ):
+        self.reconcile_interval = reconcile_interval
+        self.days = days
+
+        self.total = 0
+        self.by_role: Counter = Counter()
+        self.by_sport: Counter = Counter()
+        self.by_day: Counter = Counter()
+        self._loaded = False
+        self._load_lock = None
+        self._task = None
+        self._stats_view = None
+        self._replay: Optional[List[Tuple]] = None   # joins seen while a reconcile is running
+        self._stats = {"joins": 0, "reconciles": 0, "corrections": 0}
+
+    def _ensure_started(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _ensure_loaded(self):
+        self._ensure_started()
+        if self._loaded:
+            return
+        if self._load_lock is None:
+            self._load_lock = asyncio.Lock()
+        async with self._load_lock:
+            if not self._loaded:
+                await self.reconcile()
+
+    def _count(self, role: Optional[str], sport: Optional[str], day: date):
+        self.total += 1
+        if role:
+            self.by_role[role] += 1
+        if sport:
+            self.by_sport[sport] += 1
+        self.by_day[day] += 1
+        self._stats_view = None
+
+    def record_join(self, entry: dict, role: Optional[str], sport: Optional[str]):
+        """Count a committed signup (entry as returned by WaitlistRepository.join)"""
+        day = (entry.get('created_at') or datetime.now()).date()
+        if self._replay is not None:
+            self._replay.append((entry['id'], role, sport, day))
+        if self._loaded:
+            self._count(role, sport, day)
+        self._stats["joins"] += 1
+
+    async def reconcile(self):
+        """Reload every counter from the database"""
+        self._replay = []
+        try:
+            rows = await waitlist_repository.get_stat_counts()
+
+            total, max_id = 0, 0
+            by_role, by_sport, by_day = Counter(), Counter(), Counter()
+            oldest = date.today() - timedelta(days=self.days)
+            for row in rows:
+                if row['grouping'] == _TOTAL:
+                    total, max_id = row['count'], row['max_id'] or 0
+                elif row['grouping'] == _BY_ROLE and row['role']:
+                    by_role[row['role']] = row['count']
+                elif row['grouping'] == _BY_SPORT and row['sport']:
+                    by_sport[row['sport']] = row['count']
+                elif row['grouping'] == _BY_DAY and row['day'] and row['day'] >= oldest:
+                    by_day[row['day']] = row['count']
+
+            if self._loaded and total != self.total:
+                self._stats["corrections"] += 1
+            self.total, self.by_role, self.by_sport, self.by_day = total, by_role, by_sport, by_day
+            self._loaded = True
+            self._stats_view = None
+
+            # Joins recorded while the query ran; newer ids are not in its result
+            for waitlist_id, role, sport, day in self._replay:
+                if waitlist_id > max_id:
+                    self._count(role, sport, day)
+            self._stats["reconciles"] += 1
+        finally:
+            self._replay = None
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.reconcile_interval)
+            try:
+                await self.reconcile()
+            except Exception as e:
+                logger.error(f"Waitlist stats reconcile error: {e}")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def get_count(self) -> int:
+        await self._ensure_loaded()
+        return self.total
+
+    async def get_stats(self) -> dict:
+        """Totals in the shape /api/waitlist/stats returns (cached until the next change)"""
+        await self._ensure_loaded()
+        today = date.today()
+        if self._stats_view is None or self._stats_view[0] != today:
+            ranked = lambda counter: sorted(counter.items(), key=lambda item: (-item[1], item[0]))
+            self._stats_view = (today, {
+                "total": self.total,
+                "today_signups": self.by_day.get(today, 0),
+                "by_role": [{"role": role, "count": count} for role, count in ranked(self.by_role)],
+                "by_sport": [{"sport": sport, "count": count} for sport, count in ranked(self.by_sport)[:10]]
+            })
+        return self._stats_view[1]
+
+    def stats(self) -> dict:
+        return {
+            "loaded": self._loaded,
+            "total": self.total,
+            "days_tracked": len(self.by_day),
+            **self._stats
+        }
+
+# Singleton instance
+waitlist_stats_service = WaitlistStatsService()
@@ -0,0 +1,92 @@
+"""
+🦁 ATHLYNX AI - Analytics Rollup Tests
+AnalyticsRepository.roll_up watermark cutoffs
+
+Needs a scratch PostgreSQL database in TEST_DATABASE_URL; the analytics
+tables in it are truncated. Skipped when the variable is not set.
+
+@author ATHLYNX AI Corporation
+@date January 15, 2026
+@version 1.0
+"""
+
+from pathlib import Path
+import os
+import sys
+
+import pytest
+import pytest_asyncio
+
+if not os.getenv("TEST_DATABASE_URL"):
+    pytest.skip("TEST_DATABASE_URL is not set", allow_module_level=True)
+
+os.environ["DATABASE_URL"] = os.environ["TEST_DATABASE_URL"]
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from models.async_database import async_db_pool
+from models.migrations import run_migrations
+from repositories.analytics_repository import analytics_repository
+
+LAG = 30
+
+pytestmark = pytest.mark.asyncio
+
+@pytest.fixture(scope="module", autouse=True)
+def schema():
+    run_migrations()
+
+@pytest_asyncio.fixture
+async def db():
+    await async_db_pool.execute("""
+        TRUNCATE analytics_events, analytics_rollup_hourly, analytics_rollup_daily,
+                 analytics_active_users_hourly, analytics_rollup_watermarks
+    """)
+    yield async_db_pool
+    await async_db_pool.close()
+
+async def _insert(db, event_id: int, age_seconds: float):
+    await db.execute("""
+        INSERT INTO analytics_events (id, event_type, created_at)
+        VALUES ($1, 'view', NOW() - $2 * INTERVAL '1 second')
+    """, event_id, age_seconds)
+
+async def _rolled_up(db) -> int:
+    return await db.fetchval(
+        "SELECT COALESCE(SUM(count), 0) FROM analytics_rollup_hourly WHERE source = 'analytics_events'"
+    )
+
+async def test_old_rows_roll_up(db):
+    for event_id in (1, 2, 3):
+        await _insert(db, event_id, 3600)
+    assert await analytics_repository.roll_up("analytics_events", 100, LAG) == 3
+    assert await _rolled_up(db) == 3
+
+async def test_young_low_id_stops_the_batch(db):
+    # id 2 is old (a spool replay) but id 1 is still inside the lag
+    await _insert(db, 1, 0)
+    await _insert(db, 2, 3600)
+    assert await analytics_repository.roll_up("analytics_events", 100, LAG) is None
+
+    await db.execute("UPDATE analytics_events SET created_at = NOW() - INTERVAL '1 hour' WHERE id = 1")
+    assert await analytics_repository.roll_up("analytics_events", 100, LAG) == 2
+    assert await _rolled_up(db) == 2
+
+async def test_missing_low_id_stops_the_batch(db):
+    # id 2 is visible, id 1 may still be an uncommitted insert
+    await _insert(db, 2, 3600)
+    assert await analytics_repository.roll_up("analytics_events", 100, LAG) is None
+
+    await _insert(db, 1, 3600)
+    assert await analytics_repository.roll_up("analytics_events", 100, LAG) == 2
+    assert await _rolled_up(db) == 2
+
+async def test_settled_gap_is_skipped(db):
+    # id 2 never commits (rolled back); ids 1 and 3 are old
+    await _insert(db, 1, 3600)
+    await _insert(db, 3, 3600)
+    assert await analytics_repository.roll_up("analytics_events", 100, LAG) == 1
+
+    # Once id 3 has been seen for longer than the lag, the gap at 2 is settled
+    await db.execute("UPDATE analytics_rollup_watermarks SET seen_at = NOW() - INTERVAL '1 hour'")
+    assert await analytics_repository.roll_up("analytics_events", 100, LAG) == 3
+    assert await _rolled_up(db) == 2
@@ -48,56 +48,54 @@ struct PlatformMetrics
     avg_nil_value::Float64
 end
 
+# Tables estimated above this many rows report the catalog estimate (pg_class.reltuples)
+const PLATFORM_STATS_EXACT_LIMIT = parse(Int, get(ENV, "PLATFORM_STATS_EXACT_LIMIT", "1000000"))
+
+# Every platform metric in one statement (same totals as the API's /api/stats).
+# A scalar subquery in a CASE branch that is not taken never runs, so large
+# tables are not scanned. Active users come from the hourly rollup (whole hours).
+const PLATFORM_METRICS_SQL = """
+    SELECT
+        CASE WHEN e.users > \$1 THEN e.users ELSE (SELECT COUNT(*) FROM users) END AS total_users,
+        CASE WHEN e.waitlist > \$1 THEN e.waitlist ELSE (SELECT COUNT(*) FROM waitlist) END AS total_waitlist,
+        CASE WHEN e.athletes > \$1 THEN e.athletes ELSE (SELECT COUNT(*) FROM athletes) END AS total_athletes,
+        CASE WHEN e.nil_deals > \$1 THEN e.nil_deals ELSE (SELECT COUNT(*) FROM nil_deals) END AS total_nil_deals,
+        CASE WHEN e.messages > \$1 THEN e.messages ELSE (SELECT COUNT(*) FROM messages) END AS total_messages,
+        CASE WHEN e.feed_posts > \$1 THEN e.feed_posts ELSE (SELECT COUNT(*) FROM feed_posts) END AS total_posts,
+        (SELECT COUNT(DISTINCT user_id)
+         FROM analytics_active_users_hourly
+         WHERE bucket >= date_trunc('hour', NOW() - INTERVAL '24 hours')) AS active_users_24h,
+        (SELECT COALESCE(SUM(CAST(SUBSTRING(plan FROM '[0-9.]+') AS DECIMAL)), 0)
+         FROM subscriptions
+         WHERE status = 'active') AS revenue_total,
+        (SELECT COALESCE(AVG(nil_value), 0)
+         FROM athletes
+         WHERE nil_value IS NOT NULL) AS avg_nil_value
+    FROM (SELECT
+        (SELECT reltuples::bigint FROM pg_class WHERE oid = 'users'::regclass) AS users,
+        (SELECT reltuples::bigint FROM pg_class WHERE oid = 'waitlist'::regclass) AS waitlist,
+        (SELECT reltuples::bigint FROM pg_class WHERE oid = 'athletes'::regclass) AS athletes,
+        (SELECT reltuples::bigint FROM pg_class WHERE oid = 'nil_deals'::regclass) AS nil_deals,
+        (SELECT reltuples::bigint FROM pg_class WHERE oid = 'messages'::regclass) AS messages,
+        (SELECT reltuples::bigint FROM pg_class WHERE oid = 'feed_posts'::regclass) AS feed_posts
+    ) e
+"""
+
 # Get platform metrics
 function get_platform_metrics(conn)
     try
-        # Total users
-        result = execute(conn, "SELECT COUNT(*) as count FROM users")
-        total_users = fetch!(result)[1, :count]
-        
-        # Total waitlist
-        result = execute(conn, "SELECT COUNT(*) as count FROM waitlist")
-        total_waitlist = fetch!(result)[1, :count]
+        result = execute(conn, PLATFORM_METRICS_SQL, [PLATFORM_STATS_EXACT_LIMIT])
+        row = fetch!(result)[1, :]
         
-        # Total athletes
-        result = execute(conn, "SELECT COUNT(*) as count FROM athletes")
-        total_athletes = fetch!(result)[1, :count]
-        
-        # Total NIL deals
-        result = execute(conn, "SELECT COUNT(*) as count FROM nil_deals")
-        total_nil_deals = fetch!(result)[1, :count]
-        
-        # Total messages
-        result = execute(conn, "SELECT COUNT(*) as count FROM messages")
-        total_messages = fetch!(result)[1, :count]
-        
-        # Total posts
-        result = execute(conn, "SELECT COUNT(*) as count FROM feed_posts")
-        total_posts = fetch!(result)[1, :count]
-        
-        # Active users (24h)
-        result = execute(conn, """
-            SELECT COUNT(DISTINCT user_id) as count 
-            FROM analytics_events 
-            WHERE created_at > NOW() - INTERVAL '24 hours'
-        """)
-        active_users_24h = fetch!(result)[1, :count]
-        
-        # Revenue total (from subscriptions)
-        result = execute(conn, """
-            SELECT COALESCE(SUM(CAST(SUBSTRING(plan FROM '[0-9.]+') AS DECIMAL)), 0) as total
-            FROM subscriptions 
-            WHERE status = 'active'
-        """)
-        revenue_total = fetch!(result)[1, :total]
-        
-        # Average NIL value
-        result = execute(conn, """
-            SELECT COALESCE(AVG(nil_value), 0) as avg 
-            FROM athletes 
-            WHERE nil_value IS NOT NULL
-        """)
-        avg_nil_value = fetch!(result)[1, :avg]
+        total_users = row[:total_users]
+        total_waitlist = row[:total_waitlist]
+        total_athletes = row[:total_athletes]
+        total_nil_deals = row[:total_nil_deals]
+        total_messages = row[:total_messages]
+        total_posts = row[:total_posts]
+        active_users_24h = row[:active_users_24h]
+        revenue_total = row[:revenue_total]
+        avg_nil_value = row[:avg_nil_value]
         
         return PlatformMetrics(
             now(),
@@ -117,28 +115,29 @@ function get_platform_metrics(conn)
     end
 end
 
+# Daily counts for one rollup source over the last 7 days.
+# The rollups are maintained incrementally by the API
+# (backend/services/analytics_rollup_service.py), so reports never re-scan raw rows.
+const DAILY_ROLLUP_SQL = """
+    SELECT day as date, SUM(count) as count
+    FROM analytics_rollup_daily
+    WHERE source = \$1 AND day > CURRENT_DATE - 7
+    GROUP BY day
+    ORDER BY day
+"""
+
+function daily_counts(conn, source)
+    return fetch!(execute(conn, DAILY_ROLLUP_SQL, [source]))
+end
+
 # Calculate growth rates
 function calculate_growth(conn)
     try
         # User growth (last 7 days)
-        result = execute(conn, """
-            SELECT DATE(created_at) as date, COUNT(*) as count
-            FROM users
-            WHERE created_at > NOW() - INTERVAL '7 days'
-            GROUP BY DATE(created_at)
-            ORDER BY date
-        """)
-        user_growth = fetch!(result)
+        user_growth = daily_counts(conn, "users")
         
         # Waitlist growth
-        result = execute(conn, """
-            SELECT DATE(created_at) as date, COUNT(*) as count
-            FROM waitlist
-            WHERE created_at > NOW() - INTERVAL '7 days'
-            GROUP BY DATE(created_at)
-            ORDER BY date
-        """)
-        waitlist_growth = fetch!(result)
+        waitlist_growth = daily_counts(conn, "waitlist")
         
         return Dict(
             "user_growth" => user_growth,
@@ -154,30 +153,19 @@ end
 function calculate_engagement(conn)
     try
         # Posts per day (last 7 days)
-        result = execute(conn, """
-            SELECT DATE(created_at) as date, COUNT(*) as count
-            FROM feed_posts
-            WHERE created_at > NOW() - INTERVAL '7 days'
-            GROUP BY DATE(created_at)
-            ORDER BY date
-        """)
-        posts_per_day = fetch!(result)
+        posts_per_day = daily_counts(conn, "feed_posts")
         
         # Messages per day
-        result = execute(conn, """
-            SELECT DATE(created_at) as date, COUNT(*) as count
-            FROM messages
-            WHERE created_at > NOW() - INTERVAL '7 days'
-            GROUP BY DATE(created_at)
-            ORDER BY date
-        """)
-        messages_per_day = fetch!(result)
+        messages_per_day = daily_counts(conn, "messages")
         
-        # Average likes per post
+        # Average likes per post: likes given / posts created over the same 7 days
         result = execute(conn, """
-            SELECT COALESCE(AVG(likes_count), 0) as avg_likes
-            FROM feed_posts
-            WHERE created_at > NOW() - INTERVAL '7 days'
+            SELECT COALESCE(
+                SUM(count) FILTER (WHERE source = 'post_likes')::float
+                    / NULLIF(SUM(count) FILTER (WHERE source = 'feed_posts'), 0),
+                0) as avg_likes
+            FROM analytics_rollup_daily
+            WHERE source IN ('post_likes', 'feed_posts') AND day > CURRENT_DATE - 7
         """)
         avg_likes = fetch!(result)[1, :avg_likes]
         